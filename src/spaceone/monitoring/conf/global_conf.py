@@ -20,10 +20,12 @@ DATABASES = {
 # Cache Settings
 CACHES = {
     "default": {},
+    # Process-local cache in front of "default" (see spaceone.monitoring.lib.cache)
     "local": {
         "backend": "spaceone.core.cache.local_cache.LocalCache",
-        "max_size": 128,
-        "ttl": 300,
+        "engine": "LocalCache",
+        "max_size": 1024,
+        "ttl": 10,
     },
 }
 
@@ -76,9 +78,51 @@ TOKEN_INFO = {}
 
 # Job Settings
 JOB_TIMEOUT = 600
+# Number of alerts processed by one worker task (1 = one task per alert)
+ALERT_JOB_CHUNK_SIZE = 1
 
 # Event Settings
 DUPLICATE_EVENT_TIME = 600
+# When enabled, the REST webhook only validates the access key and pushes the raw
+# payloads to the queue (monitoring_q). Parsing is done by the worker.
+ASYNC_EVENT_INGESTION = False
+# When enabled, raw payloads are stored once per content hash (zlib compressed)
+# and events only keep the hash.
+EVENT_RAW_DATA_STORE = False
+
+# Alert Settings
+# Number of alert numbers reserved at once by each worker (1 = no reservation)
+ALERT_NUMBER_BLOCK_SIZE = 1
+
+# Notification Settings
+# Size of the notification queue sent in the background (0 = send synchronously)
+NOTIFICATION_QUEUE_SIZE = 0
+# Max notifications per second for each domain (0 = unlimited)
+NOTIFICATION_RATE_LIMIT = 0
+NOTIFICATION_BATCH_SIZE = 10
+# Seconds to keep sending queued notifications when the process exits
+# (the rest are dropped)
+NOTIFICATION_SHUTDOWN_TIMEOUT = 10
+
+# Event Rule Settings
+# Compiled event rules are kept in process and refreshed when rules change.
+# This timeout bounds how long they are trusted without a version stamp.
+EVENT_RULE_CACHE_TIMEOUT = 300
+# Maximum number of projects whose event rules are applied to one event,
+# including the first project (change_project actions beyond it are skipped)
+EVENT_RULE_MAX_DEPTH = 10
+
+# Plugin Settings
+# Plugin endpoints are reused for this many seconds (0 = always ask the plugin service)
+PLUGIN_ENDPOINT_CACHE_TTL = 60
+# Expired endpoints are still used for this many seconds while being refreshed
+PLUGIN_ENDPOINT_CACHE_MAX_STALE = 600
+# Max channels kept open to each plugin endpoint (0 = new connector per call)
+PLUGIN_CHANNEL_POOL_SIZE = 4
+# Calls per channel before another channel is opened
+PLUGIN_CHANNEL_MAX_CONCURRENT_STREAMS = 100
+# Keepalive ping interval of plugin channels in seconds
+PLUGIN_CHANNEL_KEEPALIVE_TIME = 300
 
 INSTALLED_DATA_SOURCE_PLUGINS = [
     # {
@@ -99,3 +143,15 @@ INSTALLED_DATA_SOURCE_PLUGINS = [
 
 MAX_CONCURRENT_WORKER = 10
 MAX_REQUEST_LIMIT = 200
+
+# Metric Settings
+# Max plugin calls running at once for one Metric.get_data request
+METRIC_DATA_MAX_WORKERS = 10
+# Max plugin calls for Metric.get_data running at once in the process
+METRIC_DATA_GLOBAL_MAX_WORKERS = 50
+# Chunks not finished within this many seconds are left out (0 = no deadline)
+METRIC_DATA_TIMEOUT = 30
+# Size of the time windows whose metric data is cached in seconds (0 = no cache)
+METRIC_DATA_CACHE_WINDOW = 3600
+# A window is cached once it closed this many seconds ago (late provider data)
+METRIC_DATA_CACHE_DELAY = 600
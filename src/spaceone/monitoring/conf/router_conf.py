@@ -11,4 +11,10 @@ ROUTER = [
             "prefix": "/monitoring/v1",
         },
     },
+    {
+        "router_path": "spaceone.monitoring.interface.rest.v1.metric:router",
+        "router_options": {
+            "prefix": "/monitoring/v1",
+        },
+    },
 ]
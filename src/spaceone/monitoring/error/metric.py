@@ -29,3 +29,7 @@ class ERROR_NOT_FOUND_REQUIRED_KEY(ERROR_INVALID_ARGUMENT):
     _message = (
         "Required key not found in plugin metadata. (data_source_id = {data_source_id})"
     )
+
+
+class ERROR_INCOMPLETE_METRIC_DATA(ERROR_UNKNOWN):
+    _message = "Metric data of some chunks failed or timed out. ({failed_count}/{total_count} chunks)"
@@ -5,11 +5,12 @@ from spaceone.core import utils
 from spaceone.core.pygrpc.message_type import *
 
 from spaceone.monitoring.model.event_model import Event
+from spaceone.monitoring.model.event_raw_data_model import EventRawData
 
 __all__ = ["EventInfo", "EventsInfo"]
 
 
-def EventInfo(event_vo: Event, minimal=False):
+def EventInfo(event_vo: Event, minimal=False, raw_data=None):
     info = {
         "event_id": event_vo.event_id,
         "event_key": event_vo.event_key,
@@ -28,7 +29,9 @@ def EventInfo(event_vo: Event, minimal=False):
                 "account": event_vo.account,
                 "image_url": event_vo.image_url,
                 "resources": event_vo.resources,
-                "raw_data": change_struct_type(event_vo.raw_data),
+                "raw_data": change_struct_type(
+                    event_vo.get_raw_data() if raw_data is None else raw_data
+                ),
                 "additional_info": change_struct_type(event_vo.additional_info),
                 "alert_id": event_vo.alert_id,
                 "webhook_id": event_vo.webhook_id,
@@ -43,8 +46,29 @@ def EventInfo(event_vo: Event, minimal=False):
     return event_pb2.EventInfo(**info)
 
 
-def EventsInfo(note_vos, total_count, **kwargs):
+def EventsInfo(event_vos, total_count, **kwargs):
+    if kwargs.get("minimal"):
+        return event_pb2.EventsInfo(
+            results=list(map(functools.partial(EventInfo, **kwargs), event_vos)),
+            total_count=total_count,
+        )
+
+    # Raw data of all events are loaded with one query
+    event_vos = list(event_vos)
+    raw_data_by_hash = EventRawData.get_data_by_hashes(
+        [event_vo.raw_data_hash for event_vo in event_vos if event_vo.raw_data_hash]
+    )
+
     return event_pb2.EventsInfo(
-        results=list(map(functools.partial(EventInfo, **kwargs), note_vos)),
+        results=[
+            EventInfo(
+                event_vo,
+                raw_data=raw_data_by_hash.get(
+                    event_vo.raw_data_hash, event_vo.raw_data
+                ),
+                **kwargs,
+            )
+            for event_vo in event_vos
+        ],
         total_count=total_count,
     )
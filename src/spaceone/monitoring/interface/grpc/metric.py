@@ -15,7 +15,26 @@ class Metric(BaseAPI, metric_pb2_grpc.MetricServicer):
     def get_data(self, request, context):
         params, metadata = self.parse_request(request, context)
 
+        # MetricDataRequest has no fields for these options, so clients send
+        # them as metadata.
+        if value_encoding := metadata.get("value_encoding"):
+            params["value_encoding"] = value_encoding
+
+        if aggregate := metadata.get("aggregate"):
+            params["aggregate"] = aggregate
+
+        if last_timestamp := metadata.get("last_timestamp"):
+            params["last_timestamp"] = last_timestamp
+
+        if max_points := metadata.get("max_points"):
+            params["max_points"] = int(max_points) if max_points.isdigit() else 0
+
         with self.locator.get_service("MetricService", metadata) as metric_service:
-            return self.locator.get_info(
-                "MetricDataInfo", metric_service.get_data(params)
-            )
+            metric_data_info = metric_service.get_data(params)
+
+            # MetricDataInfo has no field for it, so partial data is marked
+            # with trailing metadata.
+            if not metric_data_info.get("is_complete", True):
+                context.set_trailing_metadata((("is_complete", "false"),))
+
+            return self.locator.get_info("MetricDataInfo", metric_data_info)
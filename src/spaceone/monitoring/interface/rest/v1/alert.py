@@ -4,7 +4,8 @@ from fastapi_utils.inferring_router import InferringRouter
 from fastapi_utils.cbv import cbv
 from spaceone.core.fastapi.api import BaseAPI, exception_handler
 from spaceone.core.error import *
-from spaceone.core import config, cache
+from spaceone.core import config
+from spaceone.monitoring.lib import cache, cache_key
 from spaceone.monitoring.service import AlertService
 from spaceone.monitoring.manager import IdentityManager
 from fastapi.responses import RedirectResponse
@@ -100,7 +101,7 @@ class Alert(BaseAPI):
             {"alert_id": alert_id, "domain_id": domain_id, "responder": responder}
         )
 
-    @cache.cacheable(key="monitoring:domain-name:{domain_id}", expire=3600)
+    @cache.cacheable(cache_key.DOMAIN_NAME)
     def _get_domain_name(self, domain_id: str) -> str:
         try:
             identity_mgr: IdentityManager = self.locator.get_manager("IdentityManager")
@@ -114,7 +115,7 @@ class Alert(BaseAPI):
     @staticmethod
     def _check_access_key(alert_id: str, access_key: str):
         return cache.get(
-            f"monitoring:alert:notification-callback:{alert_id}:{access_key}"
+            cache_key.ALERT_CALLBACK.format(alert_id=alert_id, access_key=access_key)
         )
 
     def _make_redirect_response(
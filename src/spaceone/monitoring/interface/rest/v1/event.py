@@ -1,7 +1,9 @@
 import logging
 from fastapi import Request
+from fastapi.responses import JSONResponse
 from fastapi_utils.inferring_router import InferringRouter
 from fastapi_utils.cbv import cbv
+from spaceone.core import config
 from spaceone.core.fastapi.api import BaseAPI
 from spaceone.monitoring.service import EventService
 
@@ -17,7 +19,46 @@ class Event(BaseAPI):
         params, metadata = await self.parse_request(request)
 
         event_service: EventService = self.locator.get_service("EventService")
+
+        if config.get_global("ASYNC_EVENT_INGESTION", False):
+            event_service.enqueue(
+                {
+                    "webhook_id": webhook_id,
+                    "access_key": access_key,
+                    "data_list": [params or {}],
+                }
+            )
+            return JSONResponse(status_code=202, content={})
+
         event_service.create(
             {"webhook_id": webhook_id, "access_key": access_key, "data": params or {}}
         )
         return {}
+
+    @router.post("/webhook/{webhook_id}/{access_key}/events/batch")
+    async def create_events(self, access_key: str, webhook_id: str, request: Request):
+        params, metadata = await self.parse_request(request)
+
+        if isinstance(params, dict):
+            params = [params]
+
+        event_service: EventService = self.locator.get_service("EventService")
+
+        if config.get_global("ASYNC_EVENT_INGESTION", False):
+            event_service.enqueue(
+                {
+                    "webhook_id": webhook_id,
+                    "access_key": access_key,
+                    "data_list": params or [],
+                }
+            )
+            return JSONResponse(status_code=202, content={})
+
+        event_service.create_batch(
+            {
+                "webhook_id": webhook_id,
+                "access_key": access_key,
+                "data_list": params or [],
+            }
+        )
+        return {}
@@ -0,0 +1,63 @@
+import json
+import logging
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from fastapi_utils.inferring_router import InferringRouter
+from fastapi_utils.cbv import cbv
+from spaceone.core.error import ERROR_BASE, ERROR_UNKNOWN
+from spaceone.core.fastapi.api import BaseAPI, exception_handler
+from spaceone.monitoring.service import MetricService
+
+_LOGGER = logging.getLogger(__name__)
+
+router = InferringRouter()
+
+
+@cbv(router)
+class Metric(BaseAPI):
+    service = "monitoring"
+
+    @router.post("/metric/get-data/stream")
+    @exception_handler
+    async def get_data_stream(self, request: Request):
+        """Streams Metric.get_data as newline delimited JSON, one line per chunk."""
+        params, metadata = await self.parse_request(
+            request,
+            token=self._get_token(request),
+            resource="Metric",
+            verb="get_data_stream",
+        )
+
+        metric_service: MetricService = self.locator.get_service(
+            "MetricService", metadata
+        )
+        metric_data_stream = metric_service.get_data_stream(params)
+
+        return StreamingResponse(
+            self._generate_ndjson(metric_data_stream),
+            media_type="application/x-ndjson",
+        )
+
+    @staticmethod
+    def _generate_ndjson(metric_data_stream):
+        try:
+            for metric_data in metric_data_stream:
+                yield json.dumps(metric_data, default=str) + "\n"
+        except Exception as e:
+            # Headers are already sent, so the error is sent as the last line
+            if not isinstance(e, ERROR_BASE):
+                e = ERROR_UNKNOWN(message=str(e))
+
+            _LOGGER.error(f"[get_data_stream] {e.message}", exc_info=True)
+            yield json.dumps(
+                {"error": {"code": e.error_code, "message": e.message}}
+            ) + "\n"
+
+    @staticmethod
+    def _get_token(request: Request) -> str:
+        authorization = request.headers.get("Authorization", "")
+
+        if authorization.lower().startswith("bearer "):
+            return authorization[7:].strip()
+
+        return request.headers.get("token")
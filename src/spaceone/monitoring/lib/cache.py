@@ -0,0 +1,400 @@
+import copy
+import functools
+import inspect
+import json
+import logging
+import math
+import threading
+import time
+import weakref
+from typing import Any, Iterable, Union
+
+from cachetools import TLRUCache, TTLCache
+from spaceone.core import cache as core_cache
+from spaceone.core import config
+from spaceone.core.cache.redis_cache import RedisCache
+from spaceone.core.transaction import get_transaction
+
+from spaceone.monitoring.lib.cache_key import LOCAL_KEY_PREFIXES, CacheKey
+
+_LOGGER = logging.getLogger(__name__)
+
+# Per-transaction L1 cache. Entries are dropped with the transaction.
+_TRANSACTION_CACHES = weakref.WeakKeyDictionary()
+_LOCK = threading.Lock()
+
+_TAG_KEY = "monitoring:cache-tag:{tag}"
+_LOCAL_TAGS_MAX_SIZE = 10000
+
+_GENERATION_KEY = "monitoring:local-cache-generation"
+_GENERATION_CHECK_INTERVAL = 1
+
+_PROCESS_CACHE = None
+
+
+class _LocalTags(TLRUCache):
+    """Tags of non-Redis caches, kept in the process. {tag: {key: expires_at}}
+
+    A tag expires with the last of its keys. When there are too many tags,
+    the least recently used tag is evicted and its keys are collected, so
+    that they can be deleted instead of missing a later invalidation.
+    """
+
+    def __init__(self, max_size: int):
+        super().__init__(max_size, ttu=lambda tag, keys, now: max(keys.values()))
+        self.evicted_keys = []
+
+    def popitem(self):
+        tag, keys = super().popitem()
+        self.evicted_keys.extend(keys)
+        return tag, keys
+
+    def add(self, tag: str, key: str, expires_at: float) -> None:
+        now = self.timer()
+        keys = {
+            tagged_key: tagged_expires_at
+            for tagged_key, tagged_expires_at in self.get(tag, {}).items()
+            if tagged_expires_at > now
+        }
+        keys[key] = expires_at
+        self[tag] = keys
+
+    def pop_evicted_keys(self) -> list:
+        evicted_keys, self.evicted_keys = self.evicted_keys, []
+        return evicted_keys
+
+
+_LOCAL_TAGS = _LocalTags(_LOCAL_TAGS_MAX_SIZE)
+
+
+class _TransactionCache:
+    """L1 cache of one transaction. Deletes of any thread are applied to it."""
+
+    def __init__(self):
+        self.values = {}
+        # {tag: {key: True}}
+        self.tags = {}
+
+    def set_many(self, values: dict, tags: dict) -> None:
+        for key, value in values.items():
+            if value is None:
+                continue
+
+            self.values[key] = value
+
+            for tag in tags.get(key, []):
+                self.tags.setdefault(tag, {})[key] = True
+
+    def delete(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+    def pop_tagged_keys(self, tags: Iterable[str]) -> list:
+        return [key for tag in tags for key in self.tags.pop(tag, {})]
+
+
+class ProcessCache:
+    """Bounded process-local LRU cache with a short TTL.
+
+    Deleting a key in any process increments a shared generation number.
+    Other processes read it at most once per second and flush their local
+    entries when it changes.
+
+    Values are shared by all threads, so they are copied in and out.
+    """
+
+    def __init__(self, max_size: int, ttl: int):
+        self._cache = TTLCache(maxsize=max_size, ttl=ttl)
+        self._lock = threading.Lock()
+        self._generation = None
+        self._checked_at = 0
+
+    def get_many(self, keys: list) -> dict:
+        self._check_generation()
+
+        with self._lock:
+            values = {key: self._cache[key] for key in keys if key in self._cache}
+
+        return copy.deepcopy(values)
+
+    def set_many(self, values: dict) -> None:
+        self._check_generation()
+        values = copy.deepcopy(values)
+
+        with self._lock:
+            for key, value in values.items():
+                if value is not None:
+                    self._cache[key] = value
+
+    def delete(self, keys: list) -> None:
+        with self._lock:
+            for key in keys:
+                self._cache.pop(key, None)
+
+        try:
+            core_cache.increment(_GENERATION_KEY)
+        except Exception as e:
+            _LOGGER.warning(
+                f"[ProcessCache.delete] Failed to increment cache generation: {e}"
+            )
+
+    def _check_generation(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < _GENERATION_CHECK_INTERVAL:
+            return
+
+        self._checked_at = now
+        generation = core_cache.get(_GENERATION_KEY)
+
+        if generation != self._generation:
+            with self._lock:
+                self._cache.clear()
+                self._generation = generation
+
+
+def get(key: str) -> Any:
+    return get_many([key]).get(key)
+
+
+def get_many(keys: Iterable[str]) -> dict:
+    values = {}
+    missing_keys = []
+    transaction_cache = _get_transaction_cache()
+
+    for key in keys:
+        if transaction_cache is not None and key in transaction_cache.values:
+            values[key] = transaction_cache.values[key]
+        else:
+            missing_keys.append(key)
+
+    if len(missing_keys) > 0 and core_cache.is_set():
+        process_cache = _get_process_cache()
+        local_keys = [key for key in missing_keys if _is_local_key(key)]
+
+        if process_cache and len(local_keys) > 0:
+            local_values = process_cache.get_many(local_keys)
+            values.update(local_values)
+            missing_keys = [key for key in missing_keys if key not in local_values]
+
+            if transaction_cache is not None:
+                transaction_cache.set_many(local_values, {})
+
+        if len(missing_keys) > 0:
+            cache_values = _get_many(missing_keys)
+            values.update(cache_values)
+
+            if process_cache:
+                process_cache.set_many(_filter_local_values(cache_values))
+
+            if transaction_cache is not None:
+                transaction_cache.set_many(cache_values, {})
+
+    return values
+
+
+def set(key: str, value: Any, expire: int = None, tags: list = None) -> None:
+    set_many({key: value}, expire=expire, tags={key: tags} if tags else None)
+
+
+def set_many(values: dict, expire: int = None, tags: dict = None) -> None:
+    """Stores values with one round trip.
+
+    Args:
+        values (dict): {key: value}
+        expire (int): expiration time in seconds
+        tags (dict): {key: [tag, ...]}
+    """
+    transaction_cache = _get_transaction_cache()
+
+    if transaction_cache is not None:
+        transaction_cache.set_many(values, tags or {})
+
+    if core_cache.is_set():
+        _set_many(values, expire, tags or {})
+
+        if process_cache := _get_process_cache():
+            process_cache.set_many(_filter_local_values(values))
+
+
+def delete(*keys: str) -> None:
+    # Other requests must not keep serving deleted values
+    with _LOCK:
+        for transaction_cache in list(_TRANSACTION_CACHES.values()):
+            transaction_cache.delete(keys)
+
+    if core_cache.is_set():
+        core_cache.delete(*keys)
+
+        local_keys = [key for key in keys if _is_local_key(key)]
+        process_cache = _get_process_cache()
+
+        if process_cache and len(local_keys) > 0:
+            process_cache.delete(local_keys)
+
+
+def delete_tags(*tags: str) -> None:
+    """Deletes all keys stored with any of the tags."""
+    with _LOCK:
+        keys = [
+            key
+            for transaction_cache in list(_TRANSACTION_CACHES.values())
+            for key in transaction_cache.pop_tagged_keys(tags)
+        ]
+
+    if core_cache.is_set():
+        keys.extend(_pop_tagged_keys(list(tags)))
+
+    if len(keys) > 0:
+        delete(*dict.fromkeys(keys))
+
+
+def prefetch(keys: Iterable[str]) -> None:
+    """Loads keys into the transaction cache with a single round trip."""
+    get_many(keys)
+
+
+def cacheable(key: Union[str, CacheKey], expire: int = None):
+    if not isinstance(key, CacheKey):
+        key = CacheKey(key, expire=expire)
+
+    def wrapper(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapped_func(*args, **kwargs):
+            arguments = signature.bind(*args, **kwargs)
+            arguments.apply_defaults()
+            cache_key = key.format(**arguments.arguments)
+
+            value = get(cache_key)
+            if value is not None:
+                return value
+
+            value = func(*args, **kwargs)
+            set(
+                cache_key,
+                value,
+                expire=key.expire,
+                tags=key.format_tags(**arguments.arguments),
+            )
+            return value
+
+        return wrapped_func
+
+    return wrapper
+
+
+def _is_local_key(key: str) -> bool:
+    return key.startswith(LOCAL_KEY_PREFIXES)
+
+
+def _filter_local_values(values: dict) -> dict:
+    return {key: value for key, value in values.items() if _is_local_key(key)}
+
+
+def _get_process_cache() -> Union[ProcessCache, None]:
+    global _PROCESS_CACHE
+
+    if _PROCESS_CACHE is None:
+        local_conf = config.get_global("CACHES", {}).get("local", {})
+
+        if local_conf.get("max_size", 0) <= 0:
+            return None
+
+        with _LOCK:
+            if _PROCESS_CACHE is None:
+                _PROCESS_CACHE = ProcessCache(
+                    local_conf["max_size"], local_conf.get("ttl", 10)
+                )
+
+    return _PROCESS_CACHE
+
+
+def _get_transaction_cache() -> Union[_TransactionCache, None]:
+    transaction = get_transaction(is_create=False)
+
+    # Transactions created on demand outside of a service call (verb is None)
+    # live as long as their thread, so they have no L1 cache.
+    if transaction is None or transaction.verb is None:
+        return None
+
+    with _LOCK:
+        if transaction not in _TRANSACTION_CACHES:
+            _TRANSACTION_CACHES[transaction] = _TransactionCache()
+
+        return _TRANSACTION_CACHES[transaction]
+
+
+@core_cache.connect
+def _get_many(cache_cls, keys: list) -> dict:
+    if isinstance(cache_cls, RedisCache):
+        cache_values = cache_cls.conn.mget(keys)
+        return {
+            key: json.loads(cache_value)
+            for key, cache_value in zip(keys, cache_values)
+            if cache_value
+        }
+    else:
+        values = {}
+        for key in keys:
+            value = cache_cls.get(key)
+            if value is not None:
+                values[key] = value
+
+        return values
+
+
+@core_cache.connect
+def _set_many(cache_cls, values: dict, expire: int = None, tags: dict = None):
+    if isinstance(cache_cls, RedisCache):
+        pipeline = cache_cls.conn.pipeline(transaction=False)
+        for key, value in values.items():
+            # RedisCache stores None as an empty dict
+            pipeline.set(key, json.dumps({} if value is None else value), ex=expire)
+
+            for tag in tags.get(key, []):
+                tag_key = _TAG_KEY.format(tag=tag)
+                pipeline.sadd(tag_key, key)
+
+                if expire:
+                    pipeline.expire(tag_key, expire)
+
+        pipeline.execute()
+    else:
+        expires_at = time.monotonic() + expire if expire else math.inf
+
+        for key, value in values.items():
+            cache_cls.set(key, value, expire=expire)
+
+        with _LOCK:
+            for key in values:
+                for tag in tags.get(key, []):
+                    _LOCAL_TAGS.add(tag, key, expires_at)
+
+            evicted_keys = _LOCAL_TAGS.pop_evicted_keys()
+
+        for key in evicted_keys:
+            try:
+                cache_cls.delete(key)
+            except KeyError:
+                pass
+
+
+@core_cache.connect
+def _pop_tagged_keys(cache_cls, tags: list) -> list:
+    if isinstance(cache_cls, RedisCache):
+        tag_keys = [_TAG_KEY.format(tag=tag) for tag in tags]
+
+        pipeline = cache_cls.conn.pipeline(transaction=False)
+        for tag_key in tag_keys:
+            pipeline.smembers(tag_key)
+
+        pipeline.delete(*tag_keys)
+        members = pipeline.execute()[:-1]
+
+        keys = [key.decode() for tag_members in members for key in tag_members]
+    else:
+        with _LOCK:
+            keys = [key for tag in tags for key in _LOCAL_TAGS.pop(tag, {})]
+
+    return list(dict.fromkeys(keys))
@@ -0,0 +1,135 @@
+from typing import List
+
+# Cache entries that are invalidated on write are tagged. Deleting a tag
+# (cache.delete_tags) removes every key stored with it, so these keys can use
+# long expiration times.
+_DATA_EXPIRE = 86400
+_NAME_EXPIRE = 600
+
+
+class CacheKey:
+    def __init__(
+        self,
+        key: str,
+        expire: int = None,
+        tags: List[str] = None,
+        local: bool = False,
+    ):
+        self.key = key
+        self.expire = expire
+        self.tags = tags or []
+        self.local = local
+
+    @property
+    def prefix(self) -> str:
+        return self.key.split("{", 1)[0]
+
+    def format(self, /, **kwargs) -> str:
+        return self.key.format(**kwargs)
+
+    def format_tags(self, /, **kwargs) -> List[str]:
+        return [tag.format(**kwargs) for tag in self.tags]
+
+
+# Tags
+WEBHOOK_TAG = "webhook:{webhook_id}"
+PROJECT_TAG = "project:{domain_id}:{project_id}"
+ESCALATION_POLICY_TAG = "escalation-policy:{domain_id}:{escalation_policy_id}"
+# Escalation policy info is keyed by project, so it is dropped for the whole domain
+ESCALATION_POLICY_INFO_TAG = "escalation-policy-info:{domain_id}"
+ALERT_TAG = "alert:{domain_id}:{alert_id}"
+
+# Webhook
+WEBHOOK_DATA = CacheKey(
+    "monitoring:webhook-data:{webhook_id}",
+    expire=_DATA_EXPIRE,
+    tags=[WEBHOOK_TAG],
+    local=True,
+)
+
+# Project Alert Config
+PROJECT_ALERT_OPTIONS = CacheKey(
+    "monitoring:alert:project-options:{domain_id}:{project_id}",
+    expire=_DATA_EXPIRE,
+    tags=[PROJECT_TAG],
+    local=True,
+)
+AUTO_RECOVERY = CacheKey(
+    "monitoring:auto-recovery:{domain_id}:{project_id}",
+    expire=_DATA_EXPIRE,
+    tags=[PROJECT_TAG],
+    local=True,
+)
+
+# Escalation Policy
+ESCALATION_POLICY_INFO = CacheKey(
+    "monitoring:escalation-policy-info:"
+    "{domain_id}:{workspace_id}:{project_id}:{escalation_policy_id}",
+    expire=_DATA_EXPIRE,
+    tags=[PROJECT_TAG, ESCALATION_POLICY_INFO_TAG],
+    local=True,
+)
+ESCALATION_POLICY_CONDITION = CacheKey(
+    "monitoring:escalation-policy-condition:{domain_id}:{escalation_policy_id}",
+    expire=_DATA_EXPIRE,
+    tags=[ESCALATION_POLICY_TAG],
+    local=True,
+)
+ESCALATION_POLICY_NAME = CacheKey(
+    "monitoring:escalation-policy-name:{domain_id}:{escalation_policy_id}",
+    expire=_DATA_EXPIRE,
+    tags=[ESCALATION_POLICY_TAG],
+)
+
+# Event
+EVENT_RULE_VERSION = CacheKey(
+    "monitoring:event-rule-version:{domain_id}:{workspace_id}:{project_id}"
+)
+# Latest event of an event key and the state of its alert
+EVENT_KEY_INDEX = CacheKey(
+    "monitoring:event-key:{domain_id}:{workspace_id}:{project_id}:{event_key}",
+    tags=[ALERT_TAG],
+)
+
+# Alert
+ALERT_MESSAGE = CacheKey(
+    "monitoring:alert-message:{domain_id}:{alert_id}", expire=300
+)
+ALERT_CALLBACK = CacheKey(
+    "monitoring:alert:notification-callback:{alert_id}:{access_key}", expire=3600
+)
+
+# Metric data of a closed time window. query_hash covers the resources
+# resolved with the token of the caller and the projects of the caller.
+METRIC_DATA = CacheKey(
+    "monitoring:metric-data:{domain_id}:{workspace_id}:{data_source_id}:"
+    "{query_hash}:{window_start}",
+    expire=_DATA_EXPIRE,
+)
+# Set when the metric data of a data source can not be split by time
+# (e.g. labels are not timestamps), so it is fetched without windows.
+METRIC_DATA_UNWINDOWED = CacheKey(
+    "monitoring:metric-data-unwindowed:{domain_id}:{data_source_id}",
+    expire=_DATA_EXPIRE,
+)
+
+# Names from other services (no invalidation)
+DOMAIN_NAME = CacheKey("monitoring:domain-name:{domain_id}", expire=3600)
+DOMAIN_SETTINGS = CacheKey(
+    "monitoring:domain-settings:{domain_id}", expire=_NAME_EXPIRE
+)
+PROJECT_NAME = CacheKey(
+    "monitoring:project-name:{domain_id}:{project_id}", expire=_NAME_EXPIRE
+)
+USER_NAME = CacheKey(
+    "monitoring:user-name:{domain_id}:{user_id}", expire=_NAME_EXPIRE
+)
+TRIGGERED_BY_NAME = CacheKey(
+    "monitoring:triggered-by-name:{domain_id}:{triggered_by}", expire=_NAME_EXPIRE
+)
+
+LOCAL_KEY_PREFIXES = tuple(
+    value.prefix
+    for value in list(globals().values())
+    if isinstance(value, CacheKey) and value.local
+)
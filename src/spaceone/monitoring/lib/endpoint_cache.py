@@ -0,0 +1,91 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Hashable
+
+_LOGGER = logging.getLogger(__name__)
+
+_ENDPOINT_CACHE = None
+_LOCK = threading.Lock()
+
+
+class EndpointCache:
+    """Process-local stale-while-revalidate cache.
+
+    Entries younger than ttl are returned as is. Older entries are still
+    returned for up to max_stale seconds while a background thread refreshes
+    them. Callers only block when there is no usable entry.
+    """
+
+    def __init__(self, ttl: float, max_stale: float):
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self._entries = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is None:
+            return self._fetch(key, fetch)
+
+        value, fetched_at = entry
+        age = time.monotonic() - fetched_at
+
+        if age > self.ttl + self.max_stale:
+            return self._fetch(key, fetch)
+
+        if age > self.ttl:
+            self._refresh(key, fetch)
+
+        return value
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def _fetch(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        value = fetch()
+
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+
+        return value
+
+    def _refresh(self, key: Hashable, fetch: Callable[[], Any]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+
+            self._refreshing.add(key)
+
+        thread = threading.Thread(
+            target=self._run_refresh,
+            args=(key, fetch),
+            name="EndpointCacheRefresh",
+            daemon=True,
+        )
+        thread.start()
+
+    def _run_refresh(self, key: Hashable, fetch: Callable[[], Any]) -> None:
+        try:
+            self._fetch(key, fetch)
+        except Exception as e:
+            # The stale entry is kept until max_stale expires.
+            _LOGGER.warning(f"[EndpointCache] Failed to refresh {key}: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+
+def get_endpoint_cache(ttl: float, max_stale: float) -> EndpointCache:
+    global _ENDPOINT_CACHE
+
+    if _ENDPOINT_CACHE is None:
+        with _LOCK:
+            if _ENDPOINT_CACHE is None:
+                _ENDPOINT_CACHE = EndpointCache(ttl, max_stale)
+
+    return _ENDPOINT_CACHE
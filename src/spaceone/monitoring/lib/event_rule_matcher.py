@@ -0,0 +1,132 @@
+import logging
+import threading
+import time
+from typing import List, Union
+
+from spaceone.core import utils
+
+_LOGGER = logging.getLogger(__name__)
+
+_COMPILED_RULE_SETS = {}
+_LOCK = threading.Lock()
+
+
+class EventValues:
+    """Lazily resolved event values. Each condition key is looked up only once."""
+
+    def __init__(self, event_data: dict):
+        self._event_data = event_data
+        self._values = {}
+        self._lower_values = {}
+
+    def get(self, key: str):
+        if key not in self._values:
+            self._values[key] = utils.get_dict_value(self._event_data, key)
+
+        return self._values[key]
+
+    def get_lower(self, key: str) -> Union[str, None]:
+        if key not in self._lower_values:
+            value = self.get(key)
+            if value is None:
+                self._lower_values[key] = None
+            elif isinstance(value, str):
+                self._lower_values[key] = value.lower()
+            else:
+                self._lower_values[key] = str(value).lower()
+
+        return self._lower_values[key]
+
+
+class CompiledEventRule:
+    def __init__(self, event_rule_vo):
+        self.event_rule_id = event_rule_vo.event_rule_id
+        self.conditions_policy = event_rule_vo.conditions_policy
+        self.actions = dict(event_rule_vo.actions or {})
+        self.stop_processing = bool(
+            event_rule_vo.options and event_rule_vo.options.stop_processing
+        )
+        self.conditions = [
+            (
+                condition.key,
+                condition.operator,
+                condition.value,
+                (condition.value or "").lower(),
+            )
+            for condition in event_rule_vo.conditions
+        ]
+
+    def match(self, event_values: EventValues) -> bool:
+        if self.conditions_policy == "ALWAYS":
+            return True
+
+        if self.conditions_policy == "ALL":
+            return all(
+                self._check_condition(event_values, *condition)
+                for condition in self.conditions
+            )
+        else:
+            return any(
+                self._check_condition(event_values, *condition)
+                for condition in self.conditions
+            )
+
+    @staticmethod
+    def _check_condition(
+        event_values: EventValues,
+        key: str,
+        operator: str,
+        value: str,
+        lower_value: str,
+    ) -> bool:
+        event_value = event_values.get(key)
+
+        if event_value is None:
+            return False
+
+        if operator == "eq":
+            return event_value == value
+        elif operator == "not":
+            return event_value != value
+        elif operator == "contain":
+            return event_values.get_lower(key).find(lower_value) >= 0
+        elif operator == "not_contain":
+            return event_values.get_lower(key).find(lower_value) < 0
+
+        return False
+
+
+class CompiledEventRuleSet:
+    def __init__(self, event_rule_vos: list, version: Union[str, None]):
+        self.rules: List[CompiledEventRule] = [
+            CompiledEventRule(event_rule_vo) for event_rule_vo in event_rule_vos
+        ]
+        self.version = version
+        self.compiled_at = time.monotonic()
+
+
+def get_rule_set(
+    rule_key: str, version: Union[str, None], timeout: int
+) -> Union[CompiledEventRuleSet, None]:
+    rule_set: CompiledEventRuleSet = _COMPILED_RULE_SETS.get(rule_key)
+
+    if rule_set is None:
+        return None
+
+    if rule_set.version != version:
+        return None
+
+    if time.monotonic() - rule_set.compiled_at > timeout:
+        return None
+
+    return rule_set
+
+
+def set_rule_set(rule_key: str, rule_set: CompiledEventRuleSet) -> None:
+    with _LOCK:
+        _COMPILED_RULE_SETS[rule_key] = rule_set
+
+
+def delete_rule_set(rule_key: str) -> None:
+    with _LOCK:
+        _COMPILED_RULE_SETS.pop(rule_key, None)
@@ -0,0 +1,300 @@
+import base64
+import math
+import sys
+from array import array
+from datetime import timezone
+from typing import Any, Callable, List, Tuple, Union
+
+from spaceone.core import utils
+
+# Each series is sent as one base64 string of little-endian IEEE 754 doubles
+# instead of a list of protobuf Values. Missing points are NaN.
+FLOAT64_BASE64 = "FLOAT64_BASE64"
+
+VALUE_ENCODINGS = [FLOAT64_BASE64]
+
+AGGREGATES = ["SUM", "AVG", "P95"]
+
+
+def encode_values(values: dict, value_encoding: str = None) -> dict:
+    """Encodes numeric series of metric values. Other values are kept as is."""
+    if value_encoding is None:
+        return values
+
+    return {key: _encode_value(value) for key, value in values.items()}
+
+
+def encode_float64(series: List[Union[int, float, None]]) -> str:
+    data = array("d", [math.nan if value is None else value for value in series])
+
+    if sys.byteorder == "big":
+        data.byteswap()
+
+    return base64.b64encode(data.tobytes()).decode()
+
+
+def decode_float64(encoded: str) -> List[float]:
+    data = array("d")
+    data.frombytes(base64.b64decode(encoded))
+
+    if sys.byteorder == "big":
+        data.byteswap()
+
+    return data.tolist()
+
+
+def aggregate_values(labels: list, values: dict, aggregate: str) -> dict:
+    """Reduces all series to one series named after the aggregate.
+
+    Missing points (None) are ignored.
+    """
+    func = _AGGREGATE_FUNCS[aggregate]
+    series_list = [
+        series for series in values.values() if _is_series(series, len(labels))
+    ]
+
+    return {
+        aggregate: [
+            func(_get_points([series[index] for series in series_list]))
+            for index in range(len(labels))
+        ]
+    }
+
+
+def downsample(
+    labels: list, values: dict, max_points: int, stat: str = None
+) -> Tuple[list, dict]:
+    """Reduces series to at most max_points points.
+
+    A single series without stat keeps its shape with LTTB (Largest Triangle
+    Three Buckets). Otherwise each bucket of points is reduced by stat
+    (AVERAGE by default), so all series keep sharing the labels.
+    """
+    length = len(labels)
+    if not max_points or length <= max_points:
+        return labels, values
+
+    keys = [key for key, series in values.items() if _is_series(series, length)]
+
+    if stat is None and len(keys) == 1 and max_points >= 3:
+        indices = _get_lttb_indices(values[keys[0]], max_points)
+        return [labels[index] for index in indices], {
+            **values,
+            keys[0]: [values[keys[0]][index] for index in indices],
+        }
+
+    bucket_size = math.ceil(length / max_points)
+    func = _BUCKET_FUNCS.get(stat, _average)
+    downsampled_values = dict(values)
+
+    for key in keys:
+        series = values[key]
+        downsampled_values[key] = [
+            func(_get_points(series[index : index + bucket_size]))
+            for index in range(0, length, bucket_size)
+        ]
+
+    return labels[::bucket_size], downsampled_values
+
+
+def to_timestamp(value: Any) -> Union[float, None]:
+    """Converts an ISO 8601 label or epoch seconds to epoch seconds."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+
+    if isinstance(value, str):
+        try:
+            dt = utils.iso8601_to_datetime(value)
+        except ValueError:
+            return None
+
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+
+        return dt.timestamp()
+
+    return None
+
+
+def get_windows(start: float, end: float, window_size: int) -> List[int]:
+    """Returns the start times of the aligned windows covering start to end."""
+    window_start = int(start // window_size * window_size)
+    return list(range(window_start, int(end) + 1, window_size))
+
+
+def split_windows(
+    labels: list, values: dict, windows: List[int], window_size: int
+) -> Union[List[Tuple[list, dict]], None]:
+    """Splits metric data into (labels, values) of each window.
+
+    Returns None if the data can not be split: labels are not timestamps or
+    values are not series of labels.
+    """
+    timestamps = [to_timestamp(label) for label in labels]
+
+    if None in timestamps or not all(
+        _is_series(series, len(labels)) for series in values.values()
+    ):
+        return None
+
+    windows_indices = [[] for _ in windows]
+    for index, timestamp in enumerate(timestamps):
+        position = int((timestamp - windows[0]) // window_size)
+
+        if 0 <= position < len(windows):
+            windows_indices[position].append(index)
+
+    return [
+        (
+            [labels[index] for index in indices],
+            {
+                key: [series[index] for index in indices]
+                for key, series in values.items()
+            },
+        )
+        for indices in windows_indices
+    ]
+
+
+def merge_windows(windows_data: List[Tuple[list, dict]]) -> Tuple[list, dict]:
+    """Concatenates (labels, values) of windows. Missing series are None."""
+    labels = []
+    values = {}
+
+    for window_labels, window_values in windows_data:
+        for key in list(values.keys()) + list(window_values.keys()):
+            if key not in values:
+                values[key] = [None] * len(labels)
+
+        for key, series in values.items():
+            series.extend(window_values.get(key, [None] * len(window_labels)))
+
+        labels.extend(window_labels)
+
+    return labels, values
+
+
+def trim(labels: list, values: dict, start: float, end: float) -> Tuple[list, dict]:
+    """Keeps the points from start to end (inclusive)."""
+    indices = [
+        index
+        for index, label in enumerate(labels)
+        if start <= to_timestamp(label) <= end
+    ]
+
+    return [labels[index] for index in indices], {
+        key: [series[index] for index in indices] for key, series in values.items()
+    }
+
+
+def trim_after(labels: list, values: dict, timestamp: float) -> Tuple[list, dict]:
+    """Keeps the points after timestamp. Labels that are not timestamps are kept."""
+    indices = []
+    for index, label in enumerate(labels):
+        label_timestamp = to_timestamp(label)
+
+        if label_timestamp is None or label_timestamp > timestamp:
+            indices.append(index)
+
+    trimmed_values = {}
+    for key, series in values.items():
+        if _is_series(series, len(labels)):
+            trimmed_values[key] = [series[index] for index in indices]
+        else:
+            trimmed_values[key] = series
+
+    return [labels[index] for index in indices], trimmed_values
+
+
+def _get_lttb_indices(series: list, max_points: int) -> List[int]:
+    points = [
+        (index, value)
+        for index, value in enumerate(series)
+        if isinstance(value, (int, float))
+    ]
+
+    if len(points) <= max_points:
+        return [index for index, value in points]
+
+    bucket_size = (len(points) - 2) / (max_points - 2)
+    selected = points[0]
+    indices = [selected[0]]
+
+    for bucket in range(max_points - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, len(points))
+
+        # The average point of the next bucket is the third triangle vertex
+        next_points = points[end:next_end] or [points[-1]]
+        next_x = sum(index for index, value in next_points) / len(next_points)
+        next_y = sum(value for index, value in next_points) / len(next_points)
+
+        selected = max(
+            points[start:end],
+            key=lambda point: abs(
+                (selected[0] - next_x) * (point[1] - selected[1])
+                - (selected[0] - point[0]) * (next_y - selected[1])
+            ),
+        )
+        indices.append(selected[0])
+
+    indices.append(points[-1][0])
+    return indices
+
+
+def _is_series(value: Any, length: int) -> bool:
+    return isinstance(value, list) and len(value) == length
+
+
+def _get_points(values: list) -> list:
+    return [value for value in values if isinstance(value, (int, float))]
+
+
+def _reduce(func: Callable[[list], float]) -> Callable[[list], Union[float, None]]:
+    def wrapper(points: list) -> Union[float, None]:
+        return func(points) if points else None
+
+    return wrapper
+
+
+@_reduce
+def _average(points: list) -> float:
+    return sum(points) / len(points)
+
+
+@_reduce
+def _percentile_95(points: list) -> float:
+    points = sorted(points)
+    rank = (len(points) - 1) * 0.95
+    lower = math.floor(rank)
+    upper = min(lower + 1, len(points) - 1)
+
+    return points[lower] + (points[upper] - points[lower]) * (rank - lower)
+
+
+_AGGREGATE_FUNCS = {
+    "SUM": _reduce(sum),
+    "AVG": _average,
+    "P95": _percentile_95,
+}
+
+_BUCKET_FUNCS = {
+    "AVERAGE": _average,
+    "MAX": _reduce(max),
+    "MIN": _reduce(min),
+    "SUM": _reduce(sum),
+}
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _encode_value(sub_value) for key, sub_value in value.items()}
+
+    if isinstance(value, list):
+        try:
+            return encode_float64(value)
+        except TypeError:
+            return value
+
+    return value
@@ -0,0 +1,217 @@
+import atexit
+import itertools
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Callable, Union
+
+_LOGGER = logging.getLogger(__name__)
+
+_HIGH_PRIORITY = 0
+_LOW_PRIORITY = 1
+
+_DISPATCHER = None
+_LOCK = threading.Lock()
+
+
+class TokenBucket:
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(rate, 1)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def acquire(self) -> bool:
+        self._refill()
+
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+
+        return False
+
+    def get_wait_time(self) -> float:
+        self._refill()
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+
+class NotificationDispatcher:
+    """Sends notifications from a bounded priority queue in a background thread.
+
+    HIGH urgency messages are sent first. Each domain is limited to
+    rate_limit messages per second (0 = unlimited). At most queue_size
+    notifications are held, including the ones deferred by the rate limit.
+    When the process exits, queued notifications are sent for up to
+    shutdown_timeout seconds and the rest are dropped.
+    """
+
+    def __init__(
+        self,
+        queue_size: int,
+        rate_limit: float,
+        batch_size: int,
+        shutdown_timeout: float = 0,
+    ):
+        self.queue_size = queue_size
+        self.rate_limit = rate_limit
+        self.batch_size = max(batch_size, 1)
+        self.shutdown_timeout = shutdown_timeout
+        self._queue = queue.PriorityQueue()
+        self._buckets = {}
+        self._sequence = itertools.count()
+        self._pending = 0
+        self._condition = threading.Condition()
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def put(self, domain_id: str, urgency: Union[str, None], send: Callable) -> bool:
+        self._start_worker()
+
+        priority = _HIGH_PRIORITY if urgency == "HIGH" else _LOW_PRIORITY
+
+        # Notifications are counted until they are sent, so deferred ones
+        # also take up the queue size.
+        with self._condition:
+            if self._pending >= self.queue_size:
+                return False
+
+            self._pending += 1
+
+        self._queue.put((priority, next(self._sequence), domain_id, send))
+        return True
+
+    def flush(self, timeout: float = None) -> bool:
+        """Waits until all queued notifications are sent."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending == 0, timeout)
+
+    def _flush_on_exit(self) -> None:
+        if self._pid != os.getpid() or self._pending == 0:
+            return
+
+        if self.shutdown_timeout > 0:
+            self.flush(self.shutdown_timeout)
+
+        if self._pending > 0:
+            _LOGGER.warning(
+                f"[NotificationDispatcher] {self._pending} queued notifications "
+                f"are dropped on exit."
+            )
+
+    def _start_worker(self) -> None:
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+
+        with self._lock:
+            if self._pid != pid:
+                # The worker thread of a parent process does not survive a fork.
+                if self._pid is None:
+                    atexit.register(self._flush_on_exit)
+
+                self._queue = queue.PriorityQueue()
+                self._buckets = {}
+                self._pending = 0
+
+                thread = threading.Thread(
+                    target=self._run, name="NotificationDispatcher", daemon=True
+                )
+                thread.start()
+                self._pid = pid
+
+    def _run(self) -> None:
+        deferred = []
+
+        while True:
+            try:
+                items = sorted(deferred + self._get_batch(deferred))
+                deferred = []
+
+                for item in items:
+                    if self._acquire(item[2]):
+                        self._send(item)
+                        self._done()
+                    else:
+                        deferred.append(item)
+            except Exception as e:
+                _LOGGER.error(
+                    f"[NotificationDispatcher] Dispatch Error: {e}", exc_info=True
+                )
+
+    def _done(self) -> None:
+        with self._condition:
+            self._pending -= 1
+
+            if self._pending == 0:
+                self._condition.notify_all()
+
+    def _get_batch(self, deferred: list) -> list:
+        timeout = self._get_wait_time(deferred)
+
+        try:
+            batch = [self._queue.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _get_wait_time(self, deferred: list) -> Union[float, None]:
+        if len(deferred) == 0:
+            return None
+
+        return min(self._buckets[item[2]].get_wait_time() for item in deferred)
+
+    def _acquire(self, domain_id: str) -> bool:
+        if self.rate_limit <= 0:
+            return True
+
+        if domain_id not in self._buckets:
+            self._buckets[domain_id] = TokenBucket(self.rate_limit)
+
+        return self._buckets[domain_id].acquire()
+
+    @staticmethod
+    def _send(item: tuple) -> None:
+        priority, sequence, domain_id, send = item
+
+        try:
+            send()
+        except Exception as e:
+            _LOGGER.error(
+                f"[NotificationDispatcher] Failed to send notification: {e} "
+                f"(domain_id = {domain_id})",
+                exc_info=True,
+            )
+
+
+def get_dispatcher(
+    queue_size: int,
+    rate_limit: float,
+    batch_size: int,
+    shutdown_timeout: float = 0,
+) -> NotificationDispatcher:
+    global _DISPATCHER
+
+    if _DISPATCHER is None:
+        with _LOCK:
+            if _DISPATCHER is None:
+                _DISPATCHER = NotificationDispatcher(
+                    queue_size, rate_limit, batch_size, shutdown_timeout
+                )
+
+    return _DISPATCHER
@@ -0,0 +1,254 @@
+import logging
+import threading
+import types
+from typing import Any, Union
+
+import grpc
+from google.protobuf.json_format import MessageToDict
+from spaceone.core import config
+from spaceone.core.error import ERROR_BASE, ERROR_GRPC_CONNECTION
+from spaceone.core.pygrpc.client import GRPCClient
+from spaceone.core.utils import parse_grpc_endpoint
+
+_LOGGER = logging.getLogger(__name__)
+
+_MAX_MESSAGE_LENGTH = 1024 * 1024 * 256
+_CHANNEL_READY_TIMEOUT = 3
+
+_CONNECTOR_POOL = None
+_LOCK = threading.Lock()
+
+
+class PluginChannel:
+    """gRPC channel to a plugin endpoint with its reflection client."""
+
+    def __init__(self, endpoint: str, keepalive_time: int, timeout: int = None):
+        grpc_endpoint = parse_grpc_endpoint(endpoint)
+        options = [
+            ("grpc.max_send_message_length", _MAX_MESSAGE_LENGTH),
+            ("grpc.max_receive_message_length", _MAX_MESSAGE_LENGTH),
+            # Each channel of an endpoint opens its own connection
+            ("grpc.use_local_subchannel_pool", 1),
+            ("grpc.keepalive_time_ms", keepalive_time * 1000),
+            ("grpc.keepalive_timeout_ms", 20000),
+        ]
+
+        if grpc_endpoint["ssl_enabled"]:
+            self.channel = grpc.secure_channel(
+                grpc_endpoint["endpoint"], grpc.ssl_channel_credentials(), options
+            )
+        else:
+            self.channel = grpc.insecure_channel(grpc_endpoint["endpoint"], options)
+
+        try:
+            grpc.channel_ready_future(self.channel).result(
+                timeout=_CHANNEL_READY_TIMEOUT
+            )
+            self.client = GRPCClient(self.channel, {}, endpoint, timeout)
+        except Exception as e:
+            self.channel.close()
+            raise ERROR_GRPC_CONNECTION(
+                channel=endpoint, message=str(e) or "Channel is not ready."
+            )
+
+        self.in_flight = 0
+        self.healthy = True
+        self.channel.subscribe(self._check_state)
+
+    def call(self, method: str, params: dict, token: str) -> Any:
+        resource, verb = method.split(".", 1)
+        response_or_iterator = getattr(getattr(self.client, resource), verb)(
+            params, metadata=[("token", token)]
+        )
+
+        if isinstance(response_or_iterator, types.GeneratorType):
+            return self._generate_response(response_or_iterator)
+        else:
+            return self._change_message(response_or_iterator)
+
+    def close(self) -> None:
+        self.channel.unsubscribe(self._check_state)
+        self.channel.close()
+
+    def _check_state(self, state: grpc.ChannelConnectivity) -> None:
+        if state in [
+            grpc.ChannelConnectivity.TRANSIENT_FAILURE,
+            grpc.ChannelConnectivity.SHUTDOWN,
+        ]:
+            self.healthy = False
+
+    def _generate_response(self, response_iterator):
+        for response in response_iterator:
+            yield self._change_message(response)
+
+    @staticmethod
+    def _change_message(message) -> dict:
+        return MessageToDict(message, preserving_proto_field_name=True)
+
+
+class PluginConnectorPool:
+    """Long-lived channels to plugin endpoints shared by all threads.
+
+    A call uses the channel with the fewest in-flight calls. A new channel
+    is opened when all channels of the endpoint have max_concurrent_streams
+    calls, up to max_channels. Channels that fail are closed and reopened on
+    the next call.
+    """
+
+    def __init__(
+        self,
+        max_channels: int,
+        max_concurrent_streams: int,
+        keepalive_time: int,
+        timeout: int = None,
+    ):
+        self.max_channels = max_channels
+        self.max_concurrent_streams = max_concurrent_streams
+        self.keepalive_time = keepalive_time
+        self.timeout = timeout
+        self._channels = {}
+        self._lock = threading.Lock()
+
+    def dispatch(
+        self, endpoint: str, method: str, params: dict = None, token: str = None
+    ) -> Any:
+        plugin_channel = self._acquire(endpoint)
+
+        try:
+            response = plugin_channel.call(method, params or {}, token or "NO_TOKEN")
+        except Exception as e:
+            self._release(endpoint, plugin_channel, e)
+            raise e
+
+        if isinstance(response, types.GeneratorType):
+            return self._generate_response(endpoint, plugin_channel, response)
+
+        self._release(endpoint, plugin_channel)
+        return response
+
+    def _generate_response(
+        self, endpoint: str, plugin_channel: PluginChannel, response_iterator
+    ):
+        error = None
+
+        try:
+            yield from response_iterator
+        except Exception as e:
+            error = e
+            raise e
+        finally:
+            self._release(endpoint, plugin_channel, error)
+
+    def _acquire(self, endpoint: str) -> PluginChannel:
+        with self._lock:
+            plugin_channel = self._get_least_loaded_channel(endpoint)
+
+            if plugin_channel:
+                plugin_channel.in_flight += 1
+                return plugin_channel
+
+        # Connecting may take a while, so it is done outside the lock.
+        new_channel = self._create_channel(endpoint)
+
+        with self._lock:
+            channels = self._channels.setdefault(endpoint, [])
+
+            # Other threads may have opened channels in the meantime
+            if len(channels) >= self.max_channels:
+                plugin_channel = min(channels, key=lambda channel: channel.in_flight)
+                plugin_channel.in_flight += 1
+            else:
+                plugin_channel = new_channel
+                channels.append(plugin_channel)
+                plugin_channel.in_flight += 1
+
+                _LOGGER.debug(
+                    f"[PluginConnectorPool] Open channel: {endpoint} "
+                    f"(channels = {len(channels)})"
+                )
+
+        if plugin_channel is not new_channel:
+            new_channel.close()
+
+        return plugin_channel
+
+    def _get_least_loaded_channel(self, endpoint: str) -> Union[PluginChannel, None]:
+        channels = self._channels.get(endpoint, [])
+
+        for plugin_channel in [channel for channel in channels if not channel.healthy]:
+            self._remove_channel(endpoint, plugin_channel)
+
+        channels = self._channels.get(endpoint, [])
+        if len(channels) == 0:
+            return None
+
+        plugin_channel = min(channels, key=lambda channel: channel.in_flight)
+
+        if (
+            plugin_channel.in_flight >= self.max_concurrent_streams
+            and len(channels) < self.max_channels
+        ):
+            return None
+
+        return plugin_channel
+
+    def _create_channel(self, endpoint: str) -> PluginChannel:
+        return PluginChannel(endpoint, self.keepalive_time, self.timeout)
+
+    def _release(
+        self, endpoint: str, plugin_channel: PluginChannel, error: Exception = None
+    ) -> None:
+        with self._lock:
+            plugin_channel.in_flight -= 1
+
+            if self._is_connection_error(error):
+                _LOGGER.warning(
+                    f"[PluginConnectorPool] Close failed channel: {endpoint} ({error})"
+                )
+                plugin_channel.healthy = False
+                self._remove_channel(endpoint, plugin_channel)
+
+            elif plugin_channel.in_flight <= 0 and plugin_channel not in (
+                self._channels.get(endpoint, [])
+            ):
+                plugin_channel.close()
+
+    def _remove_channel(self, endpoint: str, plugin_channel: PluginChannel) -> None:
+        channels = self._channels.get(endpoint, [])
+
+        if plugin_channel in channels:
+            channels.remove(plugin_channel)
+
+        if len(channels) == 0:
+            self._channels.pop(endpoint, None)
+
+        # In-flight calls of a removed channel are left to finish
+        if plugin_channel.in_flight <= 0:
+            plugin_channel.close()
+
+    @staticmethod
+    def _is_connection_error(error: Exception) -> bool:
+        if isinstance(error, ERROR_BASE):
+            return error.error_code in ["ERROR_GRPC_CONNECTION", "ERROR_GRPC_TIMEOUT"]
+
+        return False
+
+
+def get_connector_pool() -> Union[PluginConnectorPool, None]:
+    """Returns the shared pool, or None if PLUGIN_CHANNEL_POOL_SIZE is 0."""
+    global _CONNECTOR_POOL
+
+    max_channels = config.get_global("PLUGIN_CHANNEL_POOL_SIZE", 0)
+    if max_channels <= 0:
+        return None
+
+    if _CONNECTOR_POOL is None:
+        with _LOCK:
+            if _CONNECTOR_POOL is None:
+                _CONNECTOR_POOL = PluginConnectorPool(
+                    max_channels,
+                    config.get_global("PLUGIN_CHANNEL_MAX_CONCURRENT_STREAMS", 100),
+                    config.get_global("PLUGIN_CHANNEL_KEEPALIVE_TIME", 300),
+                )
+
+    return _CONNECTOR_POOL
@@ -1,11 +1,23 @@
 import logging
+import threading
+from datetime import datetime
+from typing import List, Tuple
 
+from pymongo import UpdateOne
+from spaceone.core import config
 from spaceone.core.manager import BaseManager
 
+from spaceone.monitoring.lib import cache, cache_key
 from spaceone.monitoring.model.alert_model import Alert, AlertNumber
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fields used in the cached notification message (see JobService._create_message)
+_MESSAGE_FIELDS = ["description", "assignee", "urgency", "project_id"]
+
+_RESERVED_ALERT_NUMBERS = {}
+_LOCK = threading.Lock()
+
 
 class AlertManager(BaseManager):
     def __init__(self, *args, **kwargs):
@@ -44,12 +56,21 @@ class AlertManager(BaseManager):
             alert_vo.update(old_data)
 
         self.transaction.add_rollback(_rollback, alert_vo.to_dict())
+
+        if self._is_message_changed(params, alert_vo):
+            self._delete_message_cache(alert_vo)
+
+        if "state" in params and params["state"] != alert_vo.state:
+            self._delete_event_key_indexes(alert_vo)
+
         return alert_vo.update(params)
 
     def delete_alert(self, alert_id, domain_id, workspace_id, user_projects=None):
         alert_vo: Alert = self.get_alert(
             alert_id, domain_id, workspace_id, user_projects
         )
+        self._delete_message_cache(alert_vo)
+        self._delete_event_key_indexes(alert_vo)
         alert_vo.delete()
 
     def get_alert(
@@ -71,27 +92,156 @@ class AlertManager(BaseManager):
             conditions["project_id"] = user_projects
         return self.alert_model.get(**conditions)
 
+    def update_alerts_by_bulk(self, updates: List[Tuple[Alert, dict]]) -> None:
+        def _rollback(old_updates: List[Tuple[str, dict]]):
+            _LOGGER.info(
+                f"[update_alerts_by_bulk._rollback] Revert Data : "
+                f"{[alert_id for alert_id, old_data in old_updates]}"
+            )
+            self._bulk_write(old_updates)
+
+        if len(updates) == 0:
+            return None
+
+        now = datetime.utcnow()
+        updates = [
+            (alert_vo, {**params, "updated_at": now}) for alert_vo, params in updates
+        ]
+        old_updates = [
+            (alert_vo.alert_id, {key: getattr(alert_vo, key) for key in params})
+            for alert_vo, params in updates
+        ]
+        message_changed_alert_vos = [
+            alert_vo
+            for alert_vo, params in updates
+            if self._is_message_changed(params, alert_vo)
+        ]
+        state_changed_alert_vos = [
+            alert_vo
+            for alert_vo, params in updates
+            if "state" in params and params["state"] != alert_vo.state
+        ]
+
+        self._bulk_write([(alert_vo.alert_id, params) for alert_vo, params in updates])
+        self.transaction.add_rollback(_rollback, old_updates)
+
+        for alert_vo, params in updates:
+            for key, value in params.items():
+                setattr(alert_vo, key, value)
+
+        for alert_vo in message_changed_alert_vos:
+            self._delete_message_cache(alert_vo)
+
+        for alert_vo in state_changed_alert_vos:
+            self._delete_event_key_indexes(alert_vo)
+
+    def _bulk_write(self, updates: List[Tuple[str, dict]]) -> None:
+        requests = [
+            UpdateOne({"alert_id": alert_id}, {"$set": params})
+            for alert_id, params in updates
+        ]
+
+        self.alert_model._get_collection().bulk_write(requests, ordered=False)
+
+    def stop_escalation_by_project(
+        self, project_id: str, workspace_id: str, domain_id: str
+    ) -> None:
+        self.alert_model.filter(
+            project_id=project_id,
+            workspace_id=workspace_id,
+            domain_id=domain_id,
+            state=["TRIGGERED", "ACKNOWLEDGED"],
+            escalation_ttl__gt=0,
+        ).update(escalation_ttl=0, updated_at=datetime.utcnow())
+
+    def reset_escalation_schedule_by_policy(
+        self, escalation_policy_id: str, domain_id: str
+    ) -> None:
+        # The scheduler selects alerts without next_escalation_at and
+        # recalculates it with the current rules.
+        self.alert_model.filter(
+            escalation_policy_id=escalation_policy_id,
+            domain_id=domain_id,
+            state=["TRIGGERED", "ACKNOWLEDGED"],
+            escalation_ttl__gt=0,
+        ).update(next_escalation_at=None, updated_at=datetime.utcnow())
+
+    def filter_alerts(self, **conditions):
+        return self.alert_model.filter(**conditions)
+
     def list_alerts(self, query: dict) -> dict:
         return self.alert_model.query(**query)
 
     def stat_alerts(self, query: dict) -> dict:
         return self.alert_model.stat(**query)
 
-    def _get_alert_number(self, domain_id: str, workspace_id: str) -> int:
-        def _rollback(vo: AlertNumber):
-            _LOGGER.info(f"[_get_alert_number._rollback] Decrement Number: {vo.next}")
-            vo.decrement("next", 1)
+    @staticmethod
+    def _is_message_changed(params: dict, alert_vo: Alert) -> bool:
+        return any(
+            key in params and params[key] != getattr(alert_vo, key)
+            for key in _MESSAGE_FIELDS
+        )
 
-        alert_number_vos = self.alert_number_model.filter(
-            domain_id=domain_id, workspace_id=workspace_id
+    @staticmethod
+    def _delete_message_cache(alert_vo: Alert) -> None:
+        cache.delete(
+            cache_key.ALERT_MESSAGE.format(
+                domain_id=alert_vo.domain_id, alert_id=alert_vo.alert_id
+            )
         )
-        if alert_number_vos.count() > 0:
-            account_number_vo = alert_number_vos[0].increment("next", 1)
-            self.transaction.add_rollback(_rollback, account_number_vo)
-        else:
-            account_number_vo = self.alert_number_model.create(
-                {"domain_id": domain_id, "workspace_id": workspace_id}
+
+    @staticmethod
+    def _delete_event_key_indexes(alert_vo: Alert) -> None:
+        # Duplicate events must not be merged into a resolved alert
+        cache.delete_tags(
+            cache_key.ALERT_TAG.format(
+                domain_id=alert_vo.domain_id, alert_id=alert_vo.alert_id
             )
-            self.transaction.add_rollback(_rollback, account_number_vo)
+        )
+
+    def _get_alert_number(self, domain_id: str, workspace_id: str) -> int:
+        def _rollback(domain_id: str, workspace_id: str):
+            _LOGGER.info(
+                f"[_get_alert_number._rollback] Decrement Number: "
+                f"{domain_id}:{workspace_id}"
+            )
+            self._increment_alert_number(domain_id, workspace_id, -1)
+
+        block_size = config.get_global("ALERT_NUMBER_BLOCK_SIZE", 1)
+        if block_size > 1:
+            return self._get_alert_number_from_block(
+                domain_id, workspace_id, block_size
+            )
+
+        alert_number = self._increment_alert_number(domain_id, workspace_id, 1)
+        self.transaction.add_rollback(_rollback, domain_id, workspace_id)
+
+        return alert_number
+
+    def _get_alert_number_from_block(
+        self, domain_id: str, workspace_id: str, block_size: int
+    ) -> int:
+        # Reserved numbers are not returned on rollback, so gaps are possible.
+        block_key = f"{domain_id}:{workspace_id}"
+
+        with _LOCK:
+            next_number, last_number = _RESERVED_ALERT_NUMBERS.get(block_key, (1, 0))
+
+            if next_number > last_number:
+                last_number = self._increment_alert_number(
+                    domain_id, workspace_id, block_size
+                )
+                next_number = last_number - block_size + 1
+
+            _RESERVED_ALERT_NUMBERS[block_key] = (next_number + 1, last_number)
+
+        return next_number
+
+    def _increment_alert_number(
+        self, domain_id: str, workspace_id: str, amount: int
+    ) -> int:
+        alert_number_vo: AlertNumber = self.alert_number_model.objects(
+            domain_id=domain_id, workspace_id=workspace_id
+        ).modify(upsert=True, new=True, inc__next=amount)
 
-        return account_number_vo.next
+        return alert_number_vo.next
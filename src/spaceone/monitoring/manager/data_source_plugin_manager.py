@@ -4,6 +4,7 @@ from spaceone.core.connector.space_connector import SpaceConnector
 from spaceone.core.manager import BaseManager
 
 from spaceone.monitoring.error import *
+from spaceone.monitoring.lib.plugin_connector_pool import get_connector_pool
 from spaceone.monitoring.model.plugin_metadata_model import (
     MetricPluginMetadataModel,
     LogPluginMetadataModel,
@@ -14,11 +15,7 @@ _LOGGER = logging.getLogger(__name__)
 
 class DataSourcePluginManager(BaseManager):
     def init_plugin(self, endpoint, options: dict, monitoring_type: str) -> dict:
-        plugin_connector: SpaceConnector = self.locator.get_connector(
-            "SpaceConnector", endpoint=endpoint, token="NO_TOKEN"
-        )
-
-        plugin_info = plugin_connector.dispatch("DataSource.init", {"options": options})
+        plugin_info = self._dispatch(endpoint, "DataSource.init", {"options": options})
 
         _LOGGER.debug(f"[plugin_info] {plugin_info}")
         plugin_metadata = plugin_info.get("metadata", {})
@@ -28,32 +25,20 @@ class DataSourcePluginManager(BaseManager):
         return plugin_metadata
 
     def verify_plugin(self, endpoint, options, secret_data, schema):
-        plugin_connector: SpaceConnector = self.locator.get_connector(
-            "SpaceConnector", endpoint=endpoint, token="NO_TOKEN"
-        )
-
         params = {"options": options, "secret_data": secret_data, "schema": schema}
 
-        plugin_connector.dispatch("DataSource.verify", params)
+        self._dispatch(endpoint, "DataSource.verify", params)
 
     def list_metrics(self, endpoint, schema, options, secret_data, query):
-        plugin_connector: SpaceConnector = self.locator.get_connector(
-            "SpaceConnector", endpoint=endpoint, token="NO_TOKEN"
-        )
-
         params = {"options": options, "secret_data": secret_data, "query": query}
 
         if schema:
             params.update({"schema": schema})
 
-        return plugin_connector.dispatch("Metric.list", params)
+        return self._dispatch(endpoint, "Metric.list", params)
 
     def get_metric_data(self, endpoint, params):
-        plugin_connector: SpaceConnector = self.locator.get_connector(
-            "SpaceConnector", endpoint=endpoint, token="NO_TOKEN"
-        )
-
-        return plugin_connector.dispatch("Metric.get_data", params)
+        return self._dispatch(endpoint, "Metric.get_data", params)
 
     def list_logs(
         self,
@@ -68,10 +53,6 @@ class DataSourcePluginManager(BaseManager):
         sort,
         limit,
     ):
-        plugin_connector: SpaceConnector = self.locator.get_connector(
-            "SpaceConnector", endpoint=endpoint
-        )
-
         """
         logs_info = self.ds_plugin_mgr.list_logs(
             endpoint,
@@ -104,11 +85,24 @@ class DataSourcePluginManager(BaseManager):
             params["limit"] = limit
 
         results = []
-        for result in plugin_connector.dispatch("Log.list", params):
+        for result in self._dispatch(
+            endpoint, "Log.list", params, token=self.transaction.meta.get("token")
+        ):
             results.extend(result.get("results", []))
 
         return {"results": results}
 
+    def _dispatch(
+        self, endpoint: str, method: str, params: dict, token: str = "NO_TOKEN"
+    ):
+        if connector_pool := get_connector_pool():
+            return connector_pool.dispatch(endpoint, method, params, token=token)
+
+        plugin_connector: SpaceConnector = self.locator.get_connector(
+            "SpaceConnector", endpoint=endpoint, token=token
+        )
+        return plugin_connector.dispatch(method, params)
+
     @staticmethod
     def _validate_plugin_metadata(plugin_metadata: dict, monitoring_type: str) -> None:
         try:
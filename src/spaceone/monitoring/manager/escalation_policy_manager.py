@@ -6,6 +6,7 @@ from spaceone.core.manager import BaseManager
 
 from spaceone.monitoring.conf.default_escalation_policy import DEFAULT_ESCALATION_POLICY
 from spaceone.monitoring.error.escalation_policy import *
+from spaceone.monitoring.lib import cache, cache_key
 from spaceone.monitoring.model.escalation_policy_model import EscalationPolicy
 
 _LOGGER = logging.getLogger(__name__)
@@ -60,6 +61,10 @@ class EscalationPolicyManager(BaseManager):
 
         updated_vo: EscalationPolicy = escalation_policy_vo.update(params)
 
+        self._delete_escalation_policy_cache(
+            updated_vo.escalation_policy_id, updated_vo.domain_id
+        )
+
         return updated_vo
 
     def set_default_escalation_policy(self, params, escalation_policy_vo):
@@ -72,7 +77,13 @@ class EscalationPolicyManager(BaseManager):
         for global_escalation_policy_vo in global_escalation_policy_vos:
             global_escalation_policy_vo.update({"is_default": False})
 
-        return escalation_policy_vo.update({"is_default": True})
+        updated_vo: EscalationPolicy = escalation_policy_vo.update({"is_default": True})
+
+        self._delete_escalation_policy_cache(
+            updated_vo.escalation_policy_id, updated_vo.domain_id
+        )
+
+        return updated_vo
 
     def is_default_escalation_policy(self, domain_id, workspace_id):
         if isinstance(workspace_id, list):
@@ -136,6 +147,8 @@ class EscalationPolicyManager(BaseManager):
 
         escalation_policy_vo.delete()
 
+        self._delete_escalation_policy_cache(escalation_policy_id, domain_id)
+
     def get_escalation_policy(
         self,
         escalation_policy_id: str,
@@ -162,3 +175,15 @@ class EscalationPolicyManager(BaseManager):
 
     def stat_escalation_policies(self, query: dict) -> dict:
         return self.escalation_policy_model.stat(**query)
+
+    @staticmethod
+    def _delete_escalation_policy_cache(
+        escalation_policy_id: str, domain_id: str
+    ) -> None:
+        # Escalation policy info of projects may point to the default policy
+        cache.delete_tags(
+            cache_key.ESCALATION_POLICY_TAG.format(
+                domain_id=domain_id, escalation_policy_id=escalation_policy_id
+            ),
+            cache_key.ESCALATION_POLICY_INFO_TAG.format(domain_id=domain_id),
+        )
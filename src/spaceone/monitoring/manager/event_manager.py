@@ -1,10 +1,16 @@
+import hashlib
+import json
 import logging
 from datetime import datetime, timedelta
+from typing import List, Union
 
-from spaceone.core import config
+from spaceone.core import config, utils
+from spaceone.core.error import ERROR_DB_QUERY
 from spaceone.core.manager import BaseManager
 
+from spaceone.monitoring.lib import cache, cache_key
 from spaceone.monitoring.model.event_model import Event
+from spaceone.monitoring.model.event_raw_data_model import EventRawData
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -13,6 +19,9 @@ class EventManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.event_model: Event = self.locator.get_model("Event")
+        self.event_raw_data_model: EventRawData = self.locator.get_model(
+            "EventRawData"
+        )
 
     def create_event(self, params):
         def _rollback(event_vo):
@@ -21,11 +30,42 @@ class EventManager(BaseManager):
             )
             event_vo.delete()
 
+        self._store_raw_data([params])
+
         event_vo: Event = self.event_model.create(params)
         self.transaction.add_rollback(_rollback, event_vo)
 
+        self._set_event_key_indexes([event_vo])
+
         return event_vo
 
+    def create_events(self, params_list: List[dict]) -> List[Event]:
+        def _rollback(event_ids: List[str]):
+            _LOGGER.info(f"[create_events._rollback] Delete events : {event_ids}")
+            self.event_model.filter(event_id=event_ids).delete()
+
+        if len(params_list) == 0:
+            return []
+
+        self._store_raw_data(params_list)
+
+        try:
+            event_vos = [self._make_event_vo(params) for params in params_list]
+            object_ids = self.event_model.objects.insert(event_vos, load_bulk=False)
+        except Exception as e:
+            raise ERROR_DB_QUERY(reason=e)
+
+        for event_vo, object_id in zip(event_vos, object_ids):
+            event_vo.pk = object_id
+
+        self.transaction.add_rollback(
+            _rollback, [event_vo.event_id for event_vo in event_vos]
+        )
+
+        self._set_event_key_indexes(event_vos)
+
+        return event_vos
+
     def update_event_by_vo(self, params, event_vo):
         def _rollback(old_data):
             _LOGGER.info(
@@ -55,14 +95,24 @@ class EventManager(BaseManager):
     def stat_events(self, query: dict) -> dict:
         return self.event_model.stat(**query)
 
-    def get_event_by_key(
+    def get_event_key_index(
         self,
-        event_key,
-        domain_id,
-        project_id,
-        workspace_id,
-        duplicate_event_time,
-    ):
+        event_key: str,
+        domain_id: str,
+        project_id: str,
+        workspace_id: str,
+        duplicate_event_time: int,
+    ) -> Union[dict, None]:
+        """Returns the latest event of the event key within duplicate_event_time.
+
+        Returns:
+            event_key_index (dict): {
+                'event_id': 'str',
+                'alert_id': 'str',
+                'alert_state': 'str',
+                'created_at': 'float'
+            }
+        """
         if not isinstance(duplicate_event_time, int):
             duplicate_event_time = config.get_global("DUPLICATE_EVENT_TIME", 600)
 
@@ -70,20 +120,135 @@ class EventManager(BaseManager):
             seconds=duplicate_event_time
         )
 
-        query = {
-            "filter": [
-                {"k": "event_key", "v": event_key, "o": "eq"},
-                {"k": "domain_id", "v": domain_id, "o": "eq"},
-                {"k": "workspace_id", "v": workspace_id, "o": "eq"},
-                {"k": "project_id", "v": project_id, "o": "eq"},
-                {"k": "event_type", "v": "RECOVERY", "o": "not"},
-                {"k": "created_at", "v": duplicate_event_datetime, "o": "gte"},
-            ],
-            "sort": [{"key": "created_at", "desc": True}],
+        # Most duplicate events are found in the event key index
+        event_key_index = cache.get(
+            self._make_event_key_index_key(
+                event_key, domain_id, workspace_id, project_id
+            )
+        )
+
+        if (
+            event_key_index
+            and "alert_state" in event_key_index
+            and event_key_index["created_at"] >= duplicate_event_datetime.timestamp()
+        ):
+            return event_key_index
+
+        event_vo = (
+            self.event_model.filter(
+                event_key=event_key,
+                domain_id=domain_id,
+                workspace_id=workspace_id,
+                project_id=project_id,
+                event_type__ne="RECOVERY",
+                created_at__gte=duplicate_event_datetime,
+            )
+            .order_by("-created_at")
+            .first()
+        )
+
+        if event_vo is None:
+            return None
+
+        self._set_event_key_indexes([event_vo])
+        return self._make_event_key_index(event_vo)
+
+    def _make_event_vo(self, params: dict) -> Event:
+        # Keeps only model fields like MongoModel.create. Event data also has
+        # keys for the alert (assignee, urgency, escalation_policy_id, ...).
+        create_data = {
+            key: self.event_model._trim_value(value)
+            for key, value in params.items()
+            if key in self.event_model._fields
         }
+        create_data["event_id"] = utils.generate_id("event")
+        create_data["created_at"] = datetime.utcnow()
+
+        event_vo: Event = self.event_model(**create_data)
+        event_vo.validate()
+        return event_vo
 
-        event_vos, total_count = self.list_events(query)
-        if event_vos.count() > 0:
-            return event_vos[0]
-        else:
+    def _store_raw_data(self, params_list: List[dict]) -> None:
+        if not config.get_global("EVENT_RAW_DATA_STORE", False):
             return None
+
+        # Events parsed from the same request share one raw payload object
+        raw_data_hashes = {}
+        for params in params_list:
+            raw_data = params.get("raw_data")
+            if not raw_data:
+                continue
+
+            raw_data_key = (id(raw_data), params["domain_id"])
+            if raw_data_key not in raw_data_hashes:
+                raw_data_hashes[raw_data_key] = self._upsert_raw_data(
+                    raw_data, params["domain_id"]
+                )
+
+            params["raw_data_hash"] = raw_data_hashes[raw_data_key]
+            params["raw_data"] = {}
+
+    def _upsert_raw_data(self, raw_data: dict, domain_id: str) -> str:
+        raw_data_json = json.dumps(raw_data, sort_keys=True)
+        raw_data_hash = hashlib.sha256(
+            f"{domain_id}:{raw_data_json}".encode("utf-8")
+        ).hexdigest()
+
+        self.event_raw_data_model.objects(raw_data_hash=raw_data_hash).update_one(
+            upsert=True,
+            set_on_insert__data=self.event_raw_data_model.compress(raw_data_json),
+            set_on_insert__compression="ZLIB",
+            set_on_insert__domain_id=domain_id,
+            set_on_insert__created_at=datetime.utcnow(),
+        )
+
+        return raw_data_hash
+
+    def _set_event_key_indexes(self, event_vos: List[Event]) -> None:
+        event_key_indexes = {}
+        tags = {}
+
+        # The latest event of each event key is stored
+        for event_vo in event_vos:
+            if event_vo.event_type == "RECOVERY":
+                continue
+
+            key = self._make_event_key_index_key(
+                event_vo.event_key,
+                event_vo.domain_id,
+                event_vo.workspace_id,
+                event_vo.project_id,
+            )
+            event_key_indexes[key] = self._make_event_key_index(event_vo)
+
+            if event_vo.alert_id:
+                tags[key] = cache_key.EVENT_KEY_INDEX.format_tags(
+                    domain_id=event_vo.domain_id, alert_id=event_vo.alert_id
+                )
+
+        if len(event_key_indexes) > 0:
+            cache.set_many(
+                event_key_indexes,
+                expire=config.get_global("DUPLICATE_EVENT_TIME", 600),
+                tags=tags,
+            )
+
+    @staticmethod
+    def _make_event_key_index(event_vo: Event) -> dict:
+        return {
+            "event_id": event_vo.event_id,
+            "alert_id": event_vo.alert_id,
+            "alert_state": event_vo.alert.state if event_vo.alert else None,
+            "created_at": event_vo.created_at.timestamp(),
+        }
+
+    @staticmethod
+    def _make_event_key_index_key(
+        event_key: str, domain_id: str, workspace_id: str, project_id: str
+    ) -> str:
+        return cache_key.EVENT_KEY_INDEX.format(
+            domain_id=domain_id,
+            workspace_id=workspace_id,
+            project_id=project_id,
+            event_key=event_key,
+        )
@@ -1,12 +1,15 @@
-import functools
 import logging
-from typing import List
 
-from spaceone.core import utils
+from spaceone.core import config, utils
 from spaceone.core.connector.space_connector import SpaceConnector
 from spaceone.core.manager import BaseManager
 
-from spaceone.monitoring.model.event_rule_model import EventRule, EventRuleCondition
+from spaceone.monitoring.lib import cache, cache_key, event_rule_matcher
+from spaceone.monitoring.lib.event_rule_matcher import (
+    CompiledEventRuleSet,
+    EventValues,
+)
+from spaceone.monitoring.model.event_rule_model import EventRule
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,6 +19,7 @@ class EventRuleManager(BaseManager):
         super().__init__(*args, **kwargs)
         self.event_rule_model: EventRule = self.locator.get_model("EventRule")
         self._service_account_info = {}
+        self._compiled_event_rules = {}
 
     def create_event_rule(self, params: dict) -> EventRule:
         def _rollback(vo: EventRule):
@@ -29,6 +33,8 @@ class EventRuleManager(BaseManager):
         event_rule_vo: EventRule = self.event_rule_model.create(params)
         self.transaction.add_rollback(_rollback, event_rule_vo)
 
+        self._update_event_rule_version(event_rule_vo)
+
         return event_rule_vo
 
     def update_event_rule(self, params):
@@ -47,10 +53,15 @@ class EventRuleManager(BaseManager):
 
         self.transaction.add_rollback(_rollback, event_rule_vo.to_dict())
 
-        return event_rule_vo.update(params)
+        updated_vo: EventRule = event_rule_vo.update(params)
+
+        self._update_event_rule_version(updated_vo)
+
+        return updated_vo
+
+    def delete_event_rule_by_vo(self, event_rule_vo):
+        self._update_event_rule_version(event_rule_vo)
 
-    @staticmethod
-    def delete_event_rule_by_vo(event_rule_vo):
         event_rule_vo.delete()
 
     def get_event_rule(
@@ -81,28 +92,44 @@ class EventRuleManager(BaseManager):
         return self.event_rule_model.stat(**query)
 
     def change_event_data(self, event_data, project_id, domain_id, workspace_id):
-        event_rule_vos: List[EventRule] = self._get_project_event_rules(
+        return self._change_event_data_by_project(
+            event_data, project_id, domain_id, workspace_id, [project_id]
+        )
+
+    def _change_event_data_by_project(
+        self, event_data, project_id, domain_id, workspace_id, visited_project_ids
+    ):
+        rule_set: CompiledEventRuleSet = self._get_compiled_event_rules(
             project_id, domain_id, workspace_id
         )
 
-        for event_rule_vo in event_rule_vos:
-            is_match = self._change_event_data_by_event_rule(event_data, event_rule_vo)
+        event_values = EventValues(event_data)
+        for event_rule in rule_set.rules:
+            is_match = event_rule.match(event_values)
 
             if is_match:
                 event_data = self._change_event_data_with_actions(
-                    event_data, event_rule_vo.actions, domain_id, workspace_id
+                    event_data,
+                    event_rule.actions,
+                    domain_id,
+                    workspace_id,
+                    visited_project_ids,
                 )
+                event_values = EventValues(event_data)
 
-            if is_match and event_rule_vo.options.stop_processing:
+            if is_match and event_rule.stop_processing:
                 break
 
         return event_data
 
     def _change_event_data_with_actions(
-        self, event_data, actions, domain_id, workspace_id
+        self, event_data, actions, domain_id, workspace_id, visited_project_ids
     ):
         for action, value in actions.items():
             if action == "change_project":
+                if not self._check_project_hop(value, visited_project_ids):
+                    continue
+
                 event_data["project_id"] = value
                 if "assignee" in event_data:
                     del event_data["assignee"]
@@ -112,8 +139,12 @@ class EventRuleManager(BaseManager):
                 _LOGGER.debug(
                     f"[_change_event_data_with_actions] change_project: {value}"
                 )
-                event_data = self.change_event_data(
-                    event_data, value, domain_id, workspace_id
+                event_data = self._change_event_data_by_project(
+                    event_data,
+                    value,
+                    domain_id,
+                    workspace_id,
+                    visited_project_ids + [value],
                 )
             else:
                 if action == "change_assignee":
@@ -136,55 +167,70 @@ class EventRuleManager(BaseManager):
 
         return event_data
 
-    def _change_event_data_by_event_rule(self, event_data, event_rule_vo: EventRule):
-        conditions_policy = event_rule_vo.conditions_policy
+    @staticmethod
+    def _check_project_hop(project_id: str, visited_project_ids: list) -> bool:
+        if project_id in visited_project_ids:
+            _LOGGER.error(
+                f"[_check_project_hop] Skip change_project action. "
+                f"Circular event rules detected: "
+                f"{' -> '.join(visited_project_ids + [project_id])}"
+            )
+            return False
 
-        if conditions_policy == "ALWAYS":
-            return True
-        else:
-            results = list(
-                map(
-                    functools.partial(self._check_condition, event_data),
-                    event_rule_vo.conditions,
-                )
+        # visited_project_ids starts with the project of the webhook
+        max_depth = config.get_global("EVENT_RULE_MAX_DEPTH", 10)
+        if len(visited_project_ids) >= max_depth:
+            _LOGGER.error(
+                f"[_check_project_hop] Skip change_project action. "
+                f"Maximum depth of event rules exceeded. (max_depth = {max_depth}, "
+                f"project_id = {project_id})"
             )
+            return False
 
-            if conditions_policy == "ALL":
-                return all(results)
-            else:
-                return any(results)
+        return True
 
-    @staticmethod
-    def _check_condition(event_data, condition: EventRuleCondition):
-        event_value = utils.get_dict_value(event_data, condition.key)
-        condition_value = condition.value
-        operator = condition.operator
+    def _get_compiled_event_rules(
+        self, project_id: str, domain_id: str, workspace_id: str
+    ) -> CompiledEventRuleSet:
+        rule_key = f"{domain_id}:{workspace_id}:{project_id}"
+        if rule_key in self._compiled_event_rules:
+            return self._compiled_event_rules[rule_key]
 
-        if event_value is None:
-            return False
+        version = cache.get(
+            cache_key.EVENT_RULE_VERSION.format(
+                domain_id=domain_id, workspace_id=workspace_id, project_id=project_id
+            )
+        )
+        rule_set = event_rule_matcher.get_rule_set(
+            rule_key, version, config.get_global("EVENT_RULE_CACHE_TIMEOUT", 300)
+        )
 
-        if operator == "eq":
-            if event_value == condition_value:
-                return True
-            else:
-                return False
-        elif operator == "contain":
-            if event_value.lower().find(condition_value.lower()) >= 0:
-                return True
-            else:
-                return False
-        elif operator == "not":
-            if event_value != condition_value:
-                return True
-            else:
-                return False
-        elif operator == "not_contain":
-            if event_value.lower().find(condition_value.lower()) < 0:
-                return True
-            else:
-                return False
+        if rule_set is None:
+            event_rule_vos = self._get_project_event_rules(
+                project_id, domain_id, workspace_id
+            )
+            rule_set = CompiledEventRuleSet(event_rule_vos, version)
+            event_rule_matcher.set_rule_set(rule_key, rule_set)
 
-        return False
+        self._compiled_event_rules[rule_key] = rule_set
+        return rule_set
+
+    @staticmethod
+    def _update_event_rule_version(event_rule_vo: EventRule) -> None:
+        rule_key = (
+            f"{event_rule_vo.domain_id}:{event_rule_vo.workspace_id}:"
+            f"{event_rule_vo.project_id}"
+        )
+
+        cache.set(
+            cache_key.EVENT_RULE_VERSION.format(
+                domain_id=event_rule_vo.domain_id,
+                workspace_id=event_rule_vo.workspace_id,
+                project_id=event_rule_vo.project_id,
+            ),
+            utils.generate_id("version"),
+        )
+        event_rule_matcher.delete_rule_set(rule_key)
 
     def _get_project_event_rules(self, project_id, domain_id, workspace_id):
         query = {
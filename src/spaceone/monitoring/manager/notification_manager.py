@@ -1,9 +1,13 @@
+import functools
 import logging
 
+from spaceone.core import config
 from spaceone.core.auth.jwt.jwt_util import JWTUtil
 from spaceone.core.connector.space_connector import SpaceConnector
 from spaceone.core.manager import BaseManager
 
+from spaceone.monitoring.lib import notification_dispatcher
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -16,11 +20,47 @@ class NotificationManager(BaseManager):
             "SpaceConnector", service="notification"
         )
 
-    def create_notification(self, message: dict, domain_id: str) -> dict:
+    def create_notification(
+        self, message: dict, domain_id: str, urgency: str = None
+    ) -> dict:
         _LOGGER.debug(f"Notify message: {message}")
+
+        queue_size = config.get_global("NOTIFICATION_QUEUE_SIZE", 0)
+        if queue_size > 0:
+            dispatcher = notification_dispatcher.get_dispatcher(
+                queue_size,
+                config.get_global("NOTIFICATION_RATE_LIMIT", 0),
+                config.get_global("NOTIFICATION_BATCH_SIZE", 10),
+                config.get_global("NOTIFICATION_SHUTDOWN_TIMEOUT", 0),
+            )
+
+            # The token is captured now, because the transaction may be finished
+            # when the notification is sent.
+            send = functools.partial(
+                self._dispatch_notification,
+                message,
+                domain_id,
+                self.transaction.get_meta("token"),
+            )
+
+            if dispatcher.put(domain_id, urgency, send):
+                return {}
+
+            _LOGGER.warning(
+                f"[create_notification] Notification queue is full. "
+                f"Send notification synchronously. (domain_id = {domain_id})"
+            )
+
+        return self._dispatch_notification(message, domain_id)
+
+    def _dispatch_notification(
+        self, message: dict, domain_id: str, token: str = None
+    ) -> dict:
         if self.token_type == "SYSTEM_TOKEN":
             return self.notification_connector.dispatch(
-                "Notification.create", message, x_domain_id=domain_id
+                "Notification.create", message, token=token, x_domain_id=domain_id
             )
         else:
-            return self.notification_connector.dispatch("Notification.create", message)
+            return self.notification_connector.dispatch(
+                "Notification.create", message, token=token
+            )
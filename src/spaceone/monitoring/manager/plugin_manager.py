@@ -1,9 +1,12 @@
+import functools
 import logging
 
 from spaceone.core import config
 from spaceone.core.connector.space_connector import SpaceConnector
 from spaceone.core.manager import BaseManager
 
+from spaceone.monitoring.lib.endpoint_cache import get_endpoint_cache
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -15,18 +18,33 @@ class PluginManager(BaseManager):
         )
 
     def get_plugin_endpoint(self, plugin_info: dict, domain_id: str) -> (str, str):
+        params = {
+            "plugin_id": plugin_info["plugin_id"],
+            "version": plugin_info.get("version"),
+            "upgrade_mode": plugin_info.get("upgrade_mode", "AUTO"),
+            "domain_id": domain_id,
+        }
+
+        cache_ttl = config.get_global("PLUGIN_ENDPOINT_CACHE_TTL", 0)
+        if cache_ttl > 0:
+            endpoint_cache = get_endpoint_cache(
+                cache_ttl, config.get_global("PLUGIN_ENDPOINT_CACHE_MAX_STALE", 0)
+            )
+            response = endpoint_cache.get(
+                tuple(params.values()),
+                functools.partial(self._get_plugin_endpoint, params),
+            )
+        else:
+            response = self._get_plugin_endpoint(params)
+
+        return response["endpoint"], response.get("updated_version")
+
+    def _get_plugin_endpoint(self, params: dict) -> dict:
         system_token = config.get_global("TOKEN")
 
         response = self.plugin_connector.dispatch(
-            "Plugin.get_plugin_endpoint",
-            {
-                "plugin_id": plugin_info["plugin_id"],
-                "version": plugin_info.get("version"),
-                "upgrade_mode": plugin_info.get("upgrade_mode", "AUTO"),
-                "domain_id": domain_id,
-            },
-            token=system_token,
+            "Plugin.get_plugin_endpoint", params, token=system_token
         )
 
         _LOGGER.debug(f"[get_plugin_endpoint] response: {response}")
-        return response["endpoint"], response.get("updated_version")
+        return response
@@ -1,9 +1,9 @@
 import logging
 
-from spaceone.core import cache
 from spaceone.core.manager import BaseManager
 
 from spaceone.monitoring.error.project_alert_config import *
+from spaceone.monitoring.lib import cache, cache_key
 from spaceone.monitoring.model.project_alert_config_model import ProjectAlertConfig
 
 _LOGGER = logging.getLogger(__name__)
@@ -29,6 +29,11 @@ class ProjectAlertConfigManager(BaseManager):
         )
         self.transaction.add_rollback(_rollback, project_alert_config_vo)
 
+        # A missing config may have been cached for this project
+        self._delete_project_cache(
+            project_alert_config_vo.project_id, project_alert_config_vo.domain_id
+        )
+
         return project_alert_config_vo
 
     def update_project_alert_config(self, params):
@@ -51,15 +56,7 @@ class ProjectAlertConfigManager(BaseManager):
 
         updated_vo: ProjectAlertConfig = project_alert_config_vo.update(params)
 
-        cache.delete(
-            f"monitoring:alert:project-options:{updated_vo.domain_id}:{updated_vo.project_id}"
-        )
-        cache.delete(
-            f"monitoring:escalation-policy-info:{updated_vo.domain_id}:{updated_vo.project_id}"
-        )
-        cache.delete(
-            f"monitoring:auto-recovery:{updated_vo.domain_id}:{updated_vo.project_id}"
-        )
+        self._delete_project_cache(updated_vo.project_id, updated_vo.domain_id)
 
         return updated_vo
 
@@ -70,9 +67,7 @@ class ProjectAlertConfigManager(BaseManager):
             project_id, workspace_id, domain_id
         )
 
-        cache.delete(f"monitoring:alert:project-options:{domain_id}:{project_id}")
-        cache.delete(f"monitoring:escalation-policy-info:{domain_id}:{project_id}")
-        cache.delete(f"monitoring:auto-recovery:{domain_id}:{project_id}")
+        self._delete_project_cache(project_id, domain_id)
 
         project_alert_config_vo.delete()
 
@@ -90,8 +85,17 @@ class ProjectAlertConfigManager(BaseManager):
         except Exception as e:
             raise e
 
+    def filter_project_alert_configs(self, **conditions):
+        return self.project_alert_config_model.filter(**conditions)
+
     def list_project_alert_configs(self, query: dict) -> dict:
         return self.project_alert_config_model.query(**query)
 
     def stat_project_alert_configs(self, query: dict) -> dict:
         return self.project_alert_config_model.stat(**query)
+
+    @staticmethod
+    def _delete_project_cache(project_id: str, domain_id: str) -> None:
+        cache.delete_tags(
+            cache_key.PROJECT_TAG.format(domain_id=domain_id, project_id=project_id)
+        )
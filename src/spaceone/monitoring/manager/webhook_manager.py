@@ -1,8 +1,8 @@
 import logging
 
-from spaceone.core import cache
 from spaceone.core.manager import BaseManager
 
+from spaceone.monitoring.lib import cache, cache_key
 from spaceone.monitoring.model.webhook_model import Webhook
 
 _LOGGER = logging.getLogger(__name__)
@@ -48,7 +48,9 @@ class WebhookManager(BaseManager):
 
         updated_vo: Webhook = webhook_vo.update(params)
 
-        cache.delete(f"webhook-data:{updated_vo.webhook_id}")
+        cache.delete_tags(
+            cache_key.WEBHOOK_TAG.format(webhook_id=updated_vo.webhook_id)
+        )
 
         return updated_vo
 
@@ -63,7 +65,9 @@ class WebhookManager(BaseManager):
             webhook_id, domain_id, workspace_id, user_projects
         )
 
-        cache.delete(f"webhook-data:{webhook_vo.webhook_id}")
+        cache.delete_tags(
+            cache_key.WEBHOOK_TAG.format(webhook_id=webhook_vo.webhook_id)
+        )
 
         webhook_vo.delete()
 
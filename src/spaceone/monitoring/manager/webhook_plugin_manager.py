@@ -3,30 +3,39 @@ import logging
 from spaceone.core.connector.space_connector import SpaceConnector
 from spaceone.core.manager import BaseManager
 
+from spaceone.monitoring.lib.plugin_connector_pool import get_connector_pool
+
 _LOGGER = logging.getLogger(__name__)
 
 
 class WebhookPluginManager(BaseManager):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._plugin_connectors = {}
+
     def init_plugin(self, endpoint, options):
-        plugin_connector: SpaceConnector = self.locator.get_connector(
-            "SpaceConnector", endpoint=endpoint, token="NO_TOKEN"
-        )
-        return plugin_connector.dispatch("Webhook.init", {"options": options})
+        return self._dispatch(endpoint, "Webhook.init", {"options": options})
 
     def verify_plugin(self, endpoint, options):
-        plugin_connector: SpaceConnector = self.locator.get_connector(
-            "SpaceConnector", endpoint=endpoint, token="NO_TOKEN"
-        )
-        plugin_connector.dispatch("Webhook.verify", {"options": options})
+        self._dispatch(endpoint, "Webhook.verify", {"options": options})
 
     def parse_event(self, endpoint, options, data):
-        plugin_connector: SpaceConnector = self.locator.get_connector(
-            "SpaceConnector", endpoint=endpoint, token="NO_TOKEN"
-        )
-
         params = {
             "options": options,
             "data": data,
         }
 
-        return plugin_connector.dispatch("Event.parse", params)
+        return self._dispatch(endpoint, "Event.parse", params)
+
+    def _dispatch(self, endpoint: str, method: str, params: dict):
+        if connector_pool := get_connector_pool():
+            return connector_pool.dispatch(endpoint, method, params)
+
+        # Reuse the connector so that a batch of payloads shares one channel
+        if endpoint not in self._plugin_connectors:
+            self._plugin_connectors[endpoint] = self.locator.get_connector(
+                "SpaceConnector", endpoint=endpoint, token="NO_TOKEN"
+            )
+
+        plugin_connector: SpaceConnector = self._plugin_connectors[endpoint]
+        return plugin_connector.dispatch(method, params)
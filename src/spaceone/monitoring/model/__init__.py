@@ -2,6 +2,7 @@ from spaceone.monitoring.model.alert_model import Alert, AlertNumber
 from spaceone.monitoring.model.data_source_model import DataSource
 from spaceone.monitoring.model.escalation_policy_model import EscalationPolicy
 from spaceone.monitoring.model.event_model import Event
+from spaceone.monitoring.model.event_raw_data_model import EventRawData
 from spaceone.monitoring.model.event_rule_model import EventRule
 from spaceone.monitoring.model.job_model import Job
 from spaceone.monitoring.model.note_model import Note
@@ -17,6 +17,15 @@ class AlertNumber(MongoModel):
     workspace_id = StringField(max_length=40)
     domain_id = StringField(max_length=40)
 
+    meta = {
+        "indexes": [
+            {
+                "fields": ["domain_id", "workspace_id"],
+                "name": "COMPOUND_INDEX_FOR_ALERT_NUMBER",
+            },
+        ],
+    }
+
 
 class Alert(MongoModel):
     alert_number = IntField(required=True)
@@ -56,6 +65,7 @@ class Alert(MongoModel):
     acknowledged_at = DateTimeField(default=None, null=True)
     resolved_at = DateTimeField(default=None, null=True)
     escalated_at = DateTimeField(default=None, null=True)
+    next_escalation_at = DateTimeField(default=None, null=True)
 
     meta = {
         "updatable_fields": [
@@ -72,6 +82,7 @@ class Alert(MongoModel):
             "acknowledged_at",
             "resolved_at",
             "escalated_at",
+            "next_escalation_at",
         ],
         "minimal_fields": [
             "alert_number",
@@ -124,5 +135,24 @@ class Alert(MongoModel):
                 ],
                 "name": "COMPOUND_INDEX_FOR_ESCALATION",
             },
+            {
+                "fields": [
+                    "domain_id",
+                    "state",
+                    "next_escalation_at",
+                    "escalation_ttl",
+                ],
+                "name": "COMPOUND_INDEX_FOR_ESCALATION_SCHEDULE",
+            },
+            {
+                # Distinct domains of due alerts (JobService.create_jobs_by_domain)
+                "fields": [
+                    "state",
+                    "next_escalation_at",
+                    "escalation_ttl",
+                    "domain_id",
+                ],
+                "name": "COMPOUND_INDEX_FOR_ESCALATION_DOMAINS",
+            },
         ],
     }
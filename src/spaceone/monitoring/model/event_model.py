@@ -1,6 +1,8 @@
 from mongoengine import *
 from spaceone.core.model.mongo_model import MongoModel
 
+from spaceone.monitoring.model.event_raw_data_model import EventRawData
+
 
 class Event(MongoModel):
     event_id = StringField(max_length=40, generate_id="event", unique=True)
@@ -21,6 +23,7 @@ class Event(MongoModel):
     provider = StringField(default=None, null=True)
     account = StringField(default=None, null=True)
     raw_data = DictField()
+    raw_data_hash = StringField(max_length=64, default=None, null=True)
     additional_info = DictField()
     alert = ReferenceField("Alert", reverse_delete_rule=CASCADE)
     alert_id = StringField(max_length=40)
@@ -63,5 +66,22 @@ class Event(MongoModel):
             "domain_id",
             "created_at",
             "occurred_at",
+            {
+                "fields": [
+                    "domain_id",
+                    "workspace_id",
+                    "project_id",
+                    "event_key",
+                    "-created_at",
+                ],
+                "name": "COMPOUND_INDEX_FOR_DUPLICATE_EVENT",
+            },
         ],
     }
+
+    def get_raw_data(self) -> dict:
+        if self.raw_data_hash:
+            raw_data_by_hash = EventRawData.get_data_by_hashes([self.raw_data_hash])
+            return raw_data_by_hash.get(self.raw_data_hash, self.raw_data)
+
+        return self.raw_data
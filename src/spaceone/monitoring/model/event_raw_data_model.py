@@ -0,0 +1,39 @@
+import json
+import zlib
+from typing import Dict, List
+
+from mongoengine import *
+
+from spaceone.core.model.mongo_model import MongoModel
+
+
+class EventRawData(MongoModel):
+    raw_data_hash = StringField(max_length=64, unique=True)
+    data = BinaryField()
+    compression = StringField(max_length=20, default="ZLIB", choices=("ZLIB",))
+    domain_id = StringField(max_length=40)
+    created_at = DateTimeField(auto_now_add=True)
+
+    meta = {
+        "updatable_fields": [],
+        "indexes": [
+            # 'raw_data_hash',
+            "domain_id",
+            "created_at",
+        ],
+    }
+
+    @staticmethod
+    def compress(raw_data_json: str) -> bytes:
+        return zlib.compress(raw_data_json.encode("utf-8"))
+
+    def get_data(self) -> dict:
+        return json.loads(zlib.decompress(self.data).decode("utf-8"))
+
+    @classmethod
+    def get_data_by_hashes(cls, raw_data_hashes: List[str]) -> Dict[str, dict]:
+        raw_data_vos = cls.objects(raw_data_hash__in=list(set(raw_data_hashes)))
+        return {
+            raw_data_vo.raw_data_hash: raw_data_vo.get_data()
+            for raw_data_vo in raw_data_vos
+        }
@@ -1,9 +1,10 @@
 import logging
 from datetime import datetime
-from spaceone.core import utils, cache
+from spaceone.core import utils
 from spaceone.core.service import *
 
 from spaceone.monitoring.error.alert import *
+from spaceone.monitoring.lib import cache, cache_key
 from spaceone.monitoring.manager.alert_manager import AlertManager
 from spaceone.monitoring.manager.event_manager import EventManager
 from spaceone.monitoring.manager.job_manager import JobManager
@@ -146,6 +147,7 @@ class AlertService(BaseService):
             params["escalation_ttl"] = escalation_policy_vo.repeat_count
             params["escalation_step"] = 1
             params["escalated_at"] = None
+            params["next_escalation_at"] = None
 
         if state:
             if state == "ACKNOWLEDGED":
@@ -288,10 +290,7 @@ class AlertService(BaseService):
             "domain_settings": domain_settings,
         }
 
-    @cache.cacheable(
-        key="monitoring:escalation-policy-name:{domain_id}:{escalation_policy_id}",
-        expire=600,
-    )
+    @cache.cacheable(cache_key.ESCALATION_POLICY_NAME)
     def _get_escalation_policy_name(
         self, escalation_policy_id: str, domain_id: str
     ) -> str:
@@ -310,7 +309,7 @@ class AlertService(BaseService):
             escalation_policy_vo = escalation_policy_vos[0]
             return escalation_policy_vo.name
 
-    @cache.cacheable(key="monitoring:project-name:{domain_id}:{project_id}", expire=600)
+    @cache.cacheable(cache_key.PROJECT_NAME)
     def _get_project_name(self, project_id: str, domain_id: str) -> str:
         try:
             identity_mgr: IdentityManager = self.locator.get_manager(IdentityManager)
@@ -331,7 +330,7 @@ class AlertService(BaseService):
 
             return ""
 
-    @cache.cacheable(key="monitoring:domain-settings:{domain_id}", expire=600)
+    @cache.cacheable(cache_key.DOMAIN_SETTINGS)
     def _get_domain_settings(self, domain_id: str) -> dict:
         try:
             config_mgr: ConfigManager = self.locator.get_manager("ConfigManager")
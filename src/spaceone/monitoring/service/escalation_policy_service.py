@@ -3,6 +3,7 @@ import logging
 from spaceone.core.service import *
 
 from spaceone.monitoring.error.escalation_policy import *
+from spaceone.monitoring.manager.alert_manager import AlertManager
 from spaceone.monitoring.manager.escalation_policy_manager import (
     EscalationPolicyManager,
 )
@@ -101,10 +102,21 @@ class EscalationPolicyService(BaseService):
         escalation_policy_vo = self.escalation_policy_mgr.get_escalation_policy(
             escalation_policy_id, workspace_id, domain_id, user_projects
         )
-        return self.escalation_policy_mgr.update_escalation_policy_by_vo(
-            params, escalation_policy_vo
+        escalation_policy_vo = (
+            self.escalation_policy_mgr.update_escalation_policy_by_vo(
+                params, escalation_policy_vo
+            )
         )
 
+        # next_escalation_at of open alerts is calculated with the old rules
+        if "rules" in params:
+            alert_mgr: AlertManager = self.locator.get_manager("AlertManager")
+            alert_mgr.reset_escalation_schedule_by_policy(
+                escalation_policy_id, domain_id
+            )
+
+        return escalation_policy_vo
+
     @transaction(
         permission="monitoring:EscalationPolicy.write",
         role_types=["WORKSPACE_OWNER", "WORKSPACE_MEMBER"],
@@ -1,11 +1,12 @@
-import copy
 import logging
 from datetime import datetime
+from typing import Union
 
-from spaceone.core import utils, cache, config
+from spaceone.core import utils, config
 from spaceone.core.service import *
 
 from spaceone.monitoring.error.webhook import *
+from spaceone.monitoring.lib import cache, cache_key
 from spaceone.monitoring.manager import PluginManager
 from spaceone.monitoring.manager.alert_manager import AlertManager
 from spaceone.monitoring.manager.event_manager import EventManager
@@ -21,12 +22,26 @@ from spaceone.monitoring.manager.escalation_policy_manager import (
 )
 from spaceone.monitoring.model.alert_model import Alert
 from spaceone.monitoring.model.escalation_policy_model import EscalationPolicy
-from spaceone.monitoring.model.event_model import Event
 from spaceone.monitoring.model.project_alert_config_model import ProjectAlertConfig
 from spaceone.monitoring.model.webhook_model import Webhook
 
 _LOGGER = logging.getLogger(__name__)
 
+_ALERT_KEYS_FROM_EVENT = [
+    "title",
+    "description",
+    "assignee",
+    "severity",
+    "rule",
+    "image_url",
+    "provider",
+    "account",
+    "webhook_id",
+    "project_id",
+    "workspace_id",
+    "domain_id",
+]
+
 
 @authentication_handler
 @authorization_handler
@@ -43,6 +58,9 @@ class EventService(BaseService):
         self.webhook_plugin_mgr: WebhookPluginManager = self.locator.get_manager(
             WebhookPluginManager
         )
+        self.event_rule_mgr: EventRuleManager = self.locator.get_manager(
+            EventRuleManager
+        )
 
     @transaction(exclude=["authentication", "authorization", "mutation"])
     @check_required(["webhook_id", "access_key", "data"])
@@ -65,66 +83,133 @@ class EventService(BaseService):
         self._check_access_key(params["access_key"], webhook_data["access_key"])
         self._check_webhook_state(webhook_data)
 
-        webhook_id = webhook_data["webhook_id"]
-        domain_id = webhook_data["domain_id"]
-        workspace_id = webhook_data["workspace_id"]
-        plugin_metadata = webhook_data["plugin_metadata"]
-
-        webhook_vo = self.webhook_mgr.get_webhook(webhook_id, domain_id, workspace_id)
+        webhook_vo = self.webhook_mgr.get_webhook(
+            webhook_data["webhook_id"],
+            webhook_data["domain_id"],
+            webhook_data["workspace_id"],
+        )
         webhook_vo.increment("requests.total")
+        self._prefetch_project_data(webhook_data)
 
         try:
-            webhook_plugin_mgr: WebhookPluginManager = self.locator.get_manager(
-                WebhookPluginManager
+            endpoint = self._get_plugin_endpoint(webhook_data)
+            response = self.webhook_plugin_mgr.parse_event(
+                endpoint, webhook_data["plugin_options"], params["data"]
             )
 
-            plugin_info = {
-                "plugin_id": webhook_data["plugin_id"],
-                "version": webhook_data["plugin_version"],
-                "upgrade_mode": webhook_data["plugin_upgrade_mode"],
+            # Test Code
+            # response = {"results": [params["data"]]}
+
+        except Exception as e:
+            response = self._handle_parsing_error(e, webhook_vo, webhook_data)
+
+        events = self._make_events(response, params["data"], webhook_data, {})
+        self.event_mgr.create_events(events)
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    @check_required(["webhook_id", "access_key", "data_list"])
+    def create_batch(self, params: dict) -> None:
+        """Create events from a batch of raw webhook payloads
+
+        Args:
+            params (dict): {
+                'webhook_id': 'str',    # required
+                'access_key': 'str',    # required
+                'data_list': 'list'     # required
             }
-            plugin_mgr: PluginManager = self.locator.get_manager(PluginManager)
-            endpoint, updated_version = plugin_mgr.get_plugin_endpoint(
-                plugin_info, webhook_data["domain_id"]
-            )
 
-            if updated_version:
-                _LOGGER.debug(
-                    f'[create] upgrade plugin version: {webhook_data["plugin_version"]} -> {updated_version}'
-                )
-                webhook_vo: Webhook = self.webhook_mgr.get_webhook(
-                    webhook_data["webhook_id"], webhook_data["domain_id"]
-                )
+        Returns:
+            None
+        """
 
-                plugin_info = webhook_vo.plugin_info.to_dict()
-                plugin_metadata = self.webhook_plugin_mgr.init_plugin(
-                    endpoint, plugin_info.get("options", {})
-                )
-                plugin_info["version"] = updated_version
-                plugin_info["metadata"] = plugin_metadata
-                webhook_data["metadata"] = plugin_metadata
-                self.webhook_mgr.update_webhook_by_vo(
-                    {"plugin_info": plugin_info}, webhook_vo
+        data_list = params["data_list"]
+
+        if not isinstance(data_list, list):
+            raise ERROR_INVALID_PARAMETER_TYPE(key="data_list", type="list")
+
+        webhook_data = self._get_webhook_data(params["webhook_id"])
+
+        self._check_access_key(params["access_key"], webhook_data["access_key"])
+        self._check_webhook_state(webhook_data)
+
+        if len(data_list) == 0:
+            return None
+
+        webhook_vo = self.webhook_mgr.get_webhook(
+            webhook_data["webhook_id"],
+            webhook_data["domain_id"],
+            webhook_data["workspace_id"],
+        )
+        webhook_vo.increment("requests.total", len(data_list))
+        self._prefetch_project_data(webhook_data)
+
+        events = []
+        pending_alerts = {}
+
+        try:
+            endpoint = self._get_plugin_endpoint(webhook_data)
+        except Exception as e:
+            response = self._handle_parsing_error(
+                e, webhook_vo, webhook_data, len(data_list)
+            )
+            events = self._make_events(response, {}, webhook_data, pending_alerts)
+            self.event_mgr.create_events(events)
+            return None
+
+        for data in data_list:
+            try:
+                response = self.webhook_plugin_mgr.parse_event(
+                    endpoint, webhook_data["plugin_options"], data
                 )
+            except Exception as e:
+                response = self._handle_parsing_error(e, webhook_vo, webhook_data)
 
-            response = webhook_plugin_mgr.parse_event(
-                endpoint, webhook_data["plugin_options"], params["data"]
+            events.extend(
+                self._make_events(response, data, webhook_data, pending_alerts)
             )
 
-            # Test Code
-            # response = {"results": [params["data"]]}
+        self.event_mgr.create_events(events)
 
-        except Exception as e:
-            if not isinstance(e, ERROR_BASE):
-                e = ERROR_UNKNOWN(message=str(e))
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    @check_required(["webhook_id", "access_key", "data_list"])
+    def enqueue(self, params: dict) -> None:
+        """Validate webhook request and push raw payloads to the queue
 
-            _LOGGER.error(f"[create] Event parsing failed: {e.message}", exc_info=True)
-            webhook_vo.increment("requests.error")
-            response = self._create_error_event(webhook_data["name"], e.message)
+        Args:
+            params (dict): {
+                'webhook_id': 'str',    # required
+                'access_key': 'str',    # required
+                'data_list': 'list'     # required
+            }
 
-        for event_data in response.get("results", []):
-            _LOGGER.debug(f"[Event.create] event_data: {event_data}")
-            self._create_event(event_data, params["data"], webhook_data)
+        Returns:
+            None
+        """
+
+        data_list = params["data_list"]
+
+        if not isinstance(data_list, list):
+            raise ERROR_INVALID_PARAMETER_TYPE(key="data_list", type="list")
+
+        webhook_data = self._get_webhook_data(params["webhook_id"])
+
+        self._check_access_key(params["access_key"], webhook_data["access_key"])
+        self._check_webhook_state(webhook_data)
+
+        if len(data_list) == 0:
+            return None
+
+        job_mgr: JobManager = self.locator.get_manager("JobManager")
+        job_mgr.push_task(
+            "monitoring_event_from_webhook",
+            "EventService",
+            "create_batch",
+            {
+                "webhook_id": params["webhook_id"],
+                "access_key": params["access_key"],
+                "data_list": data_list,
+            },
+        )
 
     @transaction(
         permission="monitoring:Event.read",
@@ -225,7 +310,7 @@ class EventService(BaseService):
         query = params.get("query", {})
         return self.event_mgr.stat_events(query)
 
-    @cache.cacheable(key="monitoring:webhook-data:{webhook_id}", expire=300)
+    @cache.cacheable(cache_key.WEBHOOK_DATA)
     def _get_webhook_data(self, webhook_id):
         webhook_vo: Webhook = self.webhook_mgr.get_webhook_by_id(webhook_id)
         return {
@@ -243,6 +328,25 @@ class EventService(BaseService):
             "plugin_metadata": webhook_vo.plugin_info.metadata,
         }
 
+    @staticmethod
+    def _prefetch_project_data(webhook_data: dict) -> None:
+        # Keys read while processing events of the webhook project
+        key_params = {
+            "domain_id": webhook_data["domain_id"],
+            "workspace_id": webhook_data["workspace_id"],
+            "project_id": webhook_data["project_id"],
+        }
+
+        cache.prefetch(
+            [
+                cache_key.EVENT_RULE_VERSION.format(**key_params),
+                cache_key.ESCALATION_POLICY_INFO.format(
+                    escalation_policy_id="", **key_params
+                ),
+                cache_key.AUTO_RECOVERY.format(**key_params),
+            ]
+        )
+
     @staticmethod
     def _check_access_key(request_access_key, webhook_access_key):
         if request_access_key != webhook_access_key:
@@ -253,10 +357,67 @@ class EventService(BaseService):
         if webhook_data["state"] == "DISABLED":
             raise ERROR_WEBHOOK_STATE_DISABLED(webhook_id=webhook_data["webhook_id"])
 
-    def _create_event(self, event_data, raw_data, webhook_data):
+    def _get_plugin_endpoint(self, webhook_data: dict) -> str:
+        plugin_info = {
+            "plugin_id": webhook_data["plugin_id"],
+            "version": webhook_data["plugin_version"],
+            "upgrade_mode": webhook_data["plugin_upgrade_mode"],
+        }
+        plugin_mgr: PluginManager = self.locator.get_manager(PluginManager)
+        endpoint, updated_version = plugin_mgr.get_plugin_endpoint(
+            plugin_info, webhook_data["domain_id"]
+        )
+
+        if updated_version:
+            _LOGGER.debug(
+                f'[_get_plugin_endpoint] upgrade plugin version: {webhook_data["plugin_version"]} -> {updated_version}'
+            )
+            webhook_vo: Webhook = self.webhook_mgr.get_webhook(
+                webhook_data["webhook_id"], webhook_data["domain_id"]
+            )
+
+            plugin_info = webhook_vo.plugin_info.to_dict()
+            plugin_metadata = self.webhook_plugin_mgr.init_plugin(
+                endpoint, plugin_info.get("options", {})
+            )
+            plugin_info["version"] = updated_version
+            plugin_info["metadata"] = plugin_metadata
+            self.webhook_mgr.update_webhook_by_vo(
+                {"plugin_info": plugin_info}, webhook_vo
+            )
+
+        return endpoint
+
+    def _handle_parsing_error(
+        self, e: Exception, webhook_vo: Webhook, webhook_data: dict, count: int = 1
+    ) -> dict:
+        if not isinstance(e, ERROR_BASE):
+            e = ERROR_UNKNOWN(message=str(e))
+
+        _LOGGER.error(f"[create] Event parsing failed: {e.message}", exc_info=True)
+        webhook_vo.increment("requests.error", count)
+        return self._create_error_event(webhook_data["name"], e.message)
+
+    def _make_events(
+        self, response: dict, raw_data: dict, webhook_data: dict, pending_alerts: dict
+    ) -> list:
+        events = []
+        for event_data in response.get("results", []):
+            _LOGGER.debug(f"[_make_events] event_data: {event_data}")
+            event_params = self._create_event(
+                event_data, raw_data, webhook_data, pending_alerts
+            )
+
+            if event_params:
+                events.append(event_params)
+
+        return events
+
+    def _create_event(self, event_data, raw_data, webhook_data, pending_alerts):
         plugin_metadata = webhook_data.get("plugin_metadata", {})
 
-        event_data["raw_data"] = copy.deepcopy(raw_data)
+        # The raw payload is shared by all events parsed from the same request
+        event_data["raw_data"] = raw_data
         event_data["occurred_at"] = utils.iso8601_to_datetime(
             event_data.get("occurred_at")
         )
@@ -277,29 +438,37 @@ class EventService(BaseService):
 
             del event_data["resource"]
 
-        event_rule_mgr: EventRuleManager = self.locator.get_manager("EventRuleManager")
-
         # Change event data by event rule
-        event_data = event_rule_mgr.change_event_data(
+        event_data = self.event_rule_mgr.change_event_data(
             event_data,
             webhook_data["project_id"],
             webhook_data["domain_id"],
             webhook_data["workspace_id"],
         )
 
-        event_vo: Event = self.event_mgr.get_event_by_key(
-            event_data["event_key"],
-            event_data["domain_id"],
-            event_data["project_id"],
-            event_data["workspace_id"],
-            plugin_metadata.get("duplicate_event_time"),
+        # Events of the same request are not stored yet, so check them first
+        pending_key = (
+            f'{event_data["workspace_id"]}:{event_data["project_id"]}:'
+            f'{event_data["event_key"]}'
         )
 
-        if event_vo and event_vo.alert.state != "RESOLVED":
-            self._update_alert(event_vo.alert, event_data)
+        if pending_key in pending_alerts:
+            alert_vo: Alert = pending_alerts[pending_key]
+        else:
+            event_key_index = self.event_mgr.get_event_key_index(
+                event_data["event_key"],
+                event_data["domain_id"],
+                event_data["project_id"],
+                event_data["workspace_id"],
+                plugin_metadata.get("duplicate_event_time"),
+            )
+            alert_vo = self._get_open_alert(event_key_index, event_data["domain_id"])
+
+        if alert_vo and alert_vo.state != "RESOLVED":
+            self._update_alert(alert_vo, event_data)
 
-            event_data["alert_id"] = event_vo.alert_id
-            event_data["alert"] = event_vo.alert
+            event_data["alert_id"] = alert_vo.alert_id
+            event_data["alert"] = alert_vo
         else:
             # Skip health event
             if event_data["event_type"] == "RECOVERY":
@@ -318,13 +487,31 @@ class EventService(BaseService):
             event_data["alert_id"] = alert_vo.alert_id
             event_data["alert"] = alert_vo
 
-        self.event_mgr.create_event(event_data)
+        if event_data["event_type"] != "RECOVERY":
+            pending_alerts[pending_key] = event_data["alert"]
+
+        return event_data
+
+    def _get_open_alert(
+        self, event_key_index: Union[dict, None], domain_id: str
+    ) -> Union[Alert, None]:
+        # Resolved alerts are known from the index, so they are not loaded
+        if not event_key_index or event_key_index["alert_state"] in [None, "RESOLVED"]:
+            return None
+
+        alert_mgr: AlertManager = self.locator.get_manager("AlertManager")
+        return alert_mgr.filter_alerts(
+            alert_id=event_key_index["alert_id"], domain_id=domain_id
+        ).first()
 
     # create alert by system
     def _create_alert(self, event_data):
         alert_mgr: AlertManager = self.locator.get_manager("AlertManager")
 
-        alert_data = copy.deepcopy(event_data)
+        alert_data = {
+            key: event_data[key] for key in _ALERT_KEYS_FROM_EVENT if key in event_data
+        }
+        alert_data["additional_info"] = dict(event_data.get("additional_info", {}))
 
         if "urgency" in event_data:
             alert_data["urgency"] = event_data["urgency"]
@@ -333,10 +520,10 @@ class EventService(BaseService):
                 event_data["severity"]
             )
 
-        if "resources" in alert_data:
+        if "resources" in event_data:
             # Find cloud service from resources
             alert_resources = []
-            for resource in alert_data["resources"]:
+            for resource in event_data["resources"]:
                 alert_resources.append(
                     {
                         "name": resource,
@@ -378,10 +565,7 @@ class EventService(BaseService):
         else:
             return "LOW"
 
-    @cache.cacheable(
-        key="monitoring:escalation-policy-info:{domain_id}:{workspace_id}:{project_id}:{escalation_policy_id}",
-        expire=300,
-    )
+    @cache.cacheable(cache_key.ESCALATION_POLICY_INFO)
     def _get_escalation_policy_info(
         self,
         project_id: str,
@@ -444,9 +628,7 @@ class EventService(BaseService):
         else:
             return False
 
-    @cache.cacheable(
-        key="monitoring:auto-recovery:{domain_id}:{project_id}", expire=300
-    )
+    @cache.cacheable(cache_key.AUTO_RECOVERY)
     def _is_auto_recovery(self, project_id, workspace_id, domain_id):
         project_alert_config_vo: ProjectAlertConfig = self._get_project_alert_config(
             project_id, workspace_id, domain_id
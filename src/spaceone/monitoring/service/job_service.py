@@ -1,10 +1,12 @@
 import logging
 from datetime import timedelta, datetime
-from typing import Union
+from typing import Tuple, Union
 
-from spaceone.core import cache, config, utils
+from spaceone.core import config, utils
 from spaceone.core.service import *
 
+from spaceone.monitoring.lib import cache, cache_key
+
 from spaceone.monitoring.manager.alert_manager import AlertManager
 from spaceone.monitoring.manager.escalation_policy_manager import (
     EscalationPolicyManager,
@@ -76,15 +78,46 @@ class JobService(BaseService):
         job_vo = self.job_mgr.create_job(domain_id)
         try:
             alert_vos, total_count = self._list_open_alerts(domain_id)
+            alert_ids = [alert_vo.alert_id for alert_vo in alert_vos]
+            chunk_size = config.get_global("ALERT_JOB_CHUNK_SIZE", 1)
+
+            if total_count == 0:
+                job_vo.delete()
+            elif chunk_size > 1:
+                alert_id_chunks = [
+                    alert_ids[i : i + chunk_size]
+                    for i in range(0, len(alert_ids), chunk_size)
+                ]
+                job_vo.update(
+                    {
+                        "total_tasks": len(alert_id_chunks),
+                        "remained_tasks": len(alert_id_chunks),
+                    }
+                )
 
-            if total_count > 0:
+                for alert_id_chunk in alert_id_chunks:
+                    _LOGGER.debug(
+                        f"[create_job] Push task (JobService.create_alert_notifications): "
+                        f"{len(alert_id_chunk)} alerts"
+                    )
+                    self.job_mgr.push_task(
+                        "monitoring_alert_notification_from_scheduler",
+                        "JobService",
+                        "create_alert_notifications",
+                        {
+                            "job_id": job_vo.job_id,
+                            "alert_ids": alert_id_chunk,
+                            "domain_id": domain_id,
+                        },
+                    )
+            else:
                 job_vo.update(
                     {"total_tasks": total_count, "remained_tasks": total_count}
                 )
 
-                for alert_vo in alert_vos:
+                for alert_id in alert_ids:
                     _LOGGER.debug(
-                        f"[create_job] Push task (JobService.create_notification): {alert_vo.alert_id}"
+                        f"[create_job] Push task (JobService.create_notification): {alert_id}"
                     )
                     self.job_mgr.push_task(
                         "monitoring_alert_notification_from_scheduler",
@@ -92,12 +125,10 @@ class JobService(BaseService):
                         "create_alert_notification",
                         {
                             "job_id": job_vo.job_id,
-                            "alert_id": alert_vo.alert_id,
-                            "domain_id": alert_vo.domain_id,
+                            "alert_id": alert_id,
+                            "domain_id": domain_id,
                         },
                     )
-            else:
-                job_vo.delete()
         except Exception as e:
             self.job_mgr.change_error_status(job_vo, e)
             self.transaction.execute_rollback()
@@ -125,6 +156,7 @@ class JobService(BaseService):
         alert_mgr: AlertManager = self.locator.get_manager("AlertManager")
 
         alert_vo: Alert = alert_mgr.get_alert(alert_id, domain_id)
+        self._prefetch_alert_data(alert_vo)
 
         title = f"[Assigned to me] {alert_vo.title}"
 
@@ -133,7 +165,9 @@ class JobService(BaseService):
         )
         message = self._create_message(alert_vo, title, "INFO", user_id=user_id)
 
-        notification_mgr.create_notification(message, domain_id)
+        notification_mgr.create_notification(
+            message, domain_id, urgency=alert_vo.urgency
+        )
 
     @transaction
     @check_required(["alert_id", "domain_id"])
@@ -156,7 +190,8 @@ class JobService(BaseService):
         alert_mgr: AlertManager = self.locator.get_manager("AlertManager")
 
         alert_vo: Alert = alert_mgr.get_alert(alert_id, domain_id)
-        project_id = alert_vo.project_id
+        self._prefetch_alert_data(alert_vo)
+
         workspace_id = alert_vo.workspace_id
         escalation_policy_id = alert_vo.escalation_policy_id
 
@@ -169,17 +204,20 @@ class JobService(BaseService):
 
         title = f"[Resolved] {alert_vo.title}"
 
+        notification_mgr: NotificationManager = self.locator.get_manager(
+            "NotificationManager"
+        )
+
         for step in range(alert_vo.escalation_step):
             notification_level = rules[step]["notification_level"]
 
-            notification_mgr: NotificationManager = self.locator.get_manager(
-                "NotificationManager"
-            )
             message = self._create_message(
                 alert_vo, title, "SUCCESS", notification_level=notification_level
             )
 
-            notification_mgr.create_notification(message, domain_id)
+            notification_mgr.create_notification(
+                message, domain_id, urgency=alert_vo.urgency
+            )
 
     @transaction
     @check_required(["alert_id", "domain_id"])
@@ -207,6 +245,8 @@ class JobService(BaseService):
             alert_mgr: AlertManager = self.locator.get_manager(AlertManager)
 
             alert_vo: Alert = alert_mgr.get_alert(alert_id, domain_id)
+            self._prefetch_alert_data(alert_vo)
+
             project_id = alert_vo.project_id
             workspace_id = alert_vo.workspace_id
             escalation_policy_id = alert_vo.escalation_policy_id
@@ -221,9 +261,10 @@ class JobService(BaseService):
                 escalation_policy_id, workspace_id, domain_id
             )
 
-            # Check Notification Urgency and Finish Condition
+            # Check Project Alert Config, Notification Urgency and Finish Condition
             if not (
-                self._check_notification_options(
+                self._check_project_alert_options(alert_id, alert_options)
+                and self._check_notification_options(
                     alert_vo.urgency, alert_id, alert_options
                 )
                 and self._check_finish_condition(
@@ -252,7 +293,9 @@ class JobService(BaseService):
                         notification_level=notification_level,
                         has_callback=True,
                     )
-                    notification_mgr.create_notification(message, domain_id)
+                    notification_mgr.create_notification(
+                        message, domain_id, urgency=alert_vo.urgency
+                    )
 
             if job_id:
                 job_vo = self.job_mgr.get_job(job_id, domain_id)
@@ -265,6 +308,208 @@ class JobService(BaseService):
             _LOGGER.error(f"[create_notification] Job Error: {e}", exc_info=True)
             self.transaction.execute_rollback()
 
+    @transaction
+    @check_required(["alert_ids", "domain_id"])
+    def create_alert_notifications(self, params):
+        """Create alert notifications for a chunk of alerts
+
+        Args:
+            params (dict): {
+                'job_id': 'str',
+                'alert_ids': 'list',
+                'domain_id': 'str'
+            }
+
+        Returns:
+            None
+        """
+
+        job_id = params.get("job_id")
+        alert_ids = params["alert_ids"]
+        domain_id = params["domain_id"]
+
+        try:
+            alert_mgr: AlertManager = self.locator.get_manager(AlertManager)
+            alert_vos = list(
+                alert_mgr.filter_alerts(alert_id=alert_ids, domain_id=domain_id)
+            )
+
+            policies_info = self._get_escalation_policies_info(alert_vos, domain_id)
+            alert_options_info = self._get_project_alert_options_info(
+                alert_vos, domain_id
+            )
+
+            updates = []
+            notify_alert_vos = []
+            for alert_vo in alert_vos:
+                policy_info = policies_info.get(alert_vo.escalation_policy_id)
+                alert_options = alert_options_info.get(
+                    (alert_vo.workspace_id, alert_vo.project_id)
+                )
+
+                if policy_info is None:
+                    # Otherwise the alert would be selected again on every run
+                    _LOGGER.warning(
+                        f"[create_alert_notifications] Stop escalation. Escalation "
+                        f"policy is not found. (alert_id = {alert_vo.alert_id}, "
+                        f"escalation_policy_id = {alert_vo.escalation_policy_id})"
+                    )
+                    updates.append((alert_vo, {"escalation_ttl": 0}))
+                    continue
+
+                rules, finish_condition = policy_info
+
+                # Check Project Alert Config, Notification Urgency and Finish Condition
+                if not (
+                    self._check_project_alert_options(alert_vo.alert_id, alert_options)
+                    and self._check_notification_options(
+                        alert_vo.urgency, alert_vo.alert_id, alert_options
+                    )
+                    and self._check_finish_condition(
+                        alert_vo.state, alert_vo.alert_id, finish_condition
+                    )
+                ):
+                    updates.append((alert_vo, {"escalation_ttl": 0}))
+                    continue
+
+                is_notify, update_params = self._get_escalation_params(alert_vo, rules)
+
+                if update_params:
+                    updates.append((alert_vo, update_params))
+
+                if is_notify:
+                    notify_alert_vos.append((alert_vo, rules))
+
+            # Updated values are also set on the alert objects
+            alert_mgr.update_alerts_by_bulk(updates)
+
+            cache.prefetch(
+                [
+                    cache_key.ALERT_MESSAGE.format(
+                        domain_id=domain_id, alert_id=alert_vo.alert_id
+                    )
+                    for alert_vo, rules in notify_alert_vos
+                ]
+            )
+
+            notification_mgr: NotificationManager = self.locator.get_manager(
+                "NotificationManager"
+            )
+            for alert_vo, rules in notify_alert_vos:
+                title = f"[Alerting] {alert_vo.title}"
+                current_rule = rules[alert_vo.escalation_step - 1]
+                message = self._create_message(
+                    alert_vo,
+                    title,
+                    "ERROR",
+                    notification_level=current_rule["notification_level"],
+                    has_callback=True,
+                )
+                notification_mgr.create_notification(
+                    message, domain_id, urgency=alert_vo.urgency
+                )
+
+            if job_id:
+                job_vo = self.job_mgr.get_job(job_id, domain_id)
+                self.job_mgr.decrease_remained_tasks(job_vo)
+        except Exception as e:
+            if job_id:
+                job_vo = self.job_mgr.get_job(job_id, domain_id)
+                self.job_mgr.change_error_status(job_vo, e)
+
+            _LOGGER.error(
+                f"[create_alert_notifications] Job Error: {e}", exc_info=True
+            )
+            self.transaction.execute_rollback()
+
+    def _get_escalation_policies_info(self, alert_vos: list, domain_id: str) -> dict:
+        escalation_policy_mgr: EscalationPolicyManager = self.locator.get_manager(
+            "EscalationPolicyManager"
+        )
+
+        escalation_policy_ids = list(
+            set([alert_vo.escalation_policy_id for alert_vo in alert_vos])
+        )
+        escalation_policy_vos = escalation_policy_mgr.filter_escalation_policies(
+            escalation_policy_id=escalation_policy_ids, domain_id=domain_id
+        )
+
+        policies_info = {}
+        for escalation_policy_vo in escalation_policy_vos:
+            rules = [dict(rule.to_dict()) for rule in escalation_policy_vo.rules]
+            policies_info[escalation_policy_vo.escalation_policy_id] = (
+                rules,
+                escalation_policy_vo.finish_condition,
+            )
+
+        return policies_info
+
+    def _get_project_alert_options_info(self, alert_vos: list, domain_id: str) -> dict:
+        """Returns alert options of the projects of alerts.
+
+        Returns:
+            alert_options_info (dict): {(workspace_id, project_id): options}
+        """
+        project_alert_config_mgr: ProjectAlertConfigManager = self.locator.get_manager(
+            "ProjectAlertConfigManager"
+        )
+
+        project_ids = list(set([alert_vo.project_id for alert_vo in alert_vos]))
+        workspace_ids = list(set([alert_vo.workspace_id for alert_vo in alert_vos]))
+        project_alert_config_vos = (
+            project_alert_config_mgr.filter_project_alert_configs(
+                project_id=project_ids, workspace_id=workspace_ids, domain_id=domain_id
+            )
+        )
+
+        # A project ID can be reused in another workspace
+        alert_options_info = {}
+        for config_vo in project_alert_config_vos:
+            key = (config_vo.workspace_id, config_vo.project_id)
+            alert_options_info[key] = dict(config_vo.options.to_dict())
+
+        return alert_options_info
+
+    @staticmethod
+    def _prefetch_alert_data(alert_vo: Alert) -> None:
+        domain_id = alert_vo.domain_id
+        cache.prefetch(
+            [
+                cache_key.PROJECT_ALERT_OPTIONS.format(
+                    domain_id=domain_id, project_id=alert_vo.project_id
+                ),
+                cache_key.ESCALATION_POLICY_CONDITION.format(
+                    domain_id=domain_id,
+                    escalation_policy_id=alert_vo.escalation_policy_id,
+                ),
+                cache_key.ALERT_MESSAGE.format(
+                    domain_id=domain_id, alert_id=alert_vo.alert_id
+                ),
+            ]
+        )
+
+    @staticmethod
+    def _prefetch_message_names(alert_vo: Alert) -> None:
+        domain_id = alert_vo.domain_id
+        keys = [
+            cache_key.PROJECT_NAME.format(
+                domain_id=domain_id, project_id=alert_vo.project_id
+            ),
+            cache_key.TRIGGERED_BY_NAME.format(
+                domain_id=domain_id, triggered_by=alert_vo.triggered_by
+            ),
+            cache_key.DOMAIN_NAME.format(domain_id=domain_id),
+        ]
+
+        if alert_vo.assignee:
+            keys.append(
+                cache_key.USER_NAME.format(
+                    domain_id=domain_id, user_id=alert_vo.assignee
+                )
+            )
+
+        cache.prefetch(keys)
+
     def _list_domains_of_alerts(self):
         alert_mgr: AlertManager = self.locator.get_manager("AlertManager")
         query = {
@@ -273,6 +518,7 @@ class JobService(BaseService):
                 {"k": "state", "v": ["TRIGGERED", "ACKNOWLEDGED"], "o": "in"},
                 {"k": "escalation_ttl", "v": 0, "o": "gt"},
             ],
+            "filter_or": self._make_due_alert_filter(),
         }
 
         response = alert_mgr.stat_alerts(query)
@@ -280,54 +526,45 @@ class JobService(BaseService):
 
     def _list_open_alerts(self, domain_id):
         alert_mgr: AlertManager = self.locator.get_manager("AlertManager")
-        project_alert_config_mgr: ProjectAlertConfigManager = self.locator.get_manager(
-            "ProjectAlertConfigManager"
-        )
-
-        project_ids = []
-        (
-            project_alert_config_vos,
-            total_count,
-        ) = project_alert_config_mgr.list_project_alert_configs(
-            {
-                "filter": [{"k": "domain_id", "v": domain_id, "o": "eq"}],
-                "only": ["project_id"],
-            }
-        )
-
-        for project_alert_config_vo in project_alert_config_vos:
-            project_ids.append(project_alert_config_vo.project_id)
-
         query = {
             "filter": [
                 {"k": "domain_id", "v": domain_id, "o": "eq"},
-                {"k": "project_id", "v": project_ids, "o": "in"},
                 {"k": "state", "v": ["TRIGGERED", "ACKNOWLEDGED"], "o": "in"},
                 {"k": "escalation_ttl", "v": 0, "o": "gt"},
-            ]
+            ],
+            "filter_or": self._make_due_alert_filter(),
+            "only": ["alert_id"],
         }
 
         return alert_mgr.list_alerts(query)
 
-    @cache.cacheable(
-        key="monitoring:alert:project-options:{domain_id}:{project_id}", expire=300
-    )
-    def _get_project_alert_options(self, project_id, workspace_id, domain_id):
+    @staticmethod
+    def _make_due_alert_filter() -> list:
+        # Alerts without next_escalation_at have never been escalated by the scheduler.
+        return [
+            {"k": "next_escalation_at", "v": None, "o": "eq"},
+            {"k": "next_escalation_at", "v": datetime.utcnow(), "o": "lte"},
+        ]
+
+    @cache.cacheable(cache_key.PROJECT_ALERT_OPTIONS)
+    def _get_project_alert_options(
+        self, project_id, workspace_id, domain_id
+    ) -> Union[dict, None]:
         project_alert_config_mgr: ProjectAlertConfigManager = self.locator.get_manager(
             "ProjectAlertConfigManager"
         )
         project_alert_config_vo: ProjectAlertConfig = (
-            project_alert_config_mgr.get_project_alert_config(
-                project_id, workspace_id, domain_id
-            )
+            project_alert_config_mgr.filter_project_alert_configs(
+                project_id=project_id, workspace_id=workspace_id, domain_id=domain_id
+            ).first()
         )
 
+        if project_alert_config_vo is None:
+            return None
+
         return dict(project_alert_config_vo.options.to_dict())
 
-    @cache.cacheable(
-        key="monitoring:escalation-policy-condition:{domain_id}:{escalation_policy_id}",
-        expire=300,
-    )
+    @cache.cacheable(cache_key.ESCALATION_POLICY_CONDITION)
     def _get_escalation_policy_rules_and_finish_condition(
         self, escalation_policy_id, workspace_id, domain_id
     ):
@@ -349,6 +586,18 @@ class JobService(BaseService):
     def _get_current_escalation_rule(alert_vo: Alert, rules):
         return rules[alert_vo.escalation_step - 1]
 
+    @staticmethod
+    def _check_project_alert_options(alert_id, alert_options):
+        # A missing config is cached as an empty dict by RedisCache.
+        if not alert_options:
+            _LOGGER.debug(
+                f"[_check_project_alert_options] Stop notifications. "
+                f"(project alert config is not found, alert_id = {alert_id})"
+            )
+            return False
+        else:
+            return True
+
     @staticmethod
     def _check_notification_options(alert_urgency, alert_id, alert_options):
         if (
@@ -375,77 +624,89 @@ class JobService(BaseService):
         else:
             return True
 
-    @staticmethod
     def _check_escalation_time_and_escalate_alert(
-        alert_mgr: AlertManager, alert_vo: Alert, rules
+        self, alert_mgr: AlertManager, alert_vo: Alert, rules
     ):
+        is_notify, update_params = self._get_escalation_params(alert_vo, rules)
+
+        if update_params:
+            alert_vo = alert_mgr.update_alert_by_vo(update_params, alert_vo)
+
+        return is_notify, alert_vo
+
+    def _get_escalation_params(self, alert_vo: Alert, rules) -> Tuple[bool, dict]:
         current_step = alert_vo.escalation_step
         escalation_ttl = alert_vo.escalation_ttl
-        current_rule = rules[current_step - 1]
-        escalate_minutes = current_rule.get("escalate_minutes", 0)
         escalated_at: Union[datetime, None] = alert_vo.escalated_at
+        now = datetime.utcnow()
 
         # First triggered alert
         if escalated_at is None:
-            escalated_alert_vo = alert_mgr.update_alert_by_vo(
-                {"escalated_at": datetime.utcnow()}, alert_vo
-            )
-            return True, escalated_alert_vo
+            return True, {
+                "escalated_at": now,
+                "next_escalation_at": self._get_next_escalation_at(
+                    rules, current_step, now
+                ),
+            }
         else:
-            now = datetime.utcnow()
+            next_escalation_at = self._get_next_escalation_at(
+                rules, current_step, escalated_at
+            )
 
             # now > escalated_at + escalate_minutes
-            if now > (escalated_at + timedelta(minutes=escalate_minutes)):
+            if now > next_escalation_at:
                 # When the current step is the maximum
                 if len(rules) == current_step:
                     if escalation_ttl == 1:
                         _LOGGER.debug(
-                            f"[_check_escalation_time_and_escalate_alert] Max escalation step. "
+                            f"[_get_escalation_params] Max escalation step. "
                             f"(alert_id = {alert_vo.alert_id})"
                         )
 
-                        escalated_alert_vo = alert_mgr.update_alert_by_vo(
-                            {
-                                "escalated_at": datetime.utcnow(),
-                                "escalation_ttl": escalation_ttl - 1,
-                            },
-                            alert_vo,
-                        )
-
-                        return False, escalated_alert_vo
+                        return False, {
+                            "escalated_at": now,
+                            "escalation_ttl": escalation_ttl - 1,
+                        }
                     else:
                         _LOGGER.debug(
-                            f"[_check_escalation_time_and_escalate_alert] Repeat again from the first step. "
+                            f"[_get_escalation_params] Repeat again from the first step. "
                             f"(alert_id = {alert_vo.alert_id})"
                         )
 
-                        escalated_alert_vo = alert_mgr.update_alert_by_vo(
-                            {
-                                "escalated_at": datetime.utcnow(),
-                                "escalation_step": 1,
-                                "escalation_ttl": escalation_ttl - 1,
-                            },
-                            alert_vo,
-                        )
-
-                        return True, escalated_alert_vo
+                        return True, {
+                            "escalated_at": now,
+                            "escalation_step": 1,
+                            "escalation_ttl": escalation_ttl - 1,
+                            "next_escalation_at": self._get_next_escalation_at(
+                                rules, 1, now
+                            ),
+                        }
                 else:
                     _LOGGER.debug(
-                        f"[_check_escalation_time_and_escalate_alert] Escalate from {current_step} "
+                        f"[_get_escalation_params] Escalate from {current_step} "
                         f"to {current_step + 1} steps. (alert_id = {alert_vo.alert_id})"
                     )
 
-                    escalated_alert_vo = alert_mgr.update_alert_by_vo(
-                        {
-                            "escalated_at": datetime.utcnow(),
-                            "escalation_step": current_step + 1,
-                        },
-                        alert_vo,
-                    )
-
-                    return True, escalated_alert_vo
+                    return True, {
+                        "escalated_at": now,
+                        "escalation_step": current_step + 1,
+                        "next_escalation_at": self._get_next_escalation_at(
+                            rules, current_step + 1, now
+                        ),
+                    }
+            elif alert_vo.next_escalation_at != next_escalation_at:
+                # Alerts without a schedule (or with a changed policy) are fixed up
+                # here, so that the scheduler does not select them before they are due.
+                return False, {"next_escalation_at": next_escalation_at}
             else:
-                return False, alert_vo
+                return False, {}
+
+    @staticmethod
+    def _get_next_escalation_at(
+        rules: list, escalation_step: int, escalated_at: datetime
+    ) -> datetime:
+        escalate_minutes = rules[escalation_step - 1].get("escalate_minutes", 0)
+        return escalated_at + timedelta(minutes=escalate_minutes)
 
     def _create_message(
         self,
@@ -456,8 +717,58 @@ class JobService(BaseService):
         has_callback=False,
         user_id=None,
     ):
-        domain_id = alert_vo.domain_id
-        project_name = self._get_project_name(alert_vo.project_id, domain_id)
+        skeleton = self._get_message_skeleton(
+            alert_vo.alert_id, alert_vo.domain_id, alert_vo
+        )
+
+        tags = (
+            skeleton["tags"][:1]
+            + [{"key": "State", "value": alert_vo.state, "options": {"short": True}}]
+            + skeleton["tags"][1:]
+        )
+
+        callbacks = []
+
+        access_key = self._create_access_key(alert_vo.alert_id)
+        alert_url = f'{skeleton["alert_url"]}/{access_key}'
+
+        if has_callback:
+            callback_url = f"{alert_url}/ACKNOWLEDGED"
+            callbacks.append({"label": "Acknowledge Alerts", "url": callback_url})
+
+        if user_id:
+            resource_type = "identity.User"
+            resource_id = user_id
+        else:
+            resource_type = "identity.Project"
+            resource_id = alert_vo.project_id
+
+        message = {
+            "title": title,
+            "tags": tags,
+            "callbacks": callbacks,
+            **skeleton["message"],
+        }
+
+        if console_url := skeleton["console_url"]:
+            message["link"] = f"{console_url}/alert-public-detail?alert_url={alert_url}"
+
+        return {
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "notification_type": notification_type,
+            "topic": "monitoring.Alert",
+            "message": message,
+            "notification_level": notification_level,
+        }
+
+    @cache.cacheable(cache_key.ALERT_MESSAGE)
+    def _get_message_skeleton(
+        self, alert_id: str, domain_id: str, alert_vo: Alert
+    ) -> dict:
+        # Static parts of the notification message. State, title and access key
+        # are rendered in _create_message.
+        self._prefetch_message_names(alert_vo)
 
         tags = [
             {
@@ -465,14 +776,16 @@ class JobService(BaseService):
                 "value": f"#{alert_vo.alert_number}",
                 "options": {"short": True},
             },
-            {"key": "State", "value": alert_vo.state, "options": {"short": True}},
             {"key": "Urgency", "value": alert_vo.urgency, "options": {"short": True}},
             {
                 "key": "Triggered by",
                 "value": self._get_triggered_by_name(alert_vo.triggered_by, domain_id),
                 "options": {"short": True},
             },
-            {"key": "Project", "value": project_name},
+            {
+                "key": "Project",
+                "value": self._get_project_name(alert_vo.project_id, domain_id),
+            },
         ]
 
         i = 1
@@ -495,50 +808,22 @@ class JobService(BaseService):
         if alert_vo.account:
             tags.append({"key": "Account", "value": alert_vo.account})
 
-        callbacks = []
-
-        access_key = self._create_access_key(alert_vo.alert_id)
-
-        if has_callback:
-            callback_url = self._make_callback_url(
-                alert_vo.alert_id, domain_id, access_key
-            )
-            callbacks.append({"label": "Acknowledge Alerts", "url": callback_url})
-
-        if user_id:
-            resource_type = "identity.User"
-            resource_id = user_id
-        else:
-            resource_type = "identity.Project"
-            resource_id = alert_vo.project_id
-
-        message = {
-            "title": title,
-            "tags": tags,
-            "callbacks": callbacks,
-            "occurred_at": utils.datetime_to_iso8601(alert_vo.created_at),
-        }
+        message = {"occurred_at": utils.datetime_to_iso8601(alert_vo.created_at)}
 
         if alert_vo.description and alert_vo.description != "":
             message["description"] = alert_vo.description
 
-        alert_link = self._make_alert_link(
-            alert_vo.alert_id, alert_vo.domain_id, access_key
-        )
-
-        if alert_link:
-            message["link"] = alert_link
-
         if alert_vo.image_url:
             message["image_url"] = alert_vo.image_url
 
+        webhook_domain = config.get_global("WEBHOOK_DOMAIN")
+        alert_url = f"{webhook_domain}/monitoring/v1/domain/{domain_id}/alert/{alert_id}"
+
         return {
-            "resource_type": resource_type,
-            "resource_id": resource_id,
-            "notification_type": notification_type,
-            "topic": "monitoring.Alert",
+            "tags": tags,
             "message": message,
-            "notification_level": notification_level,
+            "alert_url": alert_url,
+            "console_url": self._get_console_url(domain_id),
         }
 
     def _create_access_key(self, alert_id: str) -> str:
@@ -549,20 +834,22 @@ class JobService(BaseService):
                 f"({access_key})"
             )
             cache.delete(
-                f"monitoring:alert:notification-callback:{alert_id}:{access_key}"
+                cache_key.ALERT_CALLBACK.format(
+                    alert_id=alert_id, access_key=access_key
+                )
             )
 
         access_key = self._generate_access_key()
 
         cache.set(
-            f"monitoring:alert:notification-callback:{alert_id}:{access_key}",
+            cache_key.ALERT_CALLBACK.format(alert_id=alert_id, access_key=access_key),
             True,
-            expire=3600,
+            expire=cache_key.ALERT_CALLBACK.expire,
         )
         self.transaction.add_rollback(_rollback, alert_id, access_key)
         return access_key
 
-    @cache.cacheable(key="monitoring:project-name:{domain_id}:{project_id}", expire=300)
+    @cache.cacheable(cache_key.PROJECT_NAME)
     def _get_project_name(self, project_id: str, domain_id: str) -> str:
         try:
             identity_mgr: IdentityManager = self.locator.get_manager(IdentityManager)
@@ -583,9 +870,7 @@ class JobService(BaseService):
 
         return ""
 
-    @cache.cacheable(
-        key="monitoring:triggered-by-name:{domain_id}:{triggered_by}", expire=300
-    )
+    @cache.cacheable(cache_key.TRIGGERED_BY_NAME)
     def _get_triggered_by_name(self, triggered_by, domain_id):
         if triggered_by and triggered_by.startswith("webhook-"):
             try:
@@ -603,7 +888,7 @@ class JobService(BaseService):
 
         return triggered_by
 
-    @cache.cacheable(key="monitoring:user-name:{domain_id}:{user_id}", expire=300)
+    @cache.cacheable(cache_key.USER_NAME)
     def _get_user_name(self, user_id: str, domain_id: str) -> str:
         try:
             identity_mgr: IdentityManager = self.locator.get_manager("IdentityManager")
@@ -622,23 +907,15 @@ class JobService(BaseService):
     def _generate_access_key():
         return utils.random_string(16)
 
-    @staticmethod
-    def _make_callback_url(alert_id, domain_id, access_key):
-        webhook_domain = config.get_global("WEBHOOK_DOMAIN")
-        return f"{webhook_domain}/monitoring/v1/domain/{domain_id}/alert/{alert_id}/{access_key}/ACKNOWLEDGED"
-
-    def _make_alert_link(self, alert_id, domain_id, access_key):
+    def _get_console_url(self, domain_id: str) -> Union[str, None]:
         console_domain: str = config.get_global("CONSOLE_DOMAIN")
         webhook_domain = config.get_global("WEBHOOK_DOMAIN")
 
         if console_domain.strip() != "" and webhook_domain.strip() != "":
             domain_name = self._get_domain_name(domain_id)
-            console_domain = console_domain.format(domain_name=domain_name)
-
-            alert_url = f"{webhook_domain}/monitoring/v1/domain/{domain_id}/alert/{alert_id}/{access_key}"
-            return f"{console_domain}/alert-public-detail?alert_url={alert_url}"
+            return console_domain.format(domain_name=domain_name)
 
-    @cache.cacheable(key="monitoring:domain-name:{domain_id}", expire=3600)
+    @cache.cacheable(cache_key.DOMAIN_NAME)
     def _get_domain_name(self, domain_id: str):
         try:
             identity_mgr: IdentityManager = self.locator.get_manager(IdentityManager)
@@ -1,12 +1,21 @@
 import concurrent.futures
+import hashlib
+import json
 import logging
+import math
+import threading
+import time
 from copy import deepcopy
+from datetime import datetime, timezone
+from typing import Generator, List, Tuple, Union
 
+from spaceone.core import config, utils
 from spaceone.core.service import *
 from spaceone.core.utils import get_dict_value, random_string
 
 from spaceone.monitoring.conf.global_conf import *
 from spaceone.monitoring.error import *
+from spaceone.monitoring.lib import cache, cache_key, metric_data
 from spaceone.monitoring.manager import PluginManager
 from spaceone.monitoring.manager.data_source_manager import DataSourceManager
 from spaceone.monitoring.manager.data_source_plugin_manager import (
@@ -17,6 +26,9 @@ from spaceone.monitoring.manager.secret_manager import SecretManager
 
 _LOGGER = logging.getLogger(__name__)
 
+_METRIC_DATA_SEMAPHORE = None
+_LOCK = threading.Lock()
+
 
 @authentication_handler
 @authorization_handler
@@ -161,12 +173,102 @@ class MetricService(BaseService):
                 'end': 'str',               # required
                 'period': 'int',
                 'stat': 'str',
+                'max_points': 'int',        # downsample each series to max_points
+                'aggregate': 'str',         # SUM | AVG | P95 across all series
+                'value_encoding': 'str',    # FLOAT64_BASE64
+                'last_timestamp': 'str',    # ISO 8601 or epoch seconds
+                'workspace_id': 'str',      # injected from auth
+                'user_projects': 'list',    # injected from auth
                 'domain_id': 'str'          # injected from auth (required)
             }
 
         Returns:
-            metric_data (list)
+            metric_data (dict): {
+                'labels': 'list',
+                'values': 'dict',
+                'is_complete': 'bool',      # False if some chunks failed or timed out
+                'domain_id': 'str'
+            }
+        """
+        domain_id = params["domain_id"]
+        self._check_metric_data_options(params)
+
+        last_timestamp = self._get_last_timestamp(params)
+        if last_timestamp is not None:
+            start = metric_data.to_timestamp(params["start"])
+
+            # Only the tail after the points the client already has is fetched
+            if start is None or last_timestamp > start:
+                params["start"] = self._timestamp_to_iso8601(last_timestamp)
+
+        endpoint, metric_data_params, resources_chunks = self._prepare_metric_data(
+            params
+        )
+
+        if window_size := self._get_cache_window_size(params):
+            # Callers share cached windows only if they resolved the same resources
+            query_hash = self._make_query_hash(params, resources_chunks, window_size)
+            labels, values, is_complete = self._get_metric_data_by_windows(
+                endpoint,
+                metric_data_params,
+                resources_chunks,
+                params,
+                window_size,
+                query_hash,
+            )
+        else:
+            labels, values, is_complete = self._fetch_metric_data(
+                endpoint, metric_data_params, resources_chunks
+            )
+
+        if last_timestamp is not None:
+            labels, values = metric_data.trim_after(labels, values, last_timestamp)
+
+        labels, values = self._reduce_metric_data(labels, values, params)
+        return {
+            "labels": labels,
+            "values": values,
+            "is_complete": is_complete,
+            "domain_id": domain_id,
+        }
+
+    @transaction(
+        permission="monitoring:Metric.read",
+        role_types=["DOMAIN_ADMIN", "WORKSPACE_OWNER", "WORKSPACE_MEMBER"],
+    )
+    @check_required(
+        ["data_source_id", "metric_query", "metric", "start", "end", "domain_id"]
+    )
+    def get_data_stream(self, params) -> Generator[dict, None, None]:
+        """Get resource's metric data chunk by chunk
+
+        Args:
+            params (dict): same as get_data (aggregate is not supported)
+
+        The data source and the resources are read in the transaction, but
+        the chunks are fetched while the generator is consumed, after the
+        transaction is closed. So errors of the plugin calls are raised by
+        the generator, not by this method. If some chunks failed or timed
+        out, ERROR_INCOMPLETE_METRIC_DATA is raised after the other chunks.
+
+        Returns:
+            metric_data (Generator): {
+                'labels': 'list',      # labels of the first chunk
+                'values': 'dict',      # values of one chunk
+                'domain_id': 'str'
+            }
         """
+        self._check_metric_data_options(params, is_stream=True)
+
+        endpoint, metric_data_params, resources_chunks = self._prepare_metric_data(
+            params
+        )
+
+        return self._generate_metric_data(
+            endpoint, metric_data_params, resources_chunks, params
+        )
+
+    def _prepare_metric_data(self, params: dict) -> Tuple[str, dict, dict]:
         data_source_id = params["data_source_id"]
         metric_query = params["metric_query"]
         domain_id = params["domain_id"]
@@ -197,8 +299,6 @@ class MetricService(BaseService):
                 {"plugin_info": plugin_info}, data_source_vo
             )
 
-        response = {"labels": [], "values": {}, "domain_id": domain_id}
-
         required_keys = plugin_metadata.get("required_keys")
         resource_ids = self.get_resource_ids_from_metric_query(metric_query)
         resources_info = self.inventory_mgr.list_resources(resource_ids, required_keys)
@@ -214,33 +314,267 @@ class MetricService(BaseService):
 
         metric_data_params = self.set_metric_data_params(params)
 
-        for chunk_resources in resources_chunks.values():
-            metric_data_params.update(
-                {
-                    "secret_data": chunk_resources.get("secret_data"),
-                    "metric_query": chunk_resources.get("metric_query"),
-                    "options": chunk_resources.get("options", {}),
+        return endpoint, metric_data_params, resources_chunks
+
+    def _generate_metric_data(
+        self,
+        endpoint: str,
+        metric_data_params: dict,
+        resources_chunks: dict,
+        params: dict,
+    ) -> Generator[dict, None, None]:
+        labels = []
+        failed_count = 0
+
+        for metric_data_response in self._list_metric_data(
+            endpoint, metric_data_params, resources_chunks
+        ):
+            if metric_data_response is None:
+                failed_count += 1
+                continue
+
+            if not labels:
+                labels = metric_data_response.get("labels", [])
+
+            if values := metric_data_response.get("values"):
+                chunk_labels, values = self._reduce_metric_data(labels, values, params)
+                yield {
+                    "labels": chunk_labels,
+                    "values": values,
+                    "domain_id": params["domain_id"],
                 }
+
+        if failed_count:
+            raise ERROR_INCOMPLETE_METRIC_DATA(
+                failed_count=failed_count, total_count=len(resources_chunks)
             )
 
-            if "schema" in chunk_resources:
-                metric_data_params.update({"schema": chunk_resources.get("schema")})
+    def _get_metric_data_by_windows(
+        self,
+        endpoint: str,
+        metric_data_params: dict,
+        resources_chunks: dict,
+        params: dict,
+        window_size: int,
+        query_hash: str,
+    ) -> Tuple[list, dict, bool]:
+        """Gets metric data by aligned time windows.
+
+        Windows that closed METRIC_DATA_CACHE_DELAY seconds ago are cached.
+        Missing windows and the open trailing window are fetched from the
+        plugin, with one call for each run of adjacent windows. Data sources
+        whose data can not be split by time are fetched without windows.
+        """
+        start = metric_data.to_timestamp(params["start"])
+        end = metric_data.to_timestamp(params["end"])
+        closed_before = time.time() - config.get_global("METRIC_DATA_CACHE_DELAY", 0)
+
+        windows = metric_data.get_windows(start, end, window_size)
+        keys = {
+            window_start: cache_key.METRIC_DATA.format(
+                domain_id=params["domain_id"],
+                workspace_id=params.get("workspace_id"),
+                data_source_id=params["data_source_id"],
+                query_hash=query_hash,
+                window_start=window_start,
+            )
+            for window_start in windows
+        }
+        unwindowed_key = cache_key.METRIC_DATA_UNWINDOWED.format(
+            domain_id=params["domain_id"], data_source_id=params["data_source_id"]
+        )
 
-            try:
-                metric_data_response = self.ds_plugin_mgr.get_metric_data(
-                    endpoint, metric_data_params
+        cached_values = cache.get_many([unwindowed_key] + list(keys.values()))
+
+        if cached_values.get(unwindowed_key):
+            return self._fetch_metric_data(
+                endpoint, metric_data_params, resources_chunks
+            )
+
+        windows_data = {
+            window_start: (
+                cached_values[key]["labels"],
+                cached_values[key]["values"],
+            )
+            for window_start, key in keys.items()
+            if key in cached_values
+        }
+
+        missing_windows = [
+            window_start for window_start in windows if window_start not in windows_data
+        ]
+        is_all_complete = True
+
+        for run in self._group_adjacent_windows(missing_windows, window_size):
+            run_params = {
+                **metric_data_params,
+                "start": self._timestamp_to_iso8601(run[0]),
+            }
+
+            # The run that contains end is fetched up to end
+            if run[-1] + window_size <= end:
+                run_params["end"] = self._timestamp_to_iso8601(run[-1] + window_size)
+
+            labels, values, is_complete = self._fetch_metric_data(
+                endpoint, run_params, resources_chunks
+            )
+            split_data = metric_data.split_windows(labels, values, run, window_size)
+
+            if split_data is None:
+                # The data can not be split by time. The data source is
+                # remembered, so only this request fetches it again.
+                _LOGGER.debug(
+                    f"[get_data] metric data can not be split into windows. "
+                    f"(data_source_id = {params['data_source_id']})"
+                )
+                cache.set(
+                    unwindowed_key,
+                    True,
+                    expire=cache_key.METRIC_DATA_UNWINDOWED.expire,
                 )
-            except Exception as e:
-                _LOGGER.error(f"[get_metric_data] {e}")
-                metric_data_response = {"labels": [], "values": {}}
 
-            if not response["labels"] and metric_data_response.get("labels", []):
-                response["labels"] = metric_data_response["labels"]
+                # The run already covers the requested range
+                if run[0] == start and run[-1] + window_size > end:
+                    return labels, values, is_complete
 
-            if values := metric_data_response.get("values"):
-                response["values"].update(values)
+                return self._fetch_metric_data(
+                    endpoint, metric_data_params, resources_chunks
+                )
 
-        return response
+            is_all_complete = is_all_complete and is_complete
+
+            cache_values = {}
+            for window_start, window_data in zip(run, split_data):
+                windows_data[window_start] = window_data
+
+                if is_complete and window_start + window_size <= closed_before:
+                    cache_values[keys[window_start]] = {
+                        "labels": window_data[0],
+                        "values": window_data[1],
+                    }
+
+            cache.set_many(cache_values, expire=cache_key.METRIC_DATA.expire)
+
+        labels, values = metric_data.merge_windows(
+            [windows_data[window_start] for window_start in windows]
+        )
+        labels, values = metric_data.trim(labels, values, start, end)
+        return labels, values, is_all_complete
+
+    def _fetch_metric_data(
+        self, endpoint: str, metric_data_params: dict, resources_chunks: dict
+    ) -> Tuple[list, dict, bool]:
+        labels = []
+        values = {}
+        failed_count = 0
+
+        for metric_data_response in self._list_metric_data(
+            endpoint, metric_data_params, resources_chunks
+        ):
+            if metric_data_response is None:
+                failed_count += 1
+                continue
+
+            if not labels and metric_data_response.get("labels", []):
+                labels = metric_data_response["labels"]
+
+            if chunk_values := metric_data_response.get("values"):
+                values.update(chunk_values)
+
+        if failed_count:
+            _LOGGER.warning(
+                f"[get_data] metric data is incomplete. "
+                f"({failed_count}/{len(resources_chunks)} chunks failed)"
+            )
+
+        return labels, values, failed_count == 0
+
+    def _list_metric_data(
+        self, endpoint: str, metric_data_params: dict, resources_chunks: dict
+    ) -> Generator[Union[dict, None], None, None]:
+        """Yields the metric data of each chunk as soon as it is received.
+
+        Chunks that failed or are not finished within METRIC_DATA_TIMEOUT are
+        yielded as None.
+        """
+        chunks_params = [
+            self._make_chunk_params(metric_data_params, chunk_resources)
+            for chunk_resources in resources_chunks.values()
+        ]
+
+        if len(chunks_params) == 0:
+            return
+
+        timeout = config.get_global("METRIC_DATA_TIMEOUT", 0) or None
+        deadline = time.monotonic() + timeout if timeout else None
+        max_workers = config.get_global(
+            "METRIC_DATA_MAX_WORKERS", MAX_CONCURRENT_WORKER
+        )
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(chunks_params))
+        )
+
+        try:
+            future_executors = {
+                executor.submit(
+                    self._get_chunk_metric_data, endpoint, chunk_params, deadline
+                )
+                for chunk_params in chunks_params
+            }
+
+            for future in concurrent.futures.as_completed(
+                future_executors, timeout=timeout
+            ):
+                # Drop finished chunks so that only pending data is held
+                future_executors.discard(future)
+                yield future.result()
+
+        except concurrent.futures.TimeoutError:
+            _LOGGER.error(
+                f"[get_data] metric data of {len(future_executors)}/"
+                f"{len(chunks_params)} chunks timed out. (timeout = {timeout}s)"
+            )
+
+            for _ in future_executors:
+                yield None
+        finally:
+            # Running plugin calls are not interrupted, but their results are dropped.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_chunk_metric_data(
+        self, endpoint: str, chunk_params: dict, deadline: float = None
+    ) -> Union[dict, None]:
+        semaphore = _get_metric_data_semaphore()
+        timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+
+        if not semaphore.acquire(timeout=timeout):
+            _LOGGER.error(
+                "[get_metric_data] no worker is available before the deadline"
+            )
+            return None
+
+        try:
+            return self.ds_plugin_mgr.get_metric_data(endpoint, chunk_params)
+        except Exception as e:
+            _LOGGER.error(f"[get_metric_data] {e}")
+            return None
+        finally:
+            semaphore.release()
+
+    @staticmethod
+    def _make_chunk_params(metric_data_params: dict, chunk_resources: dict) -> dict:
+        chunk_params = {
+            **metric_data_params,
+            "secret_data": chunk_resources.get("secret_data"),
+            "metric_query": chunk_resources.get("metric_query"),
+            "options": chunk_resources.get("options", {}),
+        }
+
+        if "schema" in chunk_resources:
+            chunk_params["schema"] = chunk_resources.get("schema")
+
+        return chunk_params
 
     def list_chunk_resources(self, resources, metric_query, data_source_vo, domain_id):
         """
@@ -447,6 +781,123 @@ class MetricService(BaseService):
     def get_account_from_resource(resource):
         return resource.get("account", "")
 
+    @staticmethod
+    def _get_last_timestamp(params: dict) -> Union[float, None]:
+        if params.get("last_timestamp") is None:
+            return None
+
+        last_timestamp = metric_data.to_timestamp(params["last_timestamp"])
+        if last_timestamp is None:
+            raise ERROR_INVALID_PARAMETER(
+                key="last_timestamp",
+                reason="last_timestamp must be an ISO 8601 string or epoch seconds.",
+            )
+
+        return last_timestamp
+
+    @staticmethod
+    def _get_cache_window_size(params: dict) -> Union[int, None]:
+        cache_window = config.get_global("METRIC_DATA_CACHE_WINDOW", 0)
+        period = params.get("period")
+
+        if not cache_window or not isinstance(period, int) or period <= 0:
+            return None
+
+        for key in ["start", "end"]:
+            if metric_data.to_timestamp(params[key]) is None:
+                return None
+
+        # Windows are aligned to the period, so buckets never span two windows
+        return math.ceil(cache_window / period) * period
+
+    @staticmethod
+    def _make_query_hash(
+        params: dict, resources_chunks: dict, window_size: int = None
+    ) -> str:
+        # Only the resources resolved with the token of the caller are queried
+        resolved_query = {}
+        for chunk_resources in resources_chunks.values():
+            resolved_query.update(chunk_resources.get("metric_query", {}))
+
+        user_projects = params.get("user_projects")
+        if user_projects is not None:
+            user_projects = sorted(user_projects)
+
+        query = {
+            "resource_ids": sorted(resolved_query.keys()),
+            "metric_query": resolved_query,
+            "user_projects": user_projects,
+            "metric": params["metric"],
+            "period": params.get("period"),
+            "stat": params.get("stat"),
+            "window_size": window_size,
+        }
+
+        return hashlib.sha1(
+            json.dumps(query, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    @staticmethod
+    def _group_adjacent_windows(windows: List[int], window_size: int) -> List[list]:
+        runs = []
+
+        for window_start in windows:
+            if runs and runs[-1][-1] + window_size == window_start:
+                runs[-1].append(window_start)
+            else:
+                runs.append([window_start])
+
+        return runs
+
+    @staticmethod
+    def _timestamp_to_iso8601(timestamp: float) -> str:
+        return utils.datetime_to_iso8601(
+            datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        )
+
+    @staticmethod
+    def _reduce_metric_data(
+        labels: list, values: dict, params: dict
+    ) -> Tuple[list, dict]:
+        if aggregate := params.get("aggregate"):
+            values = metric_data.aggregate_values(labels, values, aggregate)
+
+        if max_points := params.get("max_points"):
+            labels, values = metric_data.downsample(
+                labels, values, max_points, params.get("stat")
+            )
+
+        return labels, metric_data.encode_values(values, params.get("value_encoding"))
+
+    @staticmethod
+    def _check_metric_data_options(params: dict, is_stream: bool = False) -> None:
+        value_encoding = params.get("value_encoding")
+        if value_encoding and value_encoding not in metric_data.VALUE_ENCODINGS:
+            raise ERROR_INVALID_PARAMETER(
+                key="value_encoding",
+                reason=f"supported encodings: {metric_data.VALUE_ENCODINGS}",
+            )
+
+        if aggregate := params.get("aggregate"):
+            if is_stream:
+                raise ERROR_INVALID_PARAMETER(
+                    key="aggregate", reason="aggregate is not supported in a stream."
+                )
+
+            if aggregate not in metric_data.AGGREGATES:
+                raise ERROR_INVALID_PARAMETER(
+                    key="aggregate",
+                    reason=f"supported aggregates: {metric_data.AGGREGATES}",
+                )
+
+        max_points = params.get("max_points")
+        if max_points is not None and (
+            not isinstance(max_points, int) or max_points < 1
+        ):
+            raise ERROR_INVALID_PARAMETER(
+                key="max_points", reason="max_points must be a positive integer."
+            )
+
     @staticmethod
     def _check_data_source_state(data_source_vo):
         if data_source_vo.state == "DISABLED":
@@ -506,3 +957,16 @@ class MetricService(BaseService):
             return get_dict_value(cloud_service_info, query_key, default_value={})
         else:
             raise ERROR_REQUIRED_KEYS_NOT_EXISTS(plugin_id=plugin_info.plugin_id)
+
+
+def _get_metric_data_semaphore() -> threading.BoundedSemaphore:
+    global _METRIC_DATA_SEMAPHORE
+
+    if _METRIC_DATA_SEMAPHORE is None:
+        with _LOCK:
+            if _METRIC_DATA_SEMAPHORE is None:
+                _METRIC_DATA_SEMAPHORE = threading.BoundedSemaphore(
+                    config.get_global("METRIC_DATA_GLOBAL_MAX_WORKERS", 50)
+                )
+
+    return _METRIC_DATA_SEMAPHORE
@@ -3,6 +3,7 @@ import logging
 from spaceone.core.service import *
 
 from spaceone.monitoring.error import *
+from spaceone.monitoring.manager.alert_manager import AlertManager
 from spaceone.monitoring.manager.escalation_policy_manager import (
     EscalationPolicyManager,
 )
@@ -169,10 +170,19 @@ class ProjectAlertConfigService(BaseService):
             None
         """
 
+        project_id = params["project_id"]
+        domain_id = params["domain_id"]
+        workspace_id = params["workspace_id"]
+
         self.project_alert_config_mgr.delete_project_alert_config(
-            params["project_id"], params["domain_id"], params["workspace_id"]
+            project_id, domain_id, workspace_id
         )
 
+        # The escalation scheduler does not check project alert configs,
+        # so stop the escalation of open alerts in this project here.
+        alert_mgr: AlertManager = self.locator.get_manager("AlertManager")
+        alert_mgr.stop_escalation_by_project(project_id, workspace_id, domain_id)
+
     @transaction(
         permission="monitoring:ProjectAlertConfig.read",
         role_types=["DOMAIN_ADMIN", "WORKSPACE_OWNER", "WORKSPACE_MEMBER"],
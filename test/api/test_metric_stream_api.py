@@ -0,0 +1,78 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from spaceone.core import config
+from spaceone.core.error import ERROR_INVALID_ARGUMENT
+from spaceone.core.fastapi.api import BaseAPI
+from spaceone.core.locator import Locator
+from spaceone.core.service import BaseService
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.interface.rest.v1.metric import Metric
+
+class _MockMetricService(BaseService):
+    def __init__(self, metric_data_stream):
+        self.metric_data_stream = metric_data_stream
+
+    def get_data_stream(self, params):
+        return self.metric_data_stream
+
+
+def _generate_metric_data(error: Exception = None):
+    yield {"labels": ["a", "b"], "values": {"cloud-svc-a": [1, 2]}}
+    yield {"labels": ["a", "b"], "values": {"cloud-svc-b": [3, 4]}}
+
+    if error:
+        raise error
+
+
+class TestMetricStreamAPI(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.monitoring")
+        super().setUpClass()
+
+    @staticmethod
+    def _get_data_stream(metric_data_stream) -> list:
+        async def _read_lines():
+            with patch.object(
+                Locator,
+                "get_service",
+                return_value=_MockMetricService(metric_data_stream),
+            ):
+                response = await Metric().get_data_stream(MagicMock())
+
+            return [line async for line in response.body_iterator]
+
+        return [json.loads(line) for line in asyncio.run(_read_lines())]
+
+    @patch.object(BaseAPI, "parse_request", return_value=({}, {}))
+    def test_get_data_stream(self, *args):
+        lines = self._get_data_stream(_generate_metric_data())
+
+        self.assertEqual(
+            [line["values"] for line in lines],
+            [{"cloud-svc-a": [1, 2]}, {"cloud-svc-b": [3, 4]}],
+        )
+
+    @patch.object(BaseAPI, "parse_request", return_value=({}, {}))
+    def test_get_data_stream_with_error(self, *args):
+        lines = self._get_data_stream(
+            _generate_metric_data(ERROR_INVALID_ARGUMENT(key="metric"))
+        )
+
+        # The error is sent as the last line after the chunks already sent
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[-1]["error"]["code"], "ERROR_INVALID_ARGUMENT")
+
+    @patch.object(BaseAPI, "parse_request", return_value=({}, {}))
+    def test_get_data_stream_with_unknown_error(self, *args):
+        lines = self._get_data_stream(_generate_metric_data(KeyError("labels")))
+
+        self.assertEqual(lines[-1]["error"]["code"], "ERROR_UNKNOWN")
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
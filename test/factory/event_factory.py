@@ -13,9 +13,7 @@ class EventFactory(factory.mongoengine.MongoEngineFactory):
     event_type = "ALERT"
     title = "TRIGGERED"
     description = factory.LazyAttribute(lambda o: utils.random_string())
-    urgency = "HIGH"
     severity = "CRITICAL"
-    resource = {}
     rule = utils.random_string()
     raw_data = {}
     alert_id = factory.LazyAttribute(lambda o: utils.generate_id("alert"))
@@ -23,4 +21,3 @@ class EventFactory(factory.mongoengine.MongoEngineFactory):
     project_id = factory.LazyAttribute(lambda o: utils.generate_id("project"))
     domain_id = utils.generate_id("domain", 10)
     created_at = factory.Faker("date_time")
-    updated_at = factory.Faker("date_time")
@@ -0,0 +1,202 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from spaceone.core import config
+from spaceone.core.transaction import create_transaction, delete_transaction
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.lib import cache, cache_key
+from spaceone.monitoring.lib.cache import ProcessCache, _LocalTags
+
+
+def _create_transaction(verb: str = "test"):
+    create_transaction(
+        "monitoring", "Test", verb, thread_id=str(threading.current_thread().ident)
+    )
+
+
+class TestCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Other test modules may load a global config with a Redis cache
+        cls.caches = config.get_global("CACHES")
+        config.set_global_force(CACHES={})
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        config.set_global_force(CACHES=cls.caches)
+
+    def setUp(self):
+        self.calls = []
+
+    def tearDown(self):
+        delete_transaction()
+
+    @cache.cacheable(key="monitoring:test:{domain_id}:{name}")
+    def _get_value(self, name, domain_id):
+        self.calls.append(name)
+        return {"name": name}
+
+    def test_cacheable_in_transaction(self):
+        _create_transaction()
+
+        self.assertEqual(self._get_value("test", "domain-test"), {"name": "test"})
+        self.assertEqual(
+            self._get_value("test", domain_id="domain-test"), {"name": "test"}
+        )
+        self.assertEqual(self.calls, ["test"])
+
+        cache.delete("monitoring:test:domain-test:test")
+        self._get_value("test", "domain-test")
+        self.assertEqual(self.calls, ["test", "test"])
+
+    def test_transaction_cache_is_isolated(self):
+        _create_transaction()
+        self._get_value("test", "domain-test")
+        delete_transaction()
+
+        _create_transaction()
+        self._get_value("test", "domain-test")
+        self.assertEqual(self.calls, ["test", "test"])
+
+    def test_delete_in_another_transaction(self):
+        _create_transaction()
+        self._get_value("test", "domain-test")
+
+        # Another request deletes the key while this request is running
+        thread = threading.Thread(
+            target=cache.delete, args=("monitoring:test:domain-test:test",)
+        )
+        thread.start()
+        thread.join()
+
+        self._get_value("test", "domain-test")
+        self.assertEqual(self.calls, ["test", "test"])
+
+    def test_delete_tags_in_another_transaction(self):
+        _create_transaction()
+        cache.set("monitoring:test:a", 1, tags=["webhook:webhook-test"])
+        cache.set("monitoring:test:b", 2, tags=["webhook:webhook-other"])
+
+        thread = threading.Thread(
+            target=cache.delete_tags, args=("webhook:webhook-test",)
+        )
+        thread.start()
+        thread.join()
+
+        self.assertEqual(
+            cache.get_many(["monitoring:test:a", "monitoring:test:b"]),
+            {"monitoring:test:b": 2},
+        )
+
+    def test_no_cache_without_service_transaction(self):
+        # Transactions of threads outside a service call are never closed
+        _create_transaction(verb=None)
+        self._get_value("test", "domain-test")
+        self._get_value("test", "domain-test")
+
+        self.assertEqual(self.calls, ["test", "test"])
+
+    def test_get_many(self):
+        _create_transaction()
+        cache.set_many({"monitoring:test:a": 1, "monitoring:test:b": 2})
+
+        self.assertEqual(
+            cache.get_many(
+                ["monitoring:test:a", "monitoring:test:b", "monitoring:test:c"]
+            ),
+            {"monitoring:test:a": 1, "monitoring:test:b": 2},
+        )
+
+    @patch("spaceone.monitoring.lib.cache.core_cache")
+    def test_process_cache_generation(self, core_cache):
+        core_cache.get.return_value = 1
+        process_cache = ProcessCache(10, 10)
+        process_cache.set_many({"monitoring:webhook-data:webhook-test": {"a": 1}})
+
+        self.assertEqual(
+            process_cache.get_many(["monitoring:webhook-data:webhook-test"]),
+            {"monitoring:webhook-data:webhook-test": {"a": 1}},
+        )
+
+        # Another process deleted a key
+        core_cache.get.return_value = 2
+        process_cache._checked_at = time.monotonic() - 2
+
+        self.assertEqual(
+            process_cache.get_many(["monitoring:webhook-data:webhook-test"]), {}
+        )
+
+    @patch("spaceone.monitoring.lib.cache.core_cache")
+    def test_process_cache_returns_copies(self, core_cache):
+        core_cache.get.return_value = 1
+        process_cache = ProcessCache(10, 10)
+        webhook_data = {"plugin_options": {"a": 1}}
+        process_cache.set_many({"monitoring:webhook-data:webhook-test": webhook_data})
+
+        # Values are changed by the caller and by other threads
+        webhook_data["plugin_options"]["a"] = 2
+        values = process_cache.get_many(["monitoring:webhook-data:webhook-test"])
+        values["monitoring:webhook-data:webhook-test"]["plugin_options"]["a"] = 3
+
+        self.assertEqual(
+            process_cache.get_many(["monitoring:webhook-data:webhook-test"]),
+            {"monitoring:webhook-data:webhook-test": {"plugin_options": {"a": 1}}},
+        )
+
+    def test_local_tags_are_bounded(self):
+        local_tags = _LocalTags(2)
+        now = time.monotonic()
+
+        local_tags.add("webhook:a", "monitoring:test:a", now + 60)
+        local_tags.add("webhook:b", "monitoring:test:b", now + 60)
+        local_tags.add("webhook:c", "monitoring:test:c", now + 60)
+
+        # Keys of the evicted tag are deleted instead of missing an invalidation
+        self.assertEqual(len(local_tags), 2)
+        self.assertEqual(local_tags.pop_evicted_keys(), ["monitoring:test:a"])
+        self.assertEqual(local_tags.pop_evicted_keys(), [])
+
+    def test_local_tags_expire_with_keys(self):
+        local_tags = _LocalTags(10)
+        now = time.monotonic()
+
+        local_tags.add("webhook:a", "monitoring:test:a", now - 1)
+        self.assertNotIn("webhook:a", local_tags)
+
+        local_tags.add("webhook:b", "monitoring:test:b", now - 1)
+        local_tags.add("webhook:b", "monitoring:test:c", now + 60)
+
+        # Expired keys are dropped when the tag is updated
+        self.assertEqual(local_tags["webhook:b"], {"monitoring:test:c": now + 60})
+        self.assertEqual(local_tags.pop_evicted_keys(), [])
+
+    def test_cache_key_tags(self):
+        params = {
+            "project_id": "project-test",
+            "workspace_id": "workspace-test",
+            "domain_id": "domain-test",
+            "escalation_policy_id": "ep-test",
+        }
+
+        self.assertEqual(
+            cache_key.ESCALATION_POLICY_INFO.format_tags(**params),
+            [
+                "project:domain-test:project-test",
+                "escalation-policy-info:domain-test",
+            ],
+        )
+        self.assertTrue(
+            cache._is_local_key(cache_key.ESCALATION_POLICY_INFO.format(**params))
+        )
+        self.assertFalse(
+            cache._is_local_key(cache_key.ALERT_MESSAGE.format(alert_id="a", **params))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,68 @@
+import threading
+import time
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.lib.endpoint_cache import EndpointCache
+
+
+class TestEndpointCache(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.refreshed = threading.Event()
+
+    def _fetch(self, endpoint):
+        self.calls.append(endpoint)
+        if len(self.calls) > 1:
+            self.refreshed.set()
+
+        return {"endpoint": endpoint}
+
+    def test_get_fresh_entry(self):
+        endpoint_cache = EndpointCache(60, 600)
+
+        endpoint_cache.get("key", lambda: self._fetch("grpc://plugin-a:50051"))
+        response = endpoint_cache.get(
+            "key", lambda: self._fetch("grpc://plugin-b:50051")
+        )
+
+        self.assertEqual(response, {"endpoint": "grpc://plugin-a:50051"})
+        self.assertEqual(self.calls, ["grpc://plugin-a:50051"])
+
+    def test_stale_while_revalidate(self):
+        endpoint_cache = EndpointCache(0, 600)
+
+        endpoint_cache.get("key", lambda: self._fetch("grpc://plugin-a:50051"))
+        time.sleep(0.01)
+        response = endpoint_cache.get(
+            "key", lambda: self._fetch("grpc://plugin-b:50051")
+        )
+
+        # The stale endpoint is returned while it is refreshed in the background
+        self.assertEqual(response, {"endpoint": "grpc://plugin-a:50051"})
+        self.assertTrue(self.refreshed.wait(5))
+
+        endpoint_cache.ttl = 60
+        for _ in range(100):
+            response = endpoint_cache.get("key", lambda: self._fetch("unused"))
+            if response["endpoint"] != "grpc://plugin-a:50051":
+                break
+            time.sleep(0.05)
+
+        self.assertEqual(response, {"endpoint": "grpc://plugin-b:50051"})
+
+    def test_expired_entry(self):
+        endpoint_cache = EndpointCache(0, 0)
+
+        endpoint_cache.get("key", lambda: self._fetch("grpc://plugin-a:50051"))
+        time.sleep(0.01)
+        response = endpoint_cache.get(
+            "key", lambda: self._fetch("grpc://plugin-b:50051")
+        )
+
+        self.assertEqual(response, {"endpoint": "grpc://plugin-b:50051"})
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,87 @@
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.lib import event_rule_matcher
+from spaceone.monitoring.lib.event_rule_matcher import (
+    CompiledEventRuleSet,
+    EventValues,
+)
+from spaceone.monitoring.model.event_rule_model import (
+    EventRule,
+    EventRuleCondition,
+    EventRuleOptions,
+)
+
+
+def _make_event_rule(conditions, conditions_policy="ALL", stop_processing=False):
+    return EventRule(
+        event_rule_id="er-test",
+        order=1,
+        conditions=[EventRuleCondition(**condition) for condition in conditions],
+        conditions_policy=conditions_policy,
+        actions={"change_urgency": "HIGH"},
+        options=EventRuleOptions(stop_processing=stop_processing),
+        project_id="project-test",
+        workspace_id="workspace-test",
+        domain_id="domain-test",
+    )
+
+
+class TestEventRuleMatcher(unittest.TestCase):
+    def test_match_contain_ignores_case(self):
+        rule_set = CompiledEventRuleSet(
+            [
+                _make_event_rule(
+                    [{"key": "title", "value": "CPU", "operator": "contain"}]
+                )
+            ],
+            None,
+        )
+
+        event_values = EventValues({"title": "High cpu usage"})
+        self.assertTrue(rule_set.rules[0].match(event_values))
+
+    def test_match_all_and_any(self):
+        conditions = [
+            {"key": "title", "value": "cpu", "operator": "contain"},
+            {"key": "additional_info.env", "value": "prod", "operator": "eq"},
+        ]
+        all_rule_set = CompiledEventRuleSet([_make_event_rule(conditions)], None)
+        any_rule_set = CompiledEventRuleSet(
+            [_make_event_rule(conditions, conditions_policy="ANY")], None
+        )
+
+        event_data = {"title": "High CPU usage", "additional_info": {"env": "dev"}}
+
+        self.assertFalse(all_rule_set.rules[0].match(EventValues(event_data)))
+        self.assertTrue(any_rule_set.rules[0].match(EventValues(event_data)))
+
+    def test_match_missing_key(self):
+        rule_set = CompiledEventRuleSet(
+            [
+                _make_event_rule(
+                    [{"key": "account", "value": "123", "operator": "not_contain"}]
+                )
+            ],
+            None,
+        )
+
+        self.assertFalse(rule_set.rules[0].match(EventValues({"title": "test"})))
+
+    def test_rule_set_version(self):
+        rule_key = "domain-test:workspace-test:project-test"
+        rule_set = CompiledEventRuleSet([], "version-1")
+        event_rule_matcher.set_rule_set(rule_key, rule_set)
+
+        self.assertIs(
+            event_rule_matcher.get_rule_set(rule_key, "version-1", 300), rule_set
+        )
+        self.assertIsNone(event_rule_matcher.get_rule_set(rule_key, "version-2", 300))
+
+        event_rule_matcher.delete_rule_set(rule_key)
+        self.assertIsNone(event_rule_matcher.get_rule_set(rule_key, "version-1", 300))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,120 @@
+import base64
+import math
+import struct
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.lib import metric_data
+
+
+class TestMetricData(unittest.TestCase):
+    def test_encode_float64(self):
+        encoded = metric_data.encode_float64([1, 2.5, None])
+
+        self.assertEqual(
+            base64.b64decode(encoded), struct.pack("<3d", 1.0, 2.5, math.nan)
+        )
+
+        decoded = metric_data.decode_float64(encoded)
+        self.assertEqual(decoded[:2], [1.0, 2.5])
+        self.assertTrue(math.isnan(decoded[2]))
+
+    def test_encode_values(self):
+        values = {
+            "cloud-svc-a": [1.0, 2.0],
+            "cloud-svc-b": {"cpu": [3.0]},
+            "cloud-svc-c": ["N/A"],
+        }
+
+        encoded = metric_data.encode_values(values, metric_data.FLOAT64_BASE64)
+
+        self.assertEqual(
+            metric_data.decode_float64(encoded["cloud-svc-a"]), [1.0, 2.0]
+        )
+        self.assertEqual(
+            metric_data.decode_float64(encoded["cloud-svc-b"]["cpu"]), [3.0]
+        )
+        self.assertEqual(encoded["cloud-svc-c"], ["N/A"])
+        self.assertIs(metric_data.encode_values(values), values)
+
+    def test_aggregate_values(self):
+        labels = ["t1", "t2"]
+        values = {"a": [1.0, None], "b": [3.0, 4.0], "c": [5.0, 6.0]}
+
+        self.assertEqual(
+            metric_data.aggregate_values(labels, values, "SUM"),
+            {"SUM": [9.0, 10.0]},
+        )
+        self.assertEqual(
+            metric_data.aggregate_values(labels, values, "AVG"),
+            {"AVG": [3.0, 5.0]},
+        )
+        self.assertAlmostEqual(
+            metric_data.aggregate_values(labels, values, "P95")["P95"][0], 4.8
+        )
+
+    def test_downsample_by_stat(self):
+        labels = [f"t{index}" for index in range(6)]
+        values = {"a": [1, 5, 2, None, 3, 4], "b": [1, 1, 1, 1, 1, 1]}
+
+        labels, values = metric_data.downsample(labels, values, 3, "MAX")
+
+        self.assertEqual(labels, ["t0", "t2", "t4"])
+        self.assertEqual(values, {"a": [5, 2, 4], "b": [1, 1, 1]})
+
+    def test_downsample_single_series_with_lttb(self):
+        labels = list(range(100))
+        series = [0.0] * 100
+        series[37] = 10.0
+
+        labels, values = metric_data.downsample(labels, {"a": series}, 10)
+
+        self.assertEqual(len(labels), 10)
+        self.assertEqual(labels[0], 0)
+        self.assertEqual(labels[-1], 99)
+        # The peak is kept
+        self.assertIn(37, labels)
+        self.assertIn(10.0, values["a"])
+
+    def test_split_and_merge_windows(self):
+        labels = [
+            "2023-01-01T00:00:00.000Z",
+            "2023-01-01T00:30:00.000Z",
+            "2023-01-01T01:00:00.000Z",
+        ]
+        values = {"a": [1, 2, 3]}
+        start = metric_data.to_timestamp(labels[0])
+        windows = metric_data.get_windows(start + 60, start + 3600, 3600)
+
+        split_data = metric_data.split_windows(labels, values, windows, 3600)
+
+        self.assertEqual(windows, [start, start + 3600])
+        self.assertEqual(split_data[0], (labels[:2], {"a": [1, 2]}))
+        self.assertEqual(split_data[1], (labels[2:], {"a": [3]}))
+
+        # A series missing in a window is filled with None
+        merged_labels, merged_values = metric_data.merge_windows(
+            [split_data[0], (labels[2:], {"b": [4]})]
+        )
+        self.assertEqual(merged_labels, labels)
+        self.assertEqual(merged_values, {"a": [1, 2, None], "b": [None, None, 4]})
+
+        self.assertEqual(
+            metric_data.trim(labels, values, start + 60, start + 3600),
+            (labels[1:], {"a": [2, 3]}),
+        )
+        self.assertIsNone(metric_data.split_windows(["t1"], {"a": [1]}, windows, 3600))
+
+    def test_trim_after(self):
+        labels = ["2023-01-01T00:00:00Z", "2023-01-01T00:05:00Z"]
+        last_timestamp = metric_data.to_timestamp(labels[0])
+
+        self.assertEqual(
+            metric_data.trim_after(labels, {"a": [1, 2]}, last_timestamp),
+            (labels[1:], {"a": [2]}),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
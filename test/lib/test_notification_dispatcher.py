@@ -0,0 +1,73 @@
+import threading
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.lib.notification_dispatcher import (
+    NotificationDispatcher,
+    TokenBucket,
+)
+
+
+class TestNotificationDispatcher(unittest.TestCase):
+    def test_token_bucket(self):
+        token_bucket = TokenBucket(2)
+
+        self.assertTrue(token_bucket.acquire())
+        self.assertTrue(token_bucket.acquire())
+        self.assertFalse(token_bucket.acquire())
+        self.assertGreater(token_bucket.get_wait_time(), 0)
+
+    def test_send_notifications(self):
+        dispatcher = NotificationDispatcher(10, 0, 5)
+        sent = []
+        finished = threading.Event()
+
+        def _send(name):
+            sent.append(name)
+            if len(sent) == 3:
+                finished.set()
+
+        for name in ["first", "second", "third"]:
+            self.assertTrue(
+                dispatcher.put("domain-test", "HIGH", lambda n=name: _send(n))
+            )
+
+        self.assertTrue(finished.wait(5))
+        self.assertEqual(sent, ["first", "second", "third"])
+
+    def test_queue_full(self):
+        dispatcher = NotificationDispatcher(1, 0, 1)
+        blocked = threading.Event()
+        release = threading.Event()
+
+        def _block():
+            blocked.set()
+            release.wait(5)
+
+        dispatcher.put("domain-test", "LOW", _block)
+        blocked.wait(5)
+
+        # A notification is counted until it is sent
+        self.assertFalse(dispatcher.put("domain-test", "LOW", lambda: None))
+        release.set()
+
+        self.assertTrue(dispatcher.flush(5))
+        self.assertTrue(dispatcher.put("domain-test", "LOW", lambda: None))
+
+    def test_deferred_notifications_count_against_queue_size(self):
+        dispatcher = NotificationDispatcher(2, 1, 10)
+        first_sent = threading.Event()
+
+        dispatcher.put("domain-test", "LOW", first_sent.set)
+        dispatcher.put("domain-test", "LOW", lambda: None)
+        self.assertTrue(first_sent.wait(5))
+
+        # The rate limit defers the second notification for about a second
+        self.assertTrue(dispatcher.put("domain-test", "LOW", lambda: None))
+        self.assertFalse(dispatcher.put("domain-test", "LOW", lambda: None))
+
+        self.assertTrue(dispatcher.flush(5))
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
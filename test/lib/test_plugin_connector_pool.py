@@ -0,0 +1,97 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from spaceone.core.error import ERROR_GRPC_CONNECTION
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.lib.plugin_connector_pool import PluginConnectorPool
+
+_ENDPOINT = "grpc://plugin-test:50051"
+
+
+def _create_channel(endpoint):
+    plugin_channel = MagicMock()
+    plugin_channel.in_flight = 0
+    plugin_channel.healthy = True
+    plugin_channel.call.return_value = {"endpoint": endpoint}
+    return plugin_channel
+
+
+@patch.object(PluginConnectorPool, "_create_channel", side_effect=_create_channel)
+class TestPluginConnectorPool(unittest.TestCase):
+    def test_reuse_channel(self, create_channel):
+        connector_pool = PluginConnectorPool(2, 10, 300)
+
+        for _ in range(3):
+            response = connector_pool.dispatch(_ENDPOINT, "Metric.get_data", {})
+            self.assertEqual(response, {"endpoint": _ENDPOINT})
+
+        self.assertEqual(create_channel.call_count, 1)
+
+    def test_open_channel_when_saturated(self, create_channel):
+        connector_pool = PluginConnectorPool(2, 1, 300)
+
+        first = connector_pool._acquire(_ENDPOINT)
+        second = connector_pool._acquire(_ENDPOINT)
+        third = connector_pool._acquire(_ENDPOINT)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(create_channel.call_count, 2)
+        # max_channels is reached, so the least loaded channel is shared
+        self.assertEqual(third.in_flight, 2)
+
+    def test_close_failed_channel(self, create_channel):
+        connector_pool = PluginConnectorPool(2, 10, 300)
+        plugin_channel = connector_pool._acquire(_ENDPOINT)
+        plugin_channel.call.side_effect = ERROR_GRPC_CONNECTION(
+            channel=_ENDPOINT, message="Channel is not ready."
+        )
+        connector_pool._release(_ENDPOINT, plugin_channel)
+
+        with self.assertRaises(ERROR_GRPC_CONNECTION):
+            connector_pool.dispatch(_ENDPOINT, "Metric.get_data", {})
+
+        plugin_channel.close.assert_called_once()
+
+        connector_pool.dispatch(_ENDPOINT, "Metric.get_data", {})
+        self.assertEqual(create_channel.call_count, 2)
+
+    def test_limit_channels_under_concurrency(self, create_channel):
+        connector_pool = PluginConnectorPool(2, 1, 300)
+        barrier = threading.Barrier(8)
+        created = []
+
+        def _create_slow_channel(endpoint):
+            time.sleep(0.05)
+            created.append(_create_channel(endpoint))
+            return created[-1]
+
+        create_channel.side_effect = _create_slow_channel
+
+        def _acquire():
+            barrier.wait()
+            acquired.append(connector_pool._acquire(_ENDPOINT))
+
+        acquired = []
+        threads = [threading.Thread(target=_acquire) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        channels = connector_pool._channels[_ENDPOINT]
+        self.assertEqual(len(channels), 2)
+        self.assertEqual(sum(channel.in_flight for channel in channels), 8)
+        self.assertTrue(all(channel in channels for channel in acquired))
+
+        # Channels opened over the limit are closed
+        self.assertGreater(len(created), 2)
+        for channel in created:
+            self.assertEqual(channel.close.called, channel not in channels)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
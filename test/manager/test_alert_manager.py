@@ -0,0 +1,159 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core import config
+from spaceone.core.transaction import delete_transaction
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.manager import alert_manager
+from spaceone.monitoring.manager.alert_manager import AlertManager
+from spaceone.monitoring.model.alert_model import Alert, AlertNumber
+
+_DOMAIN_ID = "domain-a1b2c3d4e5f6"
+_WORKSPACE_ID = "workspace-a1b2c3d4e5f6"
+
+
+class TestAlertManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.monitoring")
+        connect(
+            "test",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        # Managers share the transaction of the thread
+        delete_transaction()
+
+    def tearDown(self, *args) -> None:
+        Alert.objects.filter().delete()
+        AlertNumber.objects.filter().delete()
+        alert_manager._RESERVED_ALERT_NUMBERS.clear()
+
+    @staticmethod
+    def _create_alert(**kwargs) -> Alert:
+        return Alert.create(
+            {
+                "alert_number": 1,
+                "title": "CPU usage is high",
+                "description": "CPU usage is 90%",
+                "project_id": "project-a1b2c3d4e5f6",
+                "workspace_id": _WORKSPACE_ID,
+                "domain_id": _DOMAIN_ID,
+                **kwargs,
+            }
+        )
+
+    @patch("spaceone.monitoring.manager.alert_manager.cache.delete")
+    def test_keep_message_cache_if_message_is_not_changed(self, mock_delete):
+        alert_vo = self._create_alert()
+        alert_mgr = AlertManager()
+
+        # Duplicate events update the alert with the same description
+        alert_mgr.update_alert_by_vo(
+            {"description": "CPU usage is 90%", "escalation_ttl": 3}, alert_vo
+        )
+        mock_delete.assert_not_called()
+
+        alert_mgr.update_alert_by_vo({"description": "CPU usage is 95%"}, alert_vo)
+        mock_delete.assert_called_once()
+
+    @patch("spaceone.monitoring.manager.alert_manager.cache")
+    def test_delete_event_key_indexes_if_alert_is_resolved(self, mock_cache):
+        mock_delete_tags = mock_cache.delete_tags
+        alert_vo = self._create_alert()
+        alert_mgr = AlertManager()
+
+        alert_mgr.update_alert_by_vo({"description": "CPU usage is 95%"}, alert_vo)
+        mock_delete_tags.assert_not_called()
+
+        alert_mgr.update_alert_by_vo({"state": "RESOLVED"}, alert_vo)
+        mock_delete_tags.assert_called_once_with(
+            f"alert:{_DOMAIN_ID}:{alert_vo.alert_id}"
+        )
+
+    @staticmethod
+    def _get_next_alert_number() -> int:
+        alert_number_vo = AlertNumber.objects.get(
+            domain_id=_DOMAIN_ID, workspace_id=_WORKSPACE_ID
+        )
+        return alert_number_vo.next
+
+    def test_get_alert_number(self):
+        alert_mgr = AlertManager()
+
+        self.assertEqual(
+            [alert_mgr._get_alert_number(_DOMAIN_ID, _WORKSPACE_ID) for _ in range(3)],
+            [1, 2, 3],
+        )
+        self.assertEqual(
+            alert_mgr._get_alert_number(_DOMAIN_ID, "workspace-f6e5d4c3b2a1"), 1
+        )
+
+    def test_get_alert_number_rollback(self):
+        AlertManager()._get_alert_number(_DOMAIN_ID, _WORKSPACE_ID)
+        delete_transaction()
+
+        alert_mgr = AlertManager()
+        self.assertEqual(alert_mgr._get_alert_number(_DOMAIN_ID, _WORKSPACE_ID), 2)
+
+        alert_mgr.transaction.execute_rollback()
+
+        # Only the number of the failed request is returned
+        self.assertEqual(self._get_next_alert_number(), 1)
+
+    def test_get_alert_number_from_block(self):
+        config.set_global_force(ALERT_NUMBER_BLOCK_SIZE=10)
+        self.addCleanup(config.set_global_force, ALERT_NUMBER_BLOCK_SIZE=1)
+
+        alert_mgr = AlertManager()
+        alert_numbers = [
+            alert_mgr._get_alert_number(_DOMAIN_ID, _WORKSPACE_ID) for _ in range(12)
+        ]
+
+        self.assertEqual(alert_numbers, list(range(1, 13)))
+        self.assertEqual(self._get_next_alert_number(), 20)
+
+        # Reserved numbers are not returned on rollback
+        alert_mgr.transaction.execute_rollback()
+        self.assertEqual(self._get_next_alert_number(), 20)
+
+    def test_get_alert_number_from_block_in_threads(self):
+        config.set_global_force(ALERT_NUMBER_BLOCK_SIZE=5)
+        self.addCleanup(config.set_global_force, ALERT_NUMBER_BLOCK_SIZE=1)
+
+        barrier = threading.Barrier(8)
+        alert_numbers = []
+
+        def _get_alert_numbers():
+            alert_mgr = AlertManager()
+            barrier.wait()
+
+            for _ in range(10):
+                alert_number = alert_mgr._get_alert_number(_DOMAIN_ID, _WORKSPACE_ID)
+                alert_numbers.append(alert_number)
+
+        threads = [threading.Thread(target=_get_alert_numbers) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(alert_numbers), list(range(1, 81)))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
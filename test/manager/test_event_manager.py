@@ -1,15 +1,20 @@
 import unittest
 from datetime import datetime, timedelta
 from unittest.mock import patch
+import mongomock
 from mongoengine import connect, disconnect
 
 from spaceone.core.unittest.result import print_data
 from spaceone.core.unittest.runner import RichTestRunner
 from spaceone.core import config
 from spaceone.core import utils
+from spaceone.core.error import ERROR_DB_QUERY
 from spaceone.core.transaction import Transaction
+from spaceone.monitoring.info.event_info import EventsInfo
 from spaceone.monitoring.manager.event_manager import EventManager
+from spaceone.monitoring.model.alert_model import Alert
 from spaceone.monitoring.model.event_model import *
+from spaceone.monitoring.model.event_raw_data_model import EventRawData
 from test.factory.event_factory import EventFactory
 
 
@@ -19,7 +24,11 @@ class TestEventManager(unittest.TestCase):
         config.init_conf(package="spaceone.monitoring")
         config.set_service_config()
         config.set_global(MOCK_MODE=True)
-        connect("test", host="mongomock://localhost")
+        connect(
+            "test",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
 
         cls.domain_id = utils.generate_id("domain")
         cls.transaction = Transaction({"service": "monitoring", "api_class": "Event"})
@@ -35,6 +44,7 @@ class TestEventManager(unittest.TestCase):
         print("(tearDown) ==> Delete all data_sources")
         event_vos = Event.objects.filter()
         event_vos.delete()
+        EventRawData.objects.filter().delete()
 
     def test_update_event_by_vo(self):
         test_event = EventFactory(
@@ -53,6 +63,184 @@ class TestEventManager(unittest.TestCase):
 
         self.assertEqual(merge_to, updated_event_info.alert_id)
 
+    def _make_event_data(self, **kwargs):
+        return {
+            "event_key": utils.random_string(),
+            "event_type": "ALERT",
+            "title": " TRIGGERED ",
+            "severity": "CRITICAL",
+            "project_id": "project-a1b2c3d4e5f6",
+            "workspace_id": "workspace-a1b2c3d4e5f6",
+            "domain_id": self.domain_id,
+            # Added by event rule actions, but not fields of Event
+            "assignee": "user1@example.com",
+            "urgency": "HIGH",
+            "escalation_policy_id": "ep-a1b2c3d4e5f6",
+            "no_notification": False,
+            **kwargs,
+        }
+
+    @patch("spaceone.monitoring.manager.event_manager.cache.set_many")
+    def test_create_events(self, *args):
+        event_mgr = EventManager(transaction=self.transaction)
+        event_vos = event_mgr.create_events(
+            [self._make_event_data(), self._make_event_data()]
+        )
+
+        self.assertEqual(len(event_vos), 2)
+        self.assertEqual(Event.objects.filter(domain_id=self.domain_id).count(), 2)
+        self.assertEqual(event_vos[0].title, "TRIGGERED")
+        self.assertNotEqual(event_vos[0].event_id, event_vos[1].event_id)
+
+    @patch("spaceone.monitoring.manager.event_manager.cache.set_many")
+    def test_create_events_rollback(self, *args):
+        event_mgr = EventManager()
+        event_mgr.create_events([self._make_event_data(), self._make_event_data()])
+
+        event_mgr.transaction.execute_rollback()
+
+        self.assertEqual(Event.objects.filter(domain_id=self.domain_id).count(), 0)
+
+    def test_create_events_with_invalid_data(self):
+        event_mgr = EventManager(transaction=self.transaction)
+
+        with self.assertRaises(ERROR_DB_QUERY):
+            event_mgr.create_events([self._make_event_data(severity="UNKNOWN")])
+
+    def test_get_event_key_index_without_cache(self):
+        caches = config.get_global("CACHES")
+        config.set_global_force(CACHES={})
+        self.addCleanup(config.set_global_force, CACHES=caches)
+
+        event_data = self._make_event_data()
+        event_mgr = EventManager(transaction=self.transaction)
+        event_vo = event_mgr.create_events([event_data])[0]
+
+        event_key_index = event_mgr.get_event_key_index(
+            event_data["event_key"],
+            self.domain_id,
+            event_data["project_id"],
+            event_data["workspace_id"],
+            600,
+        )
+
+        self.assertEqual(event_key_index["event_id"], event_vo.event_id)
+        self.assertEqual(event_key_index["alert_state"], None)
+        # MongoDB stores created_at in milliseconds
+        self.assertAlmostEqual(
+            event_key_index["created_at"], event_vo.created_at.timestamp(), places=2
+        )
+
+    @patch("spaceone.monitoring.manager.event_manager.cache")
+    def test_get_event_key_index_from_cache(self, mock_cache):
+        alert_vo = Alert.create(
+            {
+                "alert_number": 1,
+                "title": "CPU usage is high",
+                "state": "ACKNOWLEDGED",
+                "project_id": "project-a1b2c3d4e5f6",
+                "workspace_id": "workspace-a1b2c3d4e5f6",
+                "domain_id": self.domain_id,
+            }
+        )
+        self.addCleanup(alert_vo.delete)
+
+        event_data = self._make_event_data(alert=alert_vo, alert_id=alert_vo.alert_id)
+        event_mgr = EventManager(transaction=self.transaction)
+        event_vos = event_mgr.create_events([event_data, dict(event_data)])
+
+        # The index of a batch is written with one call
+        mock_cache.set_many.assert_called_once()
+        event_key_indexes = mock_cache.set_many.call_args[0][0]
+        self.assertEqual(len(event_key_indexes), 1)
+
+        event_key_index = list(event_key_indexes.values())[0]
+        self.assertEqual(event_key_index["event_id"], event_vos[-1].event_id)
+        self.assertEqual(event_key_index["alert_state"], "ACKNOWLEDGED")
+        self.assertEqual(
+            mock_cache.set_many.call_args[1]["tags"],
+            {
+                key: [f"alert:{self.domain_id}:{alert_vo.alert_id}"]
+                for key in event_key_indexes
+            },
+        )
+
+        mock_cache.get.return_value = event_key_index
+
+        # Duplicate events are found without a query
+        with patch.object(Event, "filter") as mock_filter:
+            self.assertEqual(
+                event_mgr.get_event_key_index(
+                    event_data["event_key"],
+                    self.domain_id,
+                    event_data["project_id"],
+                    event_data["workspace_id"],
+                    600,
+                ),
+                event_key_index,
+            )
+            mock_filter.assert_not_called()
+
+    def _create_events_with_raw_data_store(self, params_list: list) -> list:
+        config.set_global_force(EVENT_RAW_DATA_STORE=True)
+        self.addCleanup(config.set_global_force, EVENT_RAW_DATA_STORE=False)
+
+        event_mgr = EventManager(transaction=self.transaction)
+        with patch("spaceone.monitoring.manager.event_manager.cache.set_many"):
+            return event_mgr.create_events(params_list)
+
+    def test_store_raw_data(self):
+        raw_data = {"message": "CPU usage is high " * 100}
+        event_vo = self._create_events_with_raw_data_store(
+            [self._make_event_data(raw_data=raw_data)]
+        )[0]
+
+        self.assertEqual(event_vo.raw_data, {})
+        self.assertEqual(event_vo.get_raw_data(), raw_data)
+
+        raw_data_vo = EventRawData.objects.get(raw_data_hash=event_vo.raw_data_hash)
+        self.assertEqual(raw_data_vo.compression, "ZLIB")
+        self.assertLess(len(raw_data_vo.data), len(raw_data["message"]))
+
+    def test_store_raw_data_once(self):
+        # Events parsed from the same payload and retried payloads are deduplicated
+        raw_data = {"alerts": [{"name": "cpu"}, {"name": "memory"}]}
+        event_vos = self._create_events_with_raw_data_store(
+            [
+                self._make_event_data(raw_data=raw_data),
+                self._make_event_data(raw_data=raw_data),
+                self._make_event_data(raw_data=dict(raw_data)),
+                self._make_event_data(raw_data=raw_data, domain_id="domain-other"),
+            ]
+        )
+
+        self.assertEqual(EventRawData.objects.count(), 2)
+        self.assertEqual(len({event_vo.raw_data_hash for event_vo in event_vos}), 2)
+        self.assertEqual(event_vos[0].raw_data_hash, event_vos[2].raw_data_hash)
+
+    def test_events_info_with_raw_data_store(self):
+        event_vos = self._create_events_with_raw_data_store(
+            [
+                self._make_event_data(raw_data={"name": "cpu"}),
+                self._make_event_data(raw_data={"name": "memory"}),
+                self._make_event_data(),
+            ]
+        )
+
+        with patch.object(
+            EventRawData,
+            "get_data_by_hashes",
+            wraps=EventRawData.get_data_by_hashes,
+        ) as mock_get_data_by_hashes:
+            events_info = EventsInfo(event_vos, len(event_vos))
+
+        # Raw data is loaded once for all events, not once for each event
+        mock_get_data_by_hashes.assert_called_once()
+        self.assertEqual(
+            [dict(event_info.raw_data) for event_info in events_info.results],
+            [{"name": "cpu"}, {"name": "memory"}, {}],
+        )
+
 
 if __name__ == "__main__":
     unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,87 @@
+import unittest
+from unittest.mock import patch
+
+from spaceone.core import config
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.lib.event_rule_matcher import CompiledEventRuleSet
+from spaceone.monitoring.manager.event_rule_manager import EventRuleManager
+from spaceone.monitoring.model.event_rule_model import EventRule
+
+_DOMAIN_ID = "domain-a1b2c3d4e5f6"
+_WORKSPACE_ID = "workspace-a1b2c3d4e5f6"
+
+
+def _make_rule_set(project_id: str, next_project_id: str) -> CompiledEventRuleSet:
+    event_rule_vo = EventRule(
+        event_rule_id=f"er-{project_id}",
+        order=1,
+        conditions=[],
+        conditions_policy="ALWAYS",
+        actions={"change_project": next_project_id},
+        project_id=project_id,
+        workspace_id=_WORKSPACE_ID,
+        domain_id=_DOMAIN_ID,
+    )
+    return CompiledEventRuleSet([event_rule_vo], None)
+
+
+class TestEventRuleManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.monitoring")
+        super().setUpClass()
+
+    def tearDown(self) -> None:
+        config.set_global_force(EVENT_RULE_MAX_DEPTH=10)
+
+    def _change_event_data(self, routes: dict) -> tuple:
+        evaluated_project_ids = []
+
+        def _get_compiled_event_rules(project_id, domain_id, workspace_id):
+            evaluated_project_ids.append(project_id)
+            return _make_rule_set(project_id, routes[project_id])
+
+        with patch.object(
+            EventRuleManager,
+            "_get_compiled_event_rules",
+            side_effect=_get_compiled_event_rules,
+        ):
+            event_data = EventRuleManager().change_event_data(
+                {"title": "CPU usage is high", "project_id": "project-a"},
+                "project-a",
+                _DOMAIN_ID,
+                _WORKSPACE_ID,
+            )
+
+        return event_data, evaluated_project_ids
+
+    def test_change_project_cycle(self):
+        event_data, evaluated_project_ids = self._change_event_data(
+            {"project-a": "project-b", "project-b": "project-a"}
+        )
+
+        # B -> A is skipped
+        self.assertEqual(event_data["project_id"], "project-b")
+        self.assertEqual(evaluated_project_ids, ["project-a", "project-b"])
+
+    def test_change_project_max_depth(self):
+        config.set_global_force(EVENT_RULE_MAX_DEPTH=3)
+
+        event_data, evaluated_project_ids = self._change_event_data(
+            {
+                "project-a": "project-b",
+                "project-b": "project-c",
+                "project-c": "project-d",
+                "project-d": "project-e",
+            }
+        )
+
+        self.assertEqual(event_data["project_id"], "project-c")
+        self.assertEqual(
+            evaluated_project_ids, ["project-a", "project-b", "project-c"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,231 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core import config
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.manager.alert_manager import AlertManager
+from spaceone.monitoring.manager.notification_manager import NotificationManager
+from spaceone.monitoring.model.alert_model import Alert
+from spaceone.monitoring.model.escalation_policy_model import EscalationPolicy
+from spaceone.monitoring.model.project_alert_config_model import ProjectAlertConfig
+from spaceone.monitoring.service.job_service import JobService
+
+_DOMAIN_ID = "domain-a1b2c3d4e5f6"
+_WORKSPACE_ID = "workspace-a1b2c3d4e5f6"
+_ESCALATION_POLICY_ID = "ep-a1b2c3d4e5f6"
+
+
+def _bulk_write(self, updates):
+    # mongomock does not support UpdateOne of recent pymongo versions
+    for alert_id, params in updates:
+        Alert._get_collection().update_one({"alert_id": alert_id}, {"$set": params})
+
+
+@patch.object(AlertManager, "_bulk_write", _bulk_write)
+class TestJobService(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.monitoring")
+        config.set_global_force(CACHES={})
+        connect(
+            "test",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def tearDown(self, *args) -> None:
+        Alert.objects.filter().delete()
+        ProjectAlertConfig.objects.filter().delete()
+        EscalationPolicy.objects.filter().delete()
+
+    @staticmethod
+    def _create_alert(title: str, **kwargs) -> Alert:
+        return Alert.create(
+            {
+                "alert_number": 1,
+                "title": title,
+                "state": "TRIGGERED",
+                "escalation_ttl": 3,
+                "escalation_policy_id": _ESCALATION_POLICY_ID,
+                "project_id": "project-a1b2c3d4e5f6",
+                "workspace_id": _WORKSPACE_ID,
+                "domain_id": _DOMAIN_ID,
+                **kwargs,
+            }
+        )
+
+    def _list_due_alert_titles(self) -> list:
+        alert_vos, total_count = JobService()._list_open_alerts(_DOMAIN_ID)
+        return sorted(
+            Alert.objects.get(alert_id=alert_vo.alert_id).title
+            for alert_vo in alert_vos
+        )
+
+    def test_list_due_alerts(self):
+        now = datetime.utcnow()
+        self._create_alert("new")
+        self._create_alert("due", next_escalation_at=now - timedelta(minutes=1))
+        self._create_alert("not-due", next_escalation_at=now + timedelta(hours=1))
+        self._create_alert("resolved", state="RESOLVED")
+        self._create_alert("finished", escalation_ttl=0)
+        self._create_alert("other-domain", domain_id="domain-f6e5d4c3b2a1")
+
+        self.assertEqual(self._list_due_alert_titles(), ["due", "new"])
+        self.assertEqual(
+            sorted(JobService()._list_domains_of_alerts()),
+            sorted([_DOMAIN_ID, "domain-f6e5d4c3b2a1"]),
+        )
+
+    def test_list_domains_without_due_alerts(self):
+        self._create_alert(
+            "not-due", next_escalation_at=datetime.utcnow() + timedelta(hours=1)
+        )
+
+        self.assertEqual(JobService()._list_domains_of_alerts(), [])
+
+    def test_reset_escalation_schedule_by_policy(self):
+        self._create_alert(
+            "not-due", next_escalation_at=datetime.utcnow() + timedelta(hours=1)
+        )
+        self.assertEqual(self._list_due_alert_titles(), [])
+
+        # The rules of the escalation policy are changed
+        AlertManager().reset_escalation_schedule_by_policy(
+            _ESCALATION_POLICY_ID, _DOMAIN_ID
+        )
+
+        self.assertEqual(self._list_due_alert_titles(), ["not-due"])
+
+    def test_stop_escalation_by_project(self):
+        self._create_alert("new")
+        self._create_alert("other-project", project_id="project-f6e5d4c3b2a1")
+
+        # The project alert config is deleted
+        AlertManager().stop_escalation_by_project(
+            "project-a1b2c3d4e5f6", _WORKSPACE_ID, _DOMAIN_ID
+        )
+
+        self.assertEqual(self._list_due_alert_titles(), ["other-project"])
+
+    @staticmethod
+    def _create_escalation_policy() -> None:
+        escalation_policy_vo = EscalationPolicy.create(
+            {
+                "escalation_policy_id": _ESCALATION_POLICY_ID,
+                "name": "Default",
+                "rules": [
+                    {"notification_level": "ALL", "escalate_minutes": 10},
+                    {"notification_level": "LV1", "escalate_minutes": 10},
+                ],
+                "workspace_id": _WORKSPACE_ID,
+                "domain_id": _DOMAIN_ID,
+            }
+        )
+        ProjectAlertConfig.create(
+            {
+                "project_id": "project-a1b2c3d4e5f6",
+                "escalation_policy": escalation_policy_vo,
+                "escalation_policy_id": _ESCALATION_POLICY_ID,
+                "workspace_id": _WORKSPACE_ID,
+                "domain_id": _DOMAIN_ID,
+            }
+        )
+
+    @patch.object(NotificationManager, "__init__", return_value=None)
+    @patch.object(NotificationManager, "create_notification")
+    @patch.object(JobService, "_create_message", return_value={})
+    def test_create_alert_notifications(self, mock_create_message, *args):
+        self._create_escalation_policy()
+        escalated_at = datetime.utcnow() - timedelta(minutes=20)
+        new_alert_vo = self._create_alert("new")
+        due_alert_vo = self._create_alert(
+            "due", escalated_at=escalated_at, next_escalation_at=escalated_at
+        )
+        no_policy_alert_vo = self._create_alert(
+            "no-policy", escalation_policy_id="ep-f6e5d4c3b2a1"
+        )
+
+        JobService().create_alert_notifications(
+            {
+                "alert_ids": [
+                    new_alert_vo.alert_id,
+                    due_alert_vo.alert_id,
+                    no_policy_alert_vo.alert_id,
+                ],
+                "domain_id": _DOMAIN_ID,
+            }
+        )
+
+        self.assertEqual(mock_create_message.call_count, 2)
+
+        new_alert_vo.reload()
+        self.assertIsNotNone(new_alert_vo.escalated_at)
+        self.assertGreater(new_alert_vo.next_escalation_at, datetime.utcnow())
+
+        due_alert_vo.reload()
+        self.assertEqual(due_alert_vo.escalation_step, 2)
+
+        # An alert whose escalation policy is missing is not selected again
+        no_policy_alert_vo.reload()
+        self.assertEqual(no_policy_alert_vo.escalation_ttl, 0)
+        self.assertEqual(self._list_due_alert_titles(), [])
+
+    def test_get_project_alert_options_info(self):
+        ProjectAlertConfig.create(
+            {
+                "project_id": "project-a1b2c3d4e5f6",
+                "options": {"notification_urgency": "HIGH_ONLY"},
+                "workspace_id": "workspace-f6e5d4c3b2a1",
+                "domain_id": _DOMAIN_ID,
+            }
+        )
+        other_alert_vo = self._create_alert(
+            "other-workspace", workspace_id="workspace-f6e5d4c3b2a1"
+        )
+
+        alert_options_info = JobService()._get_project_alert_options_info(
+            [self._create_alert("new"), other_alert_vo], _DOMAIN_ID
+        )
+
+        # The config of the same project ID in another workspace is not used
+        self.assertEqual(
+            alert_options_info,
+            {
+                ("workspace-f6e5d4c3b2a1", "project-a1b2c3d4e5f6"): {
+                    "notification_urgency": "HIGH_ONLY",
+                    "recovery_mode": "MANUAL",
+                }
+            },
+        )
+
+    @patch.object(AlertManager, "_delete_message_cache")
+    def test_update_alerts_by_bulk_rollback(self, mock_delete_message_cache):
+        alert_vo = self._create_alert("new")
+        alert_mgr = AlertManager()
+
+        alert_mgr.update_alerts_by_bulk(
+            [(alert_vo, {"escalation_step": 2, "urgency": "LOW"})]
+        )
+        self.assertEqual(alert_vo.escalation_step, 2)
+        mock_delete_message_cache.assert_called_once_with(alert_vo)
+
+        alert_mgr.transaction.execute_rollback()
+
+        alert_vo.reload()
+        self.assertEqual(alert_vo.escalation_step, 1)
+        self.assertEqual(alert_vo.urgency, "HIGH")
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
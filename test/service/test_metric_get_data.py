@@ -0,0 +1,295 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from spaceone.core import config
+from spaceone.core.error import ERROR_INVALID_PARAMETER
+from spaceone.core.locator import Locator
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.error import ERROR_INCOMPLETE_METRIC_DATA
+from spaceone.monitoring.lib import cache_key
+from spaceone.monitoring.service.metric_service import MetricService
+
+_ENDPOINT = "grpc://plugin-test:50051"
+_START = "2023-01-01T00:00:00.000Z"
+_END = "2023-01-01T02:30:00.000Z"
+
+
+class FakeCache:
+    def __init__(self):
+        self.values = {}
+
+    def get_many(self, keys):
+        return {key: self.values[key] for key in keys if key in self.values}
+
+    def set(self, key, value, expire=None, tags=None):
+        self.values[key] = value
+
+    def set_many(self, values, expire=None, tags=None):
+        self.values.update(values)
+
+
+@patch.object(Locator, "get_manager", side_effect=lambda *args: MagicMock())
+class TestMetricGetData(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.monitoring")
+        config.set_global_force(METRIC_DATA_CACHE_DELAY=0)
+        super().setUpClass()
+
+    def setUp(self):
+        self.fake_cache = FakeCache()
+        cache_patcher = patch(
+            "spaceone.monitoring.service.metric_service.cache", self.fake_cache
+        )
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+
+    @staticmethod
+    def _make_params():
+        return {
+            "data_source_id": "ds-a1b2c3d4e5f6",
+            "domain_id": "domain-a1b2c3d4e5f6",
+            "metric": "cpu",
+            "metric_query": {"cloud-svc-a": {}},
+            "start": _START,
+            "end": _END,
+            "period": 600,
+        }
+
+    def _get_data_by_windows(self, metric_service, params, resources_chunks=None):
+        if resources_chunks is None:
+            resources_chunks = {"chunk-a": {"metric_query": params["metric_query"]}}
+
+        return metric_service._get_metric_data_by_windows(
+            _ENDPOINT,
+            metric_service.set_metric_data_params(params),
+            resources_chunks,
+            params,
+            3600,
+            metric_service._make_query_hash(params, resources_chunks, 3600),
+        )
+
+    def test_get_data_without_timestamp_labels(self, *args):
+        metric_service = MetricService()
+        get_metric_data = metric_service.ds_plugin_mgr.get_metric_data
+        get_metric_data.return_value = {
+            "labels": ["a", "b"],
+            "values": {"cloud-svc-a": [1, 2]},
+        }
+        params = self._make_params()
+
+        self.assertEqual(
+            self._get_data_by_windows(metric_service, params),
+            (["a", "b"], {"cloud-svc-a": [1, 2]}, True),
+        )
+        # The requested range is aligned, so the first fetch is returned as is
+        self.assertEqual(get_metric_data.call_count, 1)
+
+        params["start"] = "2023-01-01T00:10:00.000Z"
+        self._get_data_by_windows(metric_service, params)
+
+        # The data source is fetched without windows from now on
+        self.assertEqual(get_metric_data.call_count, 2)
+        self.assertEqual(get_metric_data.call_args[0][1]["start"], params["start"])
+        self.assertIn(
+            cache_key.METRIC_DATA_UNWINDOWED.format(
+                domain_id=params["domain_id"], data_source_id=params["data_source_id"]
+            ),
+            self.fake_cache.values,
+        )
+
+    def test_get_data_by_windows_with_resolved_resources(self, *args):
+        metric_service = MetricService()
+        get_metric_data = metric_service.ds_plugin_mgr.get_metric_data
+        get_metric_data.side_effect = lambda endpoint, chunk_params: {
+            "labels": ["2023-01-01T00:00:00.000Z", "2023-01-01T01:00:00.000Z"],
+            "values": {key: [1, 2] for key in chunk_params["metric_query"]},
+        }
+        params = {
+            **self._make_params(),
+            "metric_query": {"cloud-svc-a": {}, "cloud-svc-b": {}},
+            "start": "2023-01-01T00:00:00.000Z",
+            "end": "2023-01-01T02:00:00.000Z",
+            "workspace_id": "workspace-a1b2c3d4e5f6",
+        }
+
+        # Both callers send the same metric_query, but the inventory resolves
+        # only the resources that each of them can see.
+        self._get_data_by_windows(
+            metric_service,
+            params,
+            {"chunk-a": {"metric_query": {"cloud-svc-a": {}, "cloud-svc-b": {}}}},
+        )
+        cached_keys = set(self.fake_cache.values)
+        self.assertGreater(len(cached_keys), 0)
+
+        labels, values, is_complete = self._get_data_by_windows(
+            metric_service,
+            {**params, "user_projects": ["project-a1b2c3d4e5f6"]},
+            {"chunk-a": {"metric_query": {"cloud-svc-a": {}}}},
+        )
+
+        # The windows of the first caller are not served to the second one
+        self.assertEqual(get_metric_data.call_count, 2)
+        self.assertEqual(list(values.keys()), ["cloud-svc-a"])
+        self.assertEqual(len(self.fake_cache.values), len(cached_keys) * 2)
+
+    def test_get_last_timestamp(self, *args):
+        self.assertEqual(
+            MetricService._get_last_timestamp(
+                {"last_timestamp": "2023-01-01T00:00:00.000Z"}
+            ),
+            1672531200.0,
+        )
+        self.assertEqual(
+            MetricService._get_last_timestamp({"last_timestamp": 1672531200}),
+            1672531200.0,
+        )
+        self.assertIsNone(MetricService._get_last_timestamp({}))
+
+    def test_get_last_timestamp_with_invalid_value(self, *args):
+        for last_timestamp in ["yesterday", True, {"seconds": 1672531200}]:
+            with self.assertRaises(ERROR_INVALID_PARAMETER) as context:
+                MetricService._get_last_timestamp({"last_timestamp": last_timestamp})
+
+            self.assertIn("epoch seconds", context.exception.message)
+
+    def test_generate_metric_data(self, *args):
+        metric_service = MetricService()
+        params = self._make_params()
+
+        def _get_metric_data(endpoint, chunk_params):
+            if "cloud-svc-b" in chunk_params["metric_query"]:
+                raise Exception("plugin error")
+
+            return {"labels": ["a", "b"], "values": {"cloud-svc-a": [1, 2]}}
+
+        metric_service.ds_plugin_mgr.get_metric_data.side_effect = _get_metric_data
+
+        metric_data_stream = metric_service._generate_metric_data(
+            _ENDPOINT,
+            metric_service.set_metric_data_params(params),
+            {
+                "chunk-a": {"metric_query": {"cloud-svc-a": {}}},
+                "chunk-b": {"metric_query": {"cloud-svc-b": {}}},
+            },
+            params,
+        )
+
+        # Chunks are fetched while the stream is read
+        metric_service.ds_plugin_mgr.get_metric_data.assert_not_called()
+        self.assertEqual(
+            next(metric_data_stream),
+            {
+                "labels": ["a", "b"],
+                "values": {"cloud-svc-a": [1, 2]},
+                "domain_id": params["domain_id"],
+            },
+        )
+
+        # The failed chunk is reported after the other chunks
+        with self.assertRaises(ERROR_INCOMPLETE_METRIC_DATA):
+            next(metric_data_stream)
+
+    def _list_metric_data(self, metric_service, chunk_count: int) -> list:
+        resources_chunks = {
+            f"chunk-{i}": {"metric_query": {f"cloud-svc-{i}": {}}}
+            for i in range(chunk_count)
+        }
+
+        return list(
+            metric_service._list_metric_data(
+                _ENDPOINT,
+                metric_service.set_metric_data_params(self._make_params()),
+                resources_chunks,
+            )
+        )
+
+    def test_list_metric_data_with_max_workers(self, *args):
+        config.set_global_force(METRIC_DATA_MAX_WORKERS=2)
+        self.addCleanup(config.set_global_force, METRIC_DATA_MAX_WORKERS=10)
+
+        metric_service = MetricService()
+        lock = threading.Lock()
+        running = []
+        max_running = []
+
+        def _get_metric_data(endpoint, chunk_params):
+            with lock:
+                running.append(chunk_params)
+                max_running.append(len(running))
+
+            time.sleep(0.05)
+
+            with lock:
+                running.remove(chunk_params)
+
+            return {"labels": [], "values": chunk_params["metric_query"]}
+
+        metric_service.ds_plugin_mgr.get_metric_data.side_effect = _get_metric_data
+
+        self.assertEqual(len(self._list_metric_data(metric_service, 6)), 6)
+        self.assertEqual(max(max_running), 2)
+
+    def test_list_metric_data_with_timeout(self, *args):
+        config.set_global_force(METRIC_DATA_TIMEOUT=0.2)
+        self.addCleanup(config.set_global_force, METRIC_DATA_TIMEOUT=30)
+
+        metric_service = MetricService()
+
+        def _get_metric_data(endpoint, chunk_params):
+            if "cloud-svc-0" in chunk_params["metric_query"]:
+                time.sleep(1)
+
+            return {"labels": [], "values": chunk_params["metric_query"]}
+
+        metric_service.ds_plugin_mgr.get_metric_data.side_effect = _get_metric_data
+
+        started_at = time.monotonic()
+        metric_data_responses = self._list_metric_data(metric_service, 3)
+
+        # The slow chunk is not waited for, and is yielded as None
+        self.assertLess(time.monotonic() - started_at, 0.9)
+        self.assertEqual(len(metric_data_responses), 3)
+        self.assertEqual(metric_data_responses[-1], None)
+
+    def test_list_metric_data_without_available_worker(self, *args):
+        config.set_global_force(METRIC_DATA_TIMEOUT=0.2)
+        self.addCleanup(config.set_global_force, METRIC_DATA_TIMEOUT=30)
+
+        metric_service = MetricService()
+        semaphore = threading.BoundedSemaphore(1)
+        semaphore_patcher = patch(
+            "spaceone.monitoring.service.metric_service._METRIC_DATA_SEMAPHORE",
+            semaphore,
+        )
+        semaphore_patcher.start()
+        self.addCleanup(semaphore_patcher.stop)
+
+        # Other requests hold all workers of the process
+        semaphore.acquire()
+        self.addCleanup(semaphore.release)
+
+        self.assertEqual(self._list_metric_data(metric_service, 2), [None, None])
+        metric_service.ds_plugin_mgr.get_metric_data.assert_not_called()
+
+    def test_get_data_by_windows_with_failed_chunk(self, *args):
+        metric_service = MetricService()
+        get_metric_data = metric_service.ds_plugin_mgr.get_metric_data
+        get_metric_data.side_effect = Exception("plugin error")
+        params = self._make_params()
+
+        labels, values, is_complete = self._get_data_by_windows(
+            metric_service, params
+        )
+
+        # Incomplete windows are not cached
+        self.assertFalse(is_complete)
+        self.assertEqual(self.fake_cache.values, {})
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)